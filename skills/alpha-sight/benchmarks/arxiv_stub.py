@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Local arXiv API Stub
+Serves a synthetic Atom corpus over HTTP so crawler benchmarks run offline
+"""
+
+import hashlib
+import random
+import re
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+from xml.sax.saxutils import escape
+
+# Make the skill scripts importable from benchmarks
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+FIRST_NAMES = ["Wei", "Yann", "Jian", "Maria", "Anna", "Kai", "Li", "Sara", "Tom", "Ivan",
+               "Chen", "Omar", "Lucas", "Mei", "Raj", "Elena", "Hugo", "Yuki", "Amir", "Zoe"]
+LAST_NAMES = ["Zhang", "LeCun", "Wang", "Garcia", "Müller", "Li", "Smith", "Kim", "Chen", "Ivanov",
+              "Liu", "Hassan", "Silva", "Sun", "Patel", "Rossi", "Dubois", "Sato", "Karimi", "Brown"]
+
+
+def synthetic_papers(categories: List[str], per_category: int = 120, days: int = 2,
+                     cross_list_rate: float = 0.5, seed: int = 7) -> List[Dict]:
+    """
+    Build a deterministic corpus of papers spread over the given categories
+
+    Args:
+        categories: Category names used as primary and cross-list categories
+        per_category: Number of papers whose primary category is each category
+        days: Number of days (ending now) the submissions are spread over
+        cross_list_rate: Probability that a paper is cross-listed to other categories
+        seed: Random seed
+
+    Returns:
+        List of paper dicts sorted by published date, newest first
+    """
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    papers = []
+    serial = 0
+    for primary in categories:
+        for _ in range(per_category):
+            serial += 1
+            cats = [primary]
+            others = [c for c in categories if c != primary]
+            if others and rng.random() < cross_list_rate:
+                cats += rng.sample(others, rng.randint(1, min(3, len(others))))
+            published = now - timedelta(seconds=rng.randint(0, days * 86400 - 1))
+            papers.append({
+                "id": f"2510.{serial:05d}",
+                "title": f"Synthetic study {serial} on {primary}",
+                "summary": " ".join(["Lorem ipsum dolor sit amet."] * 30),
+                "published": published,
+                "authors": [f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+                            for _ in range(rng.randint(2, 8))],
+                "primary_category": primary,
+                "categories": cats,
+            })
+    papers.sort(key=lambda p: p["published"], reverse=True)
+    return papers
+
+
+def render_entry(paper: Dict) -> str:
+    """Render one paper as an Atom <entry>"""
+    stamp = paper["published"].strftime("%Y-%m-%dT%H:%M:%SZ")
+    authors = "".join(f"<author><name>{escape(a)}</name></author>" for a in paper["authors"])
+    cats = "".join(f'<category term="{c}" scheme="http://arxiv.org/schemas/atom"/>'
+                   for c in paper["categories"])
+    return (
+        f"<entry><id>http://arxiv.org/abs/{paper['id']}v1</id>"
+        f"<updated>{stamp}</updated><published>{stamp}</published>"
+        f"<title>{escape(paper['title'])}</title><summary>{escape(paper['summary'])}</summary>"
+        f"{authors}"
+        f'<link href="http://arxiv.org/abs/{paper["id"]}v1" rel="alternate" type="text/html"/>'
+        f'<link title="pdf" href="http://arxiv.org/pdf/{paper["id"]}v1" rel="related" type="application/pdf"/>'
+        f'<arxiv:primary_category term="{paper["primary_category"]}" scheme="http://arxiv.org/schemas/atom"/>'
+        f"{cats}</entry>"
+    )
+
+
+def render_feed(papers: List[Dict], total: int, start: int) -> bytes:
+    """Render a page of papers as an arXiv API Atom feed"""
+    entries = "".join(render_entry(p) for p in papers)
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<feed xmlns="http://www.w3.org/2005/Atom" '
+        'xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/" '
+        'xmlns:arxiv="http://arxiv.org/schemas/atom">'
+        f"<title>arXiv Query</title><id>http://arxiv.org/api/stub</id>"
+        f"<updated>{datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')}</updated>"
+        f"<opensearch:totalResults>{total}</opensearch:totalResults>"
+        f"<opensearch:startIndex>{start}</opensearch:startIndex>"
+        f"<opensearch:itemsPerPage>{len(papers)}</opensearch:itemsPerPage>"
+        f"{entries}</feed>"
+    ).encode("utf-8")
+
+
+def render_rss(papers: List[Dict], category: str, built: datetime) -> bytes:
+    """Render a category's papers as an arXiv RSS feed built at `built`"""
+    items = "".join(
+        f"<item><title>{escape(p['title'])}</title><link>http://arxiv.org/abs/{p['id']}</link>"
+        f"<description>{escape(p['summary'])}</description></item>"
+        for p in papers if category in p["categories"])
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        f"<title>{category} updates on arXiv.org</title><link>http://rss.arxiv.org/rss/{category}</link>"
+        f"<lastBuildDate>{format_datetime(built)}</lastBuildDate>"
+        f"{items}</channel></rss>"
+    ).encode("utf-8")
+
+
+class StubArxivServer:
+    """Threaded HTTP server answering /api/query, /rss/ and /pdf/ from a synthetic corpus"""
+
+    def __init__(self, papers: List[Dict], latency: float = 0.2, pdf_size: int = 64 * 1024):
+        """
+        Initialize stub server
+
+        Args:
+            papers: Corpus returned by synthetic_papers()
+            latency: Seconds each response is delayed, to mimic the real API
+            pdf_size: Size in bytes of the placeholder served under /pdf/
+        """
+        self.papers = papers
+        self.latency = latency
+        self.pdf_body = b"%PDF-1.4\n" + b"0" * max(0, pdf_size - 9)
+        self.feed_built = datetime.now(timezone.utc).replace(microsecond=0)  # RSS lastBuildDate
+        self.requests = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def rss_url_format(self) -> str:
+        """Drop-in replacement for the crawler's ARXIV_RSS_URL"""
+        return self.base_url + "/rss/{category}"
+
+    @property
+    def query_url_format(self) -> str:
+        """Drop-in replacement for arxiv.Client.query_url_format"""
+        return self.base_url + "/api/query?{}"
+
+    def select(self, params: Dict[str, List[str]]) -> List[Dict]:
+        """Return the papers matching a parsed API query"""
+        id_list = params.get("id_list", [""])[0]
+        if id_list:
+            wanted = {i.split("v")[0] for i in id_list.split(",")}
+            return [p for p in self.papers if p["id"] in wanted]
+        query = params.get("search_query", [""])[0]
+        papers = self.papers
+        window = re.search(r"submittedDate:\[(\d{8,12}) TO (\d{8,12})\]", query)
+        if window:
+            start, end = window.group(1).ljust(12, "0"), window.group(2).ljust(12, "9")
+            papers = [p for p in papers if start <= p["published"].strftime("%Y%m%d%H%M") <= end]
+        cats = set(re.findall(r"cat:([\w.\-]+)", query))
+        if not cats:
+            return papers
+        return [p for p in papers if cats.intersection(p["categories"])]
+
+    def handle_query(self, params: Dict[str, List[str]]) -> bytes:
+        matched = self.select(params)
+        start = int(params.get("start", ["0"])[0])
+        size = int(params.get("max_results", ["10"])[0])
+        return render_feed(matched[start:start + size], len(matched), start)
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                headers = {}
+                if url.path == "/api/query":
+                    content_type = "application/atom+xml"
+                elif url.path.startswith("/rss/"):
+                    content_type = "application/rss+xml"
+                elif url.path.startswith("/pdf/"):
+                    content_type = "application/pdf"
+                else:
+                    self.send_error(404)
+                    return
+                time.sleep(stub.latency)
+                status = 200
+                if content_type == "application/pdf":
+                    body = stub.pdf_body
+                elif content_type == "application/rss+xml":
+                    body = render_rss(stub.papers, url.path[len("/rss/"):], stub.feed_built)
+                    headers["ETag"] = '"' + hashlib.sha1(body).hexdigest() + '"'
+                    if self.headers.get("If-None-Match") == headers["ETag"]:
+                        status, body = 304, b""
+                else:
+                    body = stub.handle_query(parse_qs(url.query))
+                with stub._lock:
+                    stub.requests += 1
+                    stub.bytes_sent += len(body)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: full ElementTree parse vs streaming iterparse
+Parses a 2000-entry fixture feed and reports parse time and peak RSS
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from arxiv_stub import render_feed, synthetic_papers
+from atom_parser import iter_entries
+
+
+def parse_tree(path):
+    """Previous behaviour: read the whole body, build the tree, find() per field"""
+    with open(path, 'rb') as f:
+        content = f.read()
+    root = ET.fromstring(content)
+    ns = {'atom': 'http://www.w3.org/2005/Atom'}
+    papers = []
+    for entry in root.findall('atom:entry', ns):
+        papers.append({
+            'id': entry.find('atom:id', ns).text,
+            'title': entry.find('atom:title', ns).text.strip(),
+            'abstract': entry.find('atom:summary', ns).text.strip(),
+            'published': entry.find('atom:published', ns).text,
+            'authors': [a.find('atom:name', ns).text for a in entry.findall('atom:author', ns)],
+            'categories': [c.get('term') for c in entry.findall('atom:category', ns)],
+        })
+    return len(papers)
+
+
+def parse_stream(path):
+    """Streaming parser consuming the file like a response body"""
+    count = 0
+    with open(path, 'rb') as f:
+        for _ in iter_entries(f):
+            count += 1
+    return count
+
+
+def worker(mode, path):
+    """Run one parser in a fresh process and print its measurements as JSON"""
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    began = time.perf_counter()
+    entries = {"tree": parse_tree, "stream": parse_stream, "noop": lambda p: 0}[mode](path)
+    elapsed = time.perf_counter() - began
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"entries": entries, "seconds": elapsed, "peak_kb": peak, "baseline_kb": baseline}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the streaming Atom parser")
+    parser.add_argument("--entries", type=int, default=2000, help="Entries in the fixture feed")
+    parser.add_argument("--worker", nargs=2, metavar=("MODE", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        worker(*args.worker)
+        return
+
+    papers = synthetic_papers(["cs.AI", "cs.LG", "cs.CL", "cs.CV"], per_category=args.entries // 4)
+    with tempfile.TemporaryDirectory() as tmp:
+        fixture = Path(tmp) / "feed.xml"
+        fixture.write_bytes(render_feed(papers, len(papers), 0))
+        size_mb = fixture.stat().st_size / 1e6
+
+        rows = {}
+        for mode in ("noop", "tree", "stream"):
+            out = subprocess.run([sys.executable, __file__, "--worker", mode, str(fixture)],
+                                 capture_output=True, text=True, check=True).stdout
+            rows[mode] = json.loads(out)
+
+    base = rows["noop"]["peak_kb"]
+    print(f"Fixture: {len(papers)} entries, {size_mb:.1f} MB")
+    print(f"{'parser':<12}{'entries':>9}{'time (ms)':>11}{'peak RSS (MB)':>15}{'over baseline':>15}")
+    for mode in ("tree", "stream"):
+        row = rows[mode]
+        print(f"{mode:<12}{row['entries']:>9}{row['seconds'] * 1000:>11.1f}"
+              f"{row['peak_kb'] / 1024:>15.1f}{(row['peak_kb'] - base) / 1024:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: title-cased set lookup vs the prebuilt AuthorIndex
+Matches 100k synthetic author lists and reports time and hit counts
+"""
+
+import argparse
+import random
+import time
+
+import arxiv_stub  # noqa: F401  (puts scripts/ on sys.path)
+from author_index import AuthorIndex
+
+GIVEN = ["Wei", "Yann", "José", "Zoë", "Jian", "Maria", "Kai", "Sara", "Jean-Pierre", "Yuki",
+         "Omar", "Lucas", "Mei", "Raj", "Elena", "Hugo", "Amir", "Anna", "Ivan", "Chen"]
+FAMILY = ["Zhang", "LeCun", "Hernández", "Müller", "Wang", "García", "Kim", "Chen", "Sato", "Smith",
+          "Li", "Patel", "Rossi", "Dubois", "Karimi", "Brown", "Liu", "Ivanov", "Silva", "Sun"]
+CJK = ["张伟", "王芳", "李娜", "刘洋", "陈静", "杨磊", "赵敏", "黄勇"]
+
+
+def spelling_variant(rng, given, family):
+    """Write a name the way it might appear on an arXiv listing"""
+    roll = rng.random()
+    if roll < 0.6:
+        return f"{given} {family}"
+    if roll < 0.75:
+        return f"{given[0]}. {family}"
+    if roll < 0.85:
+        return f"{family} {given}"
+    if roll < 0.95:
+        stripped = family.translate(str.maketrans("áéíóúüëç", "aeiouuec"))
+        return f"{given} {stripped}"
+    return f"{given} {family}".upper()
+
+
+def legacy_match(signal_set, names):
+    """Previous behaviour: title-case every author, exact set lookup"""
+    authors = [n.strip().title() for n in names]
+    return [a for a in authors if a in signal_set]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the signal author matcher")
+    parser.add_argument("--papers", type=int, default=100_000, help="Number of author lists")
+    parser.add_argument("--signal", type=int, default=60, help="Number of signal authors")
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    pairs = [(g, f) for g in GIVEN for f in FAMILY]
+    signal_pairs = rng.sample(pairs, min(args.signal, len(pairs)))
+    signal_names = [f"{g} {f}" for g, f in signal_pairs] + CJK[:4]
+
+    lists = []
+    for _ in range(args.papers):
+        names = []
+        for _ in range(rng.randint(2, 10)):
+            if rng.random() < 0.05:
+                names.append(rng.choice(CJK))
+            else:
+                names.append(spelling_variant(rng, *rng.choice(pairs)))
+        lists.append(names)
+
+    began = time.perf_counter()
+    index = AuthorIndex.from_names(signal_names)
+    build_time = time.perf_counter() - began
+
+    signal_set = {n.strip().title() for n in signal_names}
+    began = time.perf_counter()
+    legacy_hits = sum(1 for names in lists if legacy_match(signal_set, names))
+    legacy_time = time.perf_counter() - began
+
+    began = time.perf_counter()
+    index_hits = sum(1 for names in lists if index.match(names))
+    index_time = time.perf_counter() - began
+
+    authors = sum(len(names) for names in lists)
+    print(f"{args.papers} author lists, {authors} author names, {len(signal_names)} signal authors")
+    print(f"Index build: {build_time * 1000:.1f} ms, {len(index.keys)} keys")
+    print(f"{'matcher':<18}{'papers matched':>16}{'time (s)':>10}{'ns/author':>11}")
+    print(f"{'title() + set':<18}{legacy_hits:>16}{legacy_time:>10.3f}{legacy_time / authors * 1e9:>11.0f}")
+    print(f"{'AuthorIndex':<18}{index_hits:>16}{index_time:>10.3f}{index_time / authors * 1e9:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: per-paper report_generator.py runs vs bulk_reports.py
+Regenerates every report of a synthetic index, then reruns with nothing changed
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from bench_index_backend import synthetic_index
+from arxiv_stub import SCRIPTS_DIR
+from bulk_reports import BulkReportGenerator
+from index_manager import IndexManager
+
+DATES = re.compile(r"\d{4}-\d{2}-\d{2}(T[\d:.]+Z?)?")
+
+
+def shell_loop(papers, inputs_dir, output_dir, skill_path):
+    """Previous workflow: one report_generator.py process per paper"""
+    for paper in papers:
+        arxiv_id = paper["arxiv_id"]
+        subprocess.run([sys.executable, str(SCRIPTS_DIR / "report_generator.py"), arxiv_id,
+                        "--metadata", str(inputs_dir / f"{arxiv_id}_metadata.json"),
+                        "--analysis", str(inputs_dir / f"{arxiv_id}_analysis.json"),
+                        "--reproduction", str(inputs_dir / f"{arxiv_id}_reproduction.json"),
+                        "--output", str(output_dir / f"{arxiv_id}_analysis.md"),
+                        "--skill-path", str(skill_path)],
+                       check=True, stdout=subprocess.DEVNULL)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bulk report generation")
+    parser.add_argument("--papers", type=int, default=2000, help="Papers in the index")
+    parser.add_argument("--shell-sample", type=int, default=50,
+                        help="Papers run through the per-process loop (extrapolated to --papers)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Bulk rendering processes")
+    args = parser.parse_args()
+
+    papers = synthetic_index(args.papers)
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        skill_path = tmp / "skill"
+        shutil.copytree(SCRIPTS_DIR.parent / "assets", skill_path / "assets")
+
+        index = IndexManager(tmp / "index.json")
+        with contextlib.redirect_stdout(io.StringIO()), index.batch():
+            for paper in papers:
+                index.add_paper(paper)
+
+        inputs_dir = tmp / "inputs"
+        inputs_dir.mkdir()
+        for paper in papers[:args.shell_sample]:
+            for kind, data in (("metadata", paper), ("analysis", paper["analysis"]),
+                               ("reproduction", paper["reproduction"])):
+                with open(inputs_dir / f"{paper['arxiv_id']}_{kind}.json", 'w', encoding='utf-8') as f:
+                    json.dump(data, f)
+
+        print(f"{args.papers} papers, {args.workers} workers")
+        print(f"{'run':<34}{'written':>9}{'skipped':>9}{'time (s)':>10}")
+
+        began = time.perf_counter()
+        shell_loop(papers[:args.shell_sample], inputs_dir, tmp / "shell", skill_path)
+        elapsed = (time.perf_counter() - began) * args.papers / args.shell_sample
+        print(f"{'shell loop (extrapolated)':<34}{args.papers:>9}{0:>9}{elapsed:>10.2f}")
+
+        arxiv_ids = [p["arxiv_id"] for p in papers]
+        runs = [("bulk, 1 process", 1, tmp / "serial", False),
+                (f"bulk, {args.workers} processes", args.workers, tmp / "reports", False),
+                ("bulk rerun, nothing changed", args.workers, tmp / "reports", False),
+                ("bulk after 10 index updates", args.workers, tmp / "reports", "update"),
+                ("bulk after a template edit", args.workers, tmp / "reports", "template")]
+        for label, workers, output_dir, change in runs:
+            if change == "update":
+                with contextlib.redirect_stdout(io.StringIO()), index.batch():
+                    for paper in papers[:10]:
+                        index.update_paper(paper["arxiv_id"], {"reproduction": {"status": "completed"}})
+            elif change == "template":
+                with open(skill_path / "assets" / "report_template_en.md", 'a', encoding='utf-8') as f:
+                    f.write("\n<!-- revised -->\n")
+            bulk = BulkReportGenerator(index_path=tmp / "index.json", output_dir=output_dir,
+                                       skill_path=skill_path, workers=workers)
+            began = time.perf_counter()
+            stats = bulk.generate(arxiv_ids)
+            elapsed = time.perf_counter() - began
+            print(f"{label:<34}{stats['written']:>9}{stats['skipped']:>9}{elapsed:>10.2f}")
+
+        # Reports embed their generation date and time; compare everything else
+        same = all(
+            DATES.sub("", (tmp / "shell" / f"{p['arxiv_id']}_analysis.md").read_text(encoding='utf-8'))
+            == DATES.sub("", (tmp / "serial" / f"{p['arxiv_id']}_analysis.md").read_text(encoding='utf-8'))
+            for p in papers[:args.shell_sample])
+        print(f"Bulk reports match per-paper reports (apart from dates): {same}")
+
+
+if __name__ == "__main__":
+    main()
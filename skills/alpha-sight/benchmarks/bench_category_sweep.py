@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: per-category queries vs a single OR-query sweep
+Counts API pages and bytes each mode pulls from a local Atom stub
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import arxiv
+
+from arxiv_stub import StubArxivServer, synthetic_papers
+from author_index import AuthorIndex
+import get_arxiv_latest_v1114 as crawler
+
+
+def run_mode(stub, mode, signal_authors, start_date, end_date):
+    """Run get_latest_papers in one mode and return (pages, bytes, papers, matched, seconds)"""
+    requests_before, bytes_before = stub.requests, stub.bytes_sent
+    began = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        _, total, matched, _, _ = crawler.get_latest_papers(
+            signal_authors, start_date, end_date, mode=mode, rate=1000
+        )
+    elapsed = time.perf_counter() - began
+    return stub.requests - requests_before, stub.bytes_sent - bytes_before, total, matched, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the OR-query category sweep")
+    parser.add_argument("--per-category", type=int, default=150, help="Papers per primary category")
+    parser.add_argument("--cross-list-rate", type=float, default=0.5,
+                        help="Probability that a paper is cross-listed")
+    args = parser.parse_args()
+
+    papers = synthetic_papers(crawler.CATEGORIES, per_category=args.per_category,
+                              cross_list_rate=args.cross_list_rate)
+    signal_authors = AuthorIndex.from_names(["Yann LeCun", "Wei Zhang", "Maria Garcia"])
+    end_date = datetime.now().date()
+    start_date = end_date - timedelta(days=2)
+
+    with StubArxivServer(papers, latency=0.0) as stub, tempfile.TemporaryDirectory() as tmp:
+        arxiv.Client.query_url_format = stub.query_url_format
+        cwd = os.getcwd()
+        os.chdir(tmp)
+        try:
+            rows = {mode: run_mode(stub, mode, signal_authors, start_date, end_date)
+                    for mode in ("per_category", "sweep")}
+        finally:
+            os.chdir(cwd)
+
+    print(f"Corpus: {len(papers)} papers, cross-list rate {args.cross_list_rate}")
+    print(f"{'mode':<16}{'pages':>8}{'MB':>10}{'papers':>10}{'matched':>10}{'wall (s)':>10}")
+    for mode, (pages, size, total, matched, elapsed) in rows.items():
+        print(f"{mode:<16}{pages:>8}{size / 1e6:>10.2f}{total:>10}{matched:>10}{elapsed:>10.2f}")
+
+    loop, sweep = rows["per_category"], rows["sweep"]
+    print(f"Saved: {loop[0] - sweep[0]} pages ({1 - sweep[0] / loop[0]:.0%}), "
+          f"{(loop[1] - sweep[1]) / 1e6:.2f} MB ({1 - sweep[1] / loop[1]:.0%})")
+
+
+if __name__ == "__main__":
+    main()
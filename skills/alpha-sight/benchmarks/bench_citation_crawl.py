@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: 1000-node citation-graph crawl against a quota-enforcing S2 stub
+Reports requests, throttling and time, then checks that an interrupted crawl
+resumes to the same graph
+"""
+
+import argparse
+import contextlib
+import io
+import tempfile
+import time
+
+from s2_stub import StubS2Server, synthetic_graph
+from citation_graph import CitationGraphCrawler, GraphStore
+from semantic_scholar_fetcher import SemanticScholarFetcher
+
+
+class Interrupted(BaseException):
+    """Simulated Ctrl-C raised from inside a fetch"""
+
+
+def crawler_for(stub, store, args, fail_after=None):
+    fetcher = SemanticScholarFetcher()
+    fetcher.BASE_URL = stub.base_url
+    if fail_after is not None:
+        calls = {"n": 0}
+        iter_citations = fetcher.iter_citations
+
+        def flaky(*a, **kw):
+            calls["n"] += 1
+            if calls["n"] > fail_after:
+                raise Interrupted()
+            return iter_citations(*a, **kw)
+        fetcher.iter_citations = flaky
+    return CitationGraphCrawler(fetcher, store, max_depth=args.depth, max_nodes=args.nodes,
+                                links_per_node=args.links, workers=args.workers)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the citation-graph crawler")
+    parser.add_argument("--nodes", type=int, default=1000, help="Node budget")
+    parser.add_argument("--depth", type=int, default=2, help="BFS depth")
+    parser.add_argument("--links", type=int, default=100, help="Links followed per paper and direction")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent expansions")
+    parser.add_argument("--window", type=float, default=5.0,
+                        help="Quota window in seconds (the real API uses 300; scaled down to run quickly)")
+    args = parser.parse_args()
+
+    graph = synthetic_graph(size=20000)
+    by_influence = sorted(graph.values(), key=lambda p: p["influentialCitationCount"], reverse=True)
+    seeds = [p["externalIds"]["ArXiv"] for p in by_influence[200:203]]
+    quota = SemanticScholarFetcher.QUOTA_WITHOUT_KEY
+    SemanticScholarFetcher.RATE_WINDOW = args.window
+
+    print(f"Seeds {', '.join(seeds)}; budget {args.nodes} nodes, depth {args.depth}; "
+          f"quota {quota} requests / {args.window:.0f} s")
+    with tempfile.TemporaryDirectory() as tmp, StubS2Server(graph, latency=0.05, quota=(quota, args.window)) as stub:
+        store = GraphStore(f"{tmp}/full.db")
+        crawler = crawler_for(stub, store, args)
+        began = time.perf_counter()
+        crawler.add_seeds(seeds)
+        stats = crawler.crawl()
+        elapsed = time.perf_counter() - began
+        ceiling = stub.requests / (quota / args.window)
+        print(f"Uninterrupted: {stats['nodes']} nodes, {stats['edges']} edges, {stats['expanded']} expansions, "
+              f"{stub.requests} requests, {stub.throttled} throttled, {elapsed:.1f} s "
+              f"(quota minimum {max(0.0, ceiling - args.window):.1f} s)")
+        full = store.export()
+        store.close()
+
+        # Same crawl, interrupted part-way and resumed from the store
+        store = GraphStore(f"{tmp}/resumed.db")
+        crawler = crawler_for(stub, store, args, fail_after=stats["expanded"] // 2)
+        crawler.add_seeds(seeds)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                crawler.crawl()
+        except Interrupted:
+            print(f"Interrupted at {store.node_count()} nodes")
+        requests_before = stub.requests
+        resumed_stats = crawler_for(stub, store, args).crawl()
+        print(f"Resumed: {resumed_stats['expanded']} more expansions, "
+              f"{stub.requests - requests_before} requests")
+        print(f"Resumed graph identical: {store.export() == full}")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: sequential vs concurrent category crawl
+Runs get_latest_papers against a local Atom stub and reports wall-clock time
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import arxiv
+
+from arxiv_stub import StubArxivServer, synthetic_papers
+from author_index import AuthorIndex
+import get_arxiv_latest_v1114 as crawler
+
+
+def run_sequential(signal_authors, start_date, end_date, categories, delay):
+    """Reproduce the previous behaviour: one client, fixed delay, one category at a time"""
+    client = arxiv.Client(page_size=100, delay_seconds=delay, num_retries=5)
+    state = crawler.CrawlState("sequential.spool.jsonl")
+    date_query = f"submittedDate:[{start_date.strftime('%Y%m%d')}0000 TO {end_date.strftime('%Y%m%d')}2359]"
+    for category in categories:
+        crawler.crawl_category(client, category, date_query, 0, signal_authors, state)
+    state.close()
+    return state.total_papers, state.matched_papers
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the concurrent arXiv category crawler")
+    parser.add_argument("--per-category", type=int, default=150, help="Papers per primary category")
+    parser.add_argument("--latency", type=float, default=0.3, help="Stub response latency in seconds")
+    parser.add_argument("--delay", type=float, default=0.3,
+                        help="Polite delay between requests (scaled down from arXiv's 3s)")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent workers")
+    args = parser.parse_args()
+
+    categories = crawler.CATEGORIES
+    papers = synthetic_papers(categories, per_category=args.per_category)
+    signal_authors = AuthorIndex.from_names(["Yann LeCun", "Wei Zhang", "Maria Garcia"])
+    end_date = datetime.now().date()
+    start_date = end_date - timedelta(days=2)
+
+    with StubArxivServer(papers, latency=args.latency) as stub, tempfile.TemporaryDirectory() as tmp:
+        arxiv.Client.query_url_format = stub.query_url_format
+        cwd = os.getcwd()
+        os.chdir(tmp)
+        try:
+            began = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                seq_total, seq_matched = run_sequential(signal_authors, start_date, end_date,
+                                                        categories, args.delay)
+            seq_time = time.perf_counter() - began
+            seq_requests = stub.requests
+
+            began = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                _, con_total, con_matched, _, _ = crawler.get_latest_papers(
+                    signal_authors, start_date, end_date,
+                    max_workers=args.workers, rate=1 / args.delay
+                )
+            con_time = time.perf_counter() - began
+            con_requests = stub.requests - seq_requests
+        finally:
+            os.chdir(cwd)
+
+    print(f"Corpus: {len(papers)} papers over {len(categories)} categories")
+    print(f"Stub latency {args.latency}s, polite rate 1 request / {args.delay}s")
+    print(f"{'mode':<22}{'requests':>10}{'papers':>10}{'matched':>10}{'wall (s)':>12}")
+    print(f"{'sequential':<22}{seq_requests:>10}{seq_total:>10}{seq_matched:>10}{seq_time:>12.2f}")
+    print(f"{f'concurrent x{args.workers}':<22}{con_requests:>10}{con_total:>10}{con_matched:>10}{con_time:>12.2f}")
+    print(f"Speedup: {seq_time / con_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: go/no-go decision before the daily crawl
+Runs the connection test and batch probe of repeated cron invocations against the local stub
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import arxiv
+import requests
+
+from arxiv_stub import StubArxivServer, synthetic_papers
+import get_arxiv_latest_v1114 as crawler
+from rate_limiter import TokenBucket
+
+
+def previous_decision(stub, start_date, end_date):
+    """Previous behaviour: ping, a 3-day test query and a 5-result probe, each on a new client"""
+    requests.get(stub.base_url + "/api/query", params={"search_query": "all:ai", "max_results": 1}, timeout=20)
+    test_query = (f"cat:cs.AI AND submittedDate:[{(end_date - timedelta(days=3)).strftime('%Y%m%d')}0000 "
+                  f"TO {end_date.strftime('%Y%m%d')}2359]")
+    list(arxiv.Client(page_size=5, delay_seconds=5, num_retries=8).results(arxiv.Search(
+        query=test_query, max_results=5, sort_by=arxiv.SortCriterion.SubmittedDate,
+        sort_order=arxiv.SortOrder.Descending)))
+    probe_query = (f"cat:cs.AI AND submittedDate:[{start_date.strftime('%Y%m%d')}0000 "
+                   f"TO {end_date.strftime('%Y%m%d')}2359]")
+    dates = [r.published.date().isoformat() for r in arxiv.Client(page_size=10, delay_seconds=3.2).results(
+        arxiv.Search(query=probe_query, max_results=5, sort_by=arxiv.SortCriterion.SubmittedDate,
+                     sort_order=arxiv.SortOrder.Descending))]
+    return crawler.should_proceed_today(dates, start_date)
+
+
+def probe_decision(cache_path, start_date):
+    """One cron invocation: connection test and batch probe through a shared FreshnessProbe"""
+    probe = crawler.create_probe(TokenBucket(crawler.ARXIV_REQUEST_RATE), path=cache_path)
+    if not crawler.test_arxiv_connection(probe):
+        return None
+    return crawler.should_proceed_today(crawler.probe_api_batch_top_dates(start_date, probe=probe), start_date)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the daily freshness probe")
+    parser.add_argument("--latency", type=float, default=0.3, help="Stub latency per request (s)")
+    args = parser.parse_args()
+
+    papers = synthetic_papers(["cs.AI", "cs.LG"], per_category=300)
+    today = datetime.now().date()
+    with StubArxivServer(papers, latency=args.latency) as stub, tempfile.TemporaryDirectory() as tmp:
+        arxiv.Client.query_url_format = stub.query_url_format
+        crawler.ARXIV_RSS_URL = stub.rss_url_format
+        cache_path = Path(tmp) / crawler.PROBE_CACHE_FILE
+        print(f"stub latency {args.latency * 1000:.0f} ms")
+        print(f"{'invocation':<40}{'requests':>9}{'time (ms)':>11}  verdict")
+
+        def run(label, decide):
+            before = stub.requests
+            began = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                verdict = decide()
+            elapsed = time.perf_counter() - began
+            print(f"{label:<40}{stub.requests - before:>9}{elapsed * 1000:>11.0f}  "
+                  f"{'crawl' if verdict else 'skip'}")
+
+        # arXiv has announced today's batch: expect papers from yesterday on
+        start_date = today - timedelta(days=1)
+        run("previous (every invocation)", lambda: previous_decision(stub, start_date, today))
+        run("probe, first run of the day", lambda: probe_decision(cache_path, start_date))
+        run("probe, repeat run", lambda: probe_decision(cache_path, start_date))
+        run("probe, repeat run", lambda: probe_decision(cache_path, start_date))
+
+        # Not announced yet: the newest submission is older than the floor
+        cache_path.unlink()
+        start_date = today + timedelta(days=1)
+        run("previous, not yet announced", lambda: previous_decision(stub, start_date, start_date))
+        run("probe, first run, not yet announced", lambda: probe_decision(cache_path, start_date))
+        run("probe, repeat run, RSS unchanged (304)", lambda: probe_decision(cache_path, start_date))
+        stub.feed_built += timedelta(hours=1)
+        run("probe, repeat run, RSS rebuilt", lambda: probe_decision(cache_path, start_date))
+
+        # A new UTC day invalidates the verdict
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        state['day'] = (datetime.fromisoformat(state['day']) - timedelta(days=1)).date().isoformat()
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        start_date = today - timedelta(days=1)
+        run("probe, first run of the next day", lambda: probe_decision(cache_path, start_date))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: repeated enrichment runs through the shared CachedSession
+Runs the same arXiv + Semantic Scholar lookups cold, after expiry and offline
+"""
+
+import argparse
+import contextlib
+import io
+import tempfile
+import time
+
+from arxiv_stub import StubArxivServer, synthetic_papers
+from s2_stub import StubS2Server, synthetic_graph
+from arxiv_fetcher import ArxivFetcher
+from http_cache import CachedSession
+from semantic_scholar_fetcher import SemanticScholarFetcher
+
+
+def pipeline(arxiv, s2, arxiv_ids, s2_ids):
+    """One analysis pass: arXiv metadata, an arXiv search and S2 citation data"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        # id_list lookups bypass the HTTP cache; the metadata store answers repeats
+        metadata = arxiv.fetch_metadata_many(arxiv_ids)
+        search = arxiv.search_papers("transformers", max_results=50)
+        s2._papers.clear()
+        papers, _ = s2.fetch_many(s2_ids)
+    return len(metadata), len(search), len(papers)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the shared HTTP response cache")
+    parser.add_argument("--papers", type=int, default=200, help="Papers looked up per service")
+    args = parser.parse_args()
+
+    corpus = synthetic_papers(["cs.AI", "cs.LG"], per_category=args.papers)
+    graph = synthetic_graph(size=2000)
+    arxiv_ids = [p["id"] for p in corpus[:args.papers]]
+    s2_ids = [p["externalIds"]["ArXiv"] for p in list(graph.values())[:args.papers]]
+
+    SemanticScholarFetcher.RATE_WINDOW = 1  # The stubs enforce no quota
+    with tempfile.TemporaryDirectory() as tmp:
+        arxiv_stub = StubArxivServer(corpus, latency=0.1).__enter__()
+        s2_stub = StubS2Server(graph, latency=0.1).__enter__()
+        session = CachedSession(cache_dir=f"{tmp}/http", ttls={
+            arxiv_stub.base_url: 3600,
+            s2_stub.base_url: 3600,
+        })
+        arxiv = ArxivFetcher(output_dir=f"{tmp}/papers", session=session)
+        arxiv.BASE_API_URL = arxiv_stub.base_url + "/api/query"
+        arxiv.REQUEST_DELAY = 0
+        s2 = SemanticScholarFetcher(session=session)
+        s2.BASE_URL = s2_stub.base_url
+
+        print(f"{'run':<26}{'hits':>6}{'misses':>8}{'304s':>6}{'requests':>10}{'KB sent':>9}{'time (s)':>10}")
+
+        def run(label):
+            before = session.stats()
+            sent = arxiv_stub.requests + s2_stub.requests, arxiv_stub.bytes_sent + s2_stub.bytes_sent
+            began = time.perf_counter()
+            counts = pipeline(arxiv, s2, arxiv_ids, s2_ids)
+            elapsed = time.perf_counter() - began
+            after = session.stats()
+            requests = arxiv_stub.requests + s2_stub.requests - sent[0]
+            kb = (arxiv_stub.bytes_sent + s2_stub.bytes_sent - sent[1]) / 1e3
+            print(f"{label:<26}{after['hits'] - before['hits']:>6}{after['misses'] - before['misses']:>8}"
+                  f"{after['revalidated'] - before['revalidated']:>6}{requests:>10}{kb:>9.0f}{elapsed:>10.2f}")
+            return counts
+
+        cold = run("cold cache")
+        warm = run("warm cache")
+
+        # Expire everything: S2 answers 304 to the stored ETags, arXiv re-sends
+        session.ttls = {url: 1e-9 for url in session.ttls}
+        expired = run("expired (revalidate)")
+
+        # Fresh again, with both services unreachable
+        session.ttls = {url: 3600 for url in session.ttls}
+        arxiv_stub.__exit__(None, None, None)
+        s2_stub.__exit__(None, None, None)
+        offline = run("warm cache, offline")
+
+    print(f"Results identical across runs: {cold == warm == expired == offline} "
+          f"({cold[0]} metadata, {cold[1]} search hits, {cold[2]} S2 papers)")
+
+
+if __name__ == "__main__":
+    main()
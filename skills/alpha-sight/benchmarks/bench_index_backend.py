@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: JSON IndexManager vs SQLiteIndexManager
+Builds an index paper by paper, then times the read paths
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import arxiv_stub  # noqa: F401  (puts scripts/ on sys.path)
+from index_manager import IndexManager
+from index_store import SQLiteIndexManager
+
+TAGS = ["MoE", "Transformer", "RL", "Diffusion", "LLM", "Vision", "Agents", "Optimization"]
+CATEGORIES = ["cs.LG", "cs.AI", "cs.CL", "cs.CV", "stat.ML", "cs.RO"]
+STATUSES = ["not_started", "completed", "failed", "partial", "in_progress"]
+
+
+def synthetic_index(n, seed=13):
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    papers = []
+    for i in range(n):
+        arxiv_id = f"24{i // 10000:02d}.{i % 10000:05d}"
+        papers.append({
+            "arxiv_id": arxiv_id,
+            "title": f"Synthetic paper {i}",
+            "authors": ["Author A", "Author B"],
+            "published_date": (start + timedelta(days=i % 365)).strftime("%Y-%m-%d"),
+            "analyzed_date": (start + timedelta(minutes=rng.randint(0, 500000))).isoformat() + "Z",
+            "categories": rng.sample(CATEGORIES, rng.randint(1, 3)),
+            "abstract": "Lorem ipsum dolor sit amet. " * 20,
+            "analysis": {"depth": "medium", "language": "english",
+                         "relevance_score": round(rng.uniform(0, 10), 1),
+                         "report_path": f"./reports/{arxiv_id}_analysis.md",
+                         "pdf_path": f"./papers/{arxiv_id}.pdf"},
+            "reproduction": {"status": rng.choice(STATUSES), "method": "none", "repo_url": None,
+                             "sandbox_path": None, "iterations": 0, "success_rate": 0.0, "notes": ""},
+            "citations": {"cited_by_count": 0, "references_count": 0, "related_papers": []},
+            "tags": rng.sample(TAGS, rng.randint(1, 3)),
+            "project_impact": {"applicable": True, "suggestions": []},
+        })
+    return papers
+
+
+def measure(manager, papers, lookups, batched=False):
+    timings = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        began = time.perf_counter()
+        with manager.batch() if batched else contextlib.nullcontext():
+            for paper in papers:
+                manager.add_paper(paper)
+        timings["build"] = time.perf_counter() - began
+
+        began = time.perf_counter()
+        for arxiv_id in lookups:
+            manager.get_paper(arxiv_id)
+        timings["get x100"] = time.perf_counter() - began
+
+        began = time.perf_counter()
+        for arxiv_id in lookups[:10]:
+            manager.update_paper(arxiv_id, {"reproduction": {"status": "completed"}})
+        timings["update x10"] = time.perf_counter() - began
+
+        began = time.perf_counter()
+        top = manager.list_papers(sort_by='relevance', limit=10)
+        tagged = manager.search_by_tag("MoE")
+        stats = manager.get_statistics()
+        timings["queries"] = time.perf_counter() - began
+    return timings, (top, tagged, stats)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the index backends")
+    parser.add_argument("--papers", type=int, default=1000,
+                        help="Papers added to both backends (the JSON build is quadratic)")
+    parser.add_argument("--sqlite-papers", type=int, default=10000, help="Papers for the SQLite-only run")
+    args = parser.parse_args()
+
+    print(f"{'backend':<18}{'papers':>8}{'build (s)':>11}{'get x100 (ms)':>15}{'update x10 (ms)':>17}{'queries (ms)':>14}")
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        runs = [("JSON", IndexManager, args.papers, "index.json", False),
+                ("JSON batch()", IndexManager, args.papers, "index_batch.json", True),
+                ("SQLite", SQLiteIndexManager, args.papers, "index.db", False),
+                ("SQLite", SQLiteIndexManager, args.sqlite_papers, "index_large.db", False)]
+        writes = {}
+        for label, cls, n, name, batched in runs:
+            papers = synthetic_index(n)
+            lookups = [p["arxiv_id"] for p in random.Random(1).sample(papers, 100)]
+            manager = cls(f"{tmp}/{name}")
+            if cls is IndexManager:
+                # Count journal appends and whole-file rewrites of index.json
+                writes[label] = {"_append_journal": 0, "_write_index": 0}
+                for method in writes[label]:
+                    def counted(*args, label=label, method=method, original=getattr(manager, method)):
+                        writes[label][method] += 1
+                        return original(*args)
+                    setattr(manager, method, counted)
+            timings, results[(label, n)] = measure(manager, papers, lookups, batched)
+            print(f"{label:<18}{n:>8}{timings['build']:>11.2f}{timings['get x100'] * 1000:>15.1f}"
+                  f"{timings['update x10'] * 1000:>17.1f}{timings['queries'] * 1000:>14.1f}")
+
+        for label, count in writes.items():
+            print(f"{label}: {count['_append_journal']} journal appends, "
+                  f"{count['_write_index']} index.json rewrites")
+        print(f"Same results with and without batch(): "
+              f"{results[('JSON', args.papers)] == results[('JSON batch()', args.papers)]}")
+
+        json_run, sqlite_run = results[("JSON", args.papers)], results[("SQLite", args.papers)]
+        print(f"Same results from both backends: {json_run == sqlite_run}")
+
+        # Round trip: migrate the JSON index into SQLite and export it back
+        migrated = SQLiteIndexManager(f"{tmp}/migrated.db")
+        began = time.perf_counter()
+        added = migrated.migrate_from_json(f"{tmp}/index.json")
+        migrated.export_json(f"{tmp}/exported.json")
+        elapsed = time.perf_counter() - began
+        original = IndexManager(f"{tmp}/index.json")
+        exported = IndexManager(f"{tmp}/exported.json")
+        same = (original.list_papers(sort_by='none') == exported.list_papers(sort_by='none')
+                and original.get_statistics() == exported.get_statistics())
+        print(f"Migrated {added} papers and exported them back in {elapsed:.2f} s; round trip identical: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: concurrent writers on one index.json
+Several processes add papers at once, first with truncate-and-write saves, then with the journal
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import tempfile
+import time
+from pathlib import Path
+
+from bench_index_backend import synthetic_index
+from index_manager import IndexManager
+
+
+def naive_writer(index_path, papers):
+    """Previous behaviour: load, append, rewrite the whole file in place, no lock"""
+    for paper in papers:
+        for _ in range(1000):
+            try:
+                with open(index_path, 'r', encoding='utf-8') as f:
+                    index = json.load(f)
+                break
+            except ValueError:
+                continue  # Caught another writer mid-write
+        else:
+            return  # Interleaved writes left the file permanently corrupt
+        if any(p['arxiv_id'] == paper['arxiv_id'] for p in index['papers']):
+            continue
+        index['papers'].append(paper)
+        with open(index_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=2, ensure_ascii=False)
+
+
+def journaled_writer(index_path, papers, compact_bytes):
+    IndexManager.COMPACT_BYTES = compact_bytes
+    manager = IndexManager(index_path)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for paper in papers:
+            manager.add_paper(paper)
+            manager.update_paper(paper['arxiv_id'], {"reproduction": {"status": "completed"}})
+
+
+def run(target, index_path, shards, extra=()):
+    processes = [multiprocessing.Process(target=target, args=(index_path, shard) + tuple(extra))
+                 for shard in shards]
+    began = time.perf_counter()
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    return time.perf_counter() - began
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark concurrent index writers")
+    parser.add_argument("--writers", type=int, default=4, help="Concurrent processes")
+    parser.add_argument("--papers", type=int, default=200, help="Papers added by each writer")
+    parser.add_argument("--compact-bytes", type=int, default=256 * 1024,
+                        help="Journal size that triggers compaction (small, to compact during the run)")
+    args = parser.parse_args()
+
+    papers = synthetic_index(args.writers * args.papers)
+    shards = [papers[i::args.writers] for i in range(args.writers)]
+    expected = len(papers)
+    print(f"{args.writers} writers x {args.papers} papers")
+    print(f"{'strategy':<24}{'papers kept':>12}{'lost':>6}{'time (s)':>10}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        naive_path = Path(tmp) / "naive" / "index.json"
+        IndexManager(naive_path)
+        elapsed = run(naive_writer, naive_path, shards)
+        try:
+            with open(naive_path, 'r', encoding='utf-8') as f:
+                kept = len(json.load(f)['papers'])
+            print(f"{'truncate-and-write':<24}{kept:>12}{expected - kept:>6}{elapsed:>10.2f}")
+        except ValueError:
+            print(f"{'truncate-and-write':<24}{'corrupt':>12}{expected:>6}{elapsed:>10.2f}")
+
+        journal_path = Path(tmp) / "journal" / "index.json"
+        elapsed = run(journaled_writer, journal_path, shards, (args.compact_bytes,))
+        manager = IndexManager(journal_path)
+        kept = len(manager.list_papers())
+        reproduced = manager.get_statistics()['by_status']['reproduced']
+        print(f"{'journal + lock (add+update)':<24}{kept:>12}{expected - kept:>6}{elapsed:>10.2f}")
+        print(f"Updates kept: {reproduced}/{expected}, statistics consistent: {manager.verify_statistics(repair=False)}, "
+              f"journal now {manager.journal_path.stat().st_size / 1024:.0f} KB, "
+              f"index.json {manager.index_path.stat().st_size / 1024:.0f} KB")
+
+        # Crash recovery: a torn final entry is ignored, and the next write replaces it
+        with open(manager.journal_path, 'ab') as f:
+            f.write(b'{"at": "2026-01-01T00:00:00Z", "ops": [{"op": "add", "pap')
+        recovered = IndexManager(journal_path)
+        with contextlib.redirect_stdout(io.StringIO()):
+            recovered.add_paper(dict(papers[0], arxiv_id="9999.99999"))
+        reopened = IndexManager(journal_path)
+        print(f"After a torn journal entry: {len(reopened.list_papers())} papers "
+              f"(expected {expected + 1}), statistics consistent: {reopened.verify_statistics(repair=False)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: full scans vs secondary indexes for index queries
+Times dashboard-style queries on a large JSON index and checks them against scans and SQLite
+"""
+
+import argparse
+import contextlib
+import copy
+import io
+import random
+import tempfile
+import time
+
+from bench_index_backend import synthetic_index
+from index_manager import IndexManager
+from index_store import SQLiteIndexManager
+
+
+def scan_list(papers, sort_by, limit):
+    """Previous list_papers: sort everything, then slice"""
+    if sort_by == 'date':
+        papers = sorted(papers, key=lambda p: p.get('analyzed_date', ''), reverse=True)
+    elif sort_by == 'relevance':
+        papers = sorted(papers, key=lambda p: p.get('analysis', {}).get('relevance_score', 0), reverse=True)
+    return copy.deepcopy(papers[:limit] if limit else papers)
+
+
+def scan_query(papers, tags=(), categories=(), date_from=None, date_to=None, sort_by='date', limit=None):
+    """Compound query as a filter over every paper"""
+    matches = [p for p in papers
+               if all(t in p.get('tags', []) for t in tags)
+               and all(c in p.get('categories', []) for c in categories)
+               and (date_from is None or p.get('analyzed_date', '') >= date_from)
+               and (date_to is None or p.get('analyzed_date', '')[:len(date_to)] <= date_to)]
+    return scan_list(matches, sort_by, limit)
+
+
+QUERIES = [
+    ("latest 10", dict(sort_by='date', limit=10)),
+    ("top relevance 10", dict(sort_by='relevance', limit=10)),
+    ("tag+cat+month, 20", dict(tags=["MoE"], categories=["cs.CV"], date_from="2024-03",
+                               date_to="2024-03", sort_by='relevance', limit=20)),
+    ("two tags, 10", dict(tags=["MoE", "Agents"], sort_by='date', limit=10)),
+    ("week, all", dict(date_from="2024-06-01", date_to="2024-06-07", sort_by='date')),
+    ("day by relevance", dict(date_from="2024-06-01", date_to="2024-06-01", sort_by='relevance')),
+    ("tag+cat, index, 50", dict(tags=["RL"], categories=["cs.AI"], sort_by='index', limit=50)),
+]
+
+
+def timed(fn, repeat):
+    began = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - began) / repeat * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark index query paths")
+    parser.add_argument("--papers", type=int, default=50000, help="Index size")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs averaged per query")
+    args = parser.parse_args()
+
+    papers = synthetic_index(args.papers)
+    with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()):
+        manager = IndexManager(f"{tmp}/index.json")
+        with manager.batch():
+            for paper in papers:
+                manager.add_paper(paper)
+        sqlite = SQLiteIndexManager(f"{tmp}/index.db")
+        sqlite.import_papers(papers)
+
+        # Each sorted view is built by the first query that sorts by it
+        began = time.perf_counter()
+        manager.query(limit=1)
+        manager.query(sort_by='relevance', limit=1)
+        build = time.perf_counter() - began
+
+        # Updates after the indexes exist must keep them consistent
+        rng = random.Random(7)
+        updated = rng.sample(papers, 200)
+        with manager.batch():
+            for paper in updated:
+                updates = {"tags": rng.sample(["MoE", "Agents", "LLM"], 2),
+                           "analyzed_date": f"2024-03-{rng.randint(1, 28):02d}T12:00:00Z",
+                           "analysis": {"relevance_score": 10.0}}
+                manager.update_paper(paper["arxiv_id"], updates)
+                sqlite.update_paper(paper["arxiv_id"], updates)
+        current = manager._load_index()['papers']
+
+        rows = []
+        for label, kwargs in QUERIES:
+            scan_ms, expected = timed(lambda: scan_query(current, **kwargs), max(1, args.repeat // 10))
+            indexed_ms, result = timed(lambda: manager.query(**kwargs), args.repeat)
+            sqlite_ms, from_sqlite = timed(lambda: sqlite.query(**kwargs), args.repeat)
+            rows.append((label, len(result), scan_ms, indexed_ms, sqlite_ms,
+                         result == expected and from_sqlite == expected))
+        tag_scan_ms, _ = timed(lambda: [p for p in current if "MoE" in p.get('tags', [])], 3)
+        tag_ms, _ = timed(lambda: manager._secondary_indexes()['tag']["MoE"], args.repeat)
+        sqlite.close()
+
+    print(f"{args.papers} papers; secondary indexes built in {build * 1000:.0f} ms, "
+          f"{len(updated)} papers updated after the build")
+    print(f"{'query':<20}{'rows':>6}{'scan (ms)':>11}{'indexed (ms)':>14}{'SQLite (ms)':>13}{'same':>6}")
+    for label, n, scan_ms, indexed_ms, sqlite_ms, same in rows:
+        print(f"{label:<20}{n:>6}{scan_ms:>11.2f}{indexed_ms:>14.3f}{sqlite_ms:>13.3f}{str(same):>6}")
+    print(f"Tag lookup without copying papers: scan {tag_scan_ms:.2f} ms, inverted index {tag_ms:.4f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: full statistics recount vs incremental counters
+Times add_paper/update_paper inside batch() as the JSON index grows
+"""
+
+import argparse
+import contextlib
+import io
+import tempfile
+import time
+
+from bench_index_backend import synthetic_index
+from index_manager import IndexManager
+
+
+class RecountingIndexManager(IndexManager):
+    """Previous behaviour: rescan every paper after each add or update"""
+
+    def _count_paper(self, statistics, paper, delta):
+        pass
+
+    def _apply(self, index, op):
+        super()._apply(index, op)
+        self._update_statistics(index)
+
+
+def per_write_latency(cls, papers, checkpoints, probes):
+    """Mean add_paper latency (ms) around each index size in checkpoints"""
+    latencies = {}
+    with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()):
+        manager = cls(f"{tmp}/index.json")
+        with manager.batch():
+            for i, paper in enumerate(papers):
+                began = time.perf_counter()
+                manager.add_paper(paper)
+                elapsed = time.perf_counter() - began
+                for size in checkpoints:
+                    if size - probes <= i < size:
+                        latencies[size] = latencies.get(size, 0) + elapsed / probes
+            began = time.perf_counter()
+            for paper in papers[:probes]:
+                manager.update_paper(paper["arxiv_id"], {"reproduction": {"status": "completed"},
+                                                         "categories": ["cs.LG"]})
+            update = (time.perf_counter() - began) / probes
+            consistent = manager.verify_statistics(repair=False)
+            stats = manager.get_statistics()
+    return {size: ms * 1000 for size, ms in latencies.items()}, update * 1000, consistent, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark index statistics maintenance")
+    parser.add_argument("--papers", type=int, default=20000, help="Final index size (the recount baseline is quadratic)")
+    parser.add_argument("--probes", type=int, default=200, help="Writes averaged per checkpoint")
+    args = parser.parse_args()
+
+    papers = synthetic_index(args.papers)
+    checkpoints = [args.papers // 8, args.papers // 4, args.papers // 2, args.papers]
+
+    print("add_paper latency (ms) inside batch(), by index size")
+    print(f"{'statistics':<14}" + "".join(f"{size:>10}" for size in checkpoints) + f"{'update':>10}")
+    results = {}
+    for label, cls in [("full recount", RecountingIndexManager), ("incremental", IndexManager)]:
+        adds, update, consistent, results[label] = per_write_latency(cls, papers, checkpoints, args.probes)
+        print(f"{label:<14}" + "".join(f"{adds[size]:>10.3f}" for size in checkpoints) + f"{update:>10.3f}")
+        if label == "incremental":
+            print(f"verify_statistics(): {consistent}")
+
+    print(f"Same statistics: {results['full recount'] == results['incremental']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: sequential per-paper chain vs the concurrent paper pipeline
+Acquires, reports on and indexes papers against the local arXiv and S2 stubs
+"""
+
+import argparse
+import contextlib
+import io
+import tempfile
+import time
+from pathlib import Path
+
+import requests
+
+from arxiv_stub import StubArxivServer, synthetic_papers
+from s2_stub import StubS2Server, synthetic_graph
+from arxiv_fetcher import ArxivFetcher
+from index_manager import IndexManager
+from paper_pipeline import PaperPipeline
+from report_generator import ReportGenerator
+from semantic_scholar_fetcher import SemanticScholarFetcher
+
+
+def clients(arxiv_stub, s2_stub, papers_dir):
+    """Fetchers pointed at the stubs, without the on-disk HTTP cache"""
+    arxiv = ArxivFetcher(output_dir=papers_dir, store_path=Path(papers_dir).parent / "metadata.db",
+                         session=requests.Session())
+    arxiv.BASE_API_URL = arxiv_stub.base_url + "/api/query"
+    arxiv.BASE_PDF_URL = arxiv_stub.base_url + "/pdf"
+    arxiv.REQUEST_DELAY = 0
+    s2 = SemanticScholarFetcher(session=requests.Session())
+    s2.BASE_URL = s2_stub.base_url
+    return arxiv, s2
+
+
+def sequential(arxiv, s2, generator, index, reports_dir, arxiv_ids):
+    """Previous workflow: metadata, PDF, citations, report, index entry, one paper after another"""
+    for arxiv_id in arxiv_ids:
+        metadata = arxiv.fetch_metadata(arxiv_id)
+        pdf_path = arxiv.download_pdf(arxiv_id)
+        citations = s2.fetch_paper_data(arxiv_id)
+        report_path = reports_dir / f"{arxiv_id}_analysis.md"
+        generator.save_report(generator.generate_report(arxiv_id, metadata, citations=citations), report_path)
+        index.add_paper(PaperPipeline._index_entry(metadata, citations, pdf_path, report_path,
+                                                   "english", "medium"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the concurrent paper pipeline")
+    parser.add_argument("--papers", type=int, default=50, help="Papers processed by the pipeline")
+    parser.add_argument("--sequential", type=int, default=5, help="Papers processed one after another")
+    parser.add_argument("--arxiv-latency", type=float, default=0.2, help="arXiv stub latency per request (s)")
+    parser.add_argument("--s2-latency", type=float, default=0.1, help="S2 stub latency per request (s)")
+    parser.add_argument("--pdf-concurrency", type=int, default=4, help="PDF downloads at once")
+    args = parser.parse_args()
+
+    corpus = synthetic_papers(["cs.AI", "cs.LG"], per_category=max(args.papers, args.sequential))
+    graph = synthetic_graph(size=2000)
+    arxiv_ids = sorted(p["id"] for p in corpus)
+
+    with tempfile.TemporaryDirectory() as tmp, \
+            StubArxivServer(corpus, latency=args.arxiv_latency) as arxiv_stub, \
+            StubS2Server(graph, latency=args.s2_latency) as s2_stub:
+        print(f"stub latency: arXiv {args.arxiv_latency * 1000:.0f} ms, S2 {args.s2_latency * 1000:.0f} ms")
+        print(f"S2 quota: {SemanticScholarFetcher.QUOTA_WITHOUT_KEY} requests / {SemanticScholarFetcher.RATE_WINDOW} s")
+        print(f"{'strategy':<28}{'papers':>7}{'requests':>10}{'S2 requests':>13}{'index writes':>14}{'time (s)':>10}")
+
+        results = {}
+        for label, count in (("sequential chain", args.sequential), ("pipeline", args.papers)):
+            root = Path(tmp) / label.split()[0]
+            # Each strategy starts with a full bucket of the real unauthenticated S2 quota
+            SemanticScholarFetcher._limiters.clear()
+            arxiv, s2 = clients(arxiv_stub, s2_stub, root / "papers")
+            index_path = root / "index.json"
+            generator = ReportGenerator()
+            IndexManager(index_path)
+            journal = index_path.with_name(index_path.name + ".journal")
+            requests_before = arxiv_stub.requests + s2_stub.requests
+            s2_before = s2_stub.requests
+            began = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                if label == "pipeline":
+                    stats = PaperPipeline(arxiv, s2, generator, index_path, root / "reports",
+                                          pdf_concurrency=args.pdf_concurrency).run(arxiv_ids[:count])
+                    assert not any(stats[k] for k in ("missing", "pdf_failed", "no_citations"))
+                else:
+                    sequential(arxiv, s2, generator, IndexManager(index_path), root / "reports",
+                               arxiv_ids[:count])
+            elapsed = time.perf_counter() - began
+            writes = journal.read_text(encoding='utf-8').count("\n") if journal.exists() else 0
+            requests_made = arxiv_stub.requests + s2_stub.requests - requests_before
+            print(f"{label:<28}{count:>7}{requests_made:>10}{s2_stub.requests - s2_before:>13}"
+                  f"{writes:>14}{elapsed:>10.2f}")
+            results[label] = (IndexManager(index_path), root / "reports")
+
+        # Same entries and reports, apart from dates and output paths
+        seq_index, seq_reports = results["sequential chain"]
+        pipe_index, pipe_reports = results["pipeline"]
+        skip = ("analyzed_date", "analysis")
+        same = all(
+            {k: v for k, v in seq_index.get_paper(i).items() if k not in skip}
+            == {k: v for k, v in pipe_index.get_paper(i).items() if k not in skip}
+            for i in arxiv_ids[:args.sequential])
+        same_reports = all(
+            (seq_reports / f"{i}_analysis.md").read_text(encoding='utf-8').splitlines()[:5]
+            == (pipe_reports / f"{i}_analysis.md").read_text(encoding='utf-8').splitlines()[:5]
+            for i in arxiv_ids[:args.sequential])
+        print(f"Index entries match (apart from dates): {same}, report headers match: {same_reports}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: nightly regeneration through generate_report/save_report
+Regenerates every report twice and counts how many files were rewritten
+"""
+
+import argparse
+import contextlib
+import io
+import tempfile
+import time
+from pathlib import Path
+
+from bench_index_backend import synthetic_index
+from report_generator import ReportGenerator
+
+
+def regenerate(generator, papers, reports_dir, use_manifest=True):
+    """One nightly pass: generate and save every report"""
+    written = 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        for paper in papers:
+            output_path = reports_dir / f"{paper['arxiv_id']}_analysis.md"
+            report = generator.generate_report(paper["arxiv_id"], paper, paper["analysis"], paper["reproduction"],
+                                               output_path=output_path if use_manifest else None)
+            if not use_manifest:
+                report = str(report)  # Plain text: always written, as before
+            written += generator.save_report(report, output_path)
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark manifest-based report invalidation")
+    parser.add_argument("--papers", type=int, default=2000, help="Reports regenerated per night")
+    args = parser.parse_args()
+
+    papers = synthetic_index(args.papers)
+    generator = ReportGenerator()
+    with tempfile.TemporaryDirectory() as tmp:
+        reports_dir = Path(tmp) / "reports"
+        print(f"{args.papers} reports")
+        print(f"{'night':<34}{'written':>9}{'time (s)':>10}")
+        for label, mutate, use_manifest in [("no manifest (previous behaviour)", None, False),
+                                            ("first run with manifest", None, True),
+                                            ("nothing changed", None, True),
+                                            ("20 papers re-analyzed", 20, True)]:
+            if mutate:
+                for paper in papers[:mutate]:
+                    paper["analysis"]["relevance_score"] = 10.0
+            mtimes = {p: p.stat().st_mtime_ns for p in reports_dir.glob("*.md")}
+            began = time.perf_counter()
+            written = regenerate(generator, papers, reports_dir, use_manifest)
+            elapsed = time.perf_counter() - began
+            touched = sum(p.stat().st_mtime_ns != mtimes.get(p) for p in reports_dir.glob("*.md"))
+            assert touched == written
+            print(f"{label:<34}{written:>9}{elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
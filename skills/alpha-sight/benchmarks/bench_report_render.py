@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: str.replace chain vs compiled single-pass templates
+Renders many reports from the bundled templates with both fill strategies
+"""
+
+import argparse
+import time
+
+from bench_index_backend import synthetic_index
+from report_generator import CompiledTemplate, ReportGenerator
+
+
+def replace_chain(template, variables):
+    """Previous _fill_template: one str.replace per variable"""
+    result = template
+    for key, value in variables.items():
+        result = result.replace("{" + key + "}", str(value))
+    return result
+
+
+def old_generate(generator, language, variables):
+    """Previous generate_report: read the template file, then the replace chain"""
+    template_file = generator.assets_path / ("report_template_zh.md" if language == "chinese"
+                                             else "report_template_en.md")
+    with open(template_file, 'r', encoding='utf-8') as f:
+        template = f.read()
+    return replace_chain(template, variables)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark report template filling")
+    parser.add_argument("--reports", type=int, default=10000, help="Reports rendered per strategy")
+    args = parser.parse_args()
+
+    generator = ReportGenerator()
+    papers = synthetic_index(min(args.reports, 2000))
+    variables = []
+    for i in range(args.reports):
+        paper = papers[i % len(papers)]
+        variables.append(generator._prepare_variables(
+            arxiv_id=paper["arxiv_id"], metadata=paper, analysis=paper["analysis"],
+            reproduction=paper["reproduction"], citations=None, language="english", depth="medium"))
+
+    print(f"{args.reports} reports")
+    print(f"{'template':<22}{'strategy':<26}{'time (s)':>10}{'per report (us)':>17}")
+    for language in ("english", "chinese"):
+        source = generator.load_template(language)
+        for scale in (1, 10):
+            template = source * scale
+            compiled = CompiledTemplate(template)
+            label = f"{language} {len(template) // 1024} KB"
+            runs = [("replace chain", lambda v: replace_chain(template, v)),
+                    ("compiled", compiled.render)]
+            if scale == 1:
+                runs = [("read + replace chain", lambda v: old_generate(generator, language, v)),
+                        ("cached + compiled", lambda v: generator._fill_template(
+                            generator.compile_template(language), v))]
+            outputs = []
+            for name, fill in runs:
+                began = time.perf_counter()
+                reports = [fill(v) for v in variables]
+                elapsed = time.perf_counter() - began
+                outputs.append(reports)
+                print(f"{label:<22}{name:<26}{elapsed:>10.3f}{elapsed / args.reports * 1e6:>17.1f}")
+            print(f"{'':<22}identical output: {outputs[0] == outputs[1]}")
+
+
+if __name__ == "__main__":
+    main()
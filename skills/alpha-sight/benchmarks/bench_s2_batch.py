@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: per-paper GET vs POST /paper/batch
+Enriches an index-sized list of arXiv IDs against the local S2 stub
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import time
+
+from s2_stub import StubS2Server, synthetic_graph
+from semantic_scholar_fetcher import SemanticScholarFetcher
+
+
+def sequential(fetcher, arxiv_ids):
+    """Previous behaviour: one GET /paper/arXiv:{id} per paper"""
+    found, not_found = {}, []
+    for arxiv_id in arxiv_ids:
+        data = fetcher.fetch_paper_data(arxiv_id)
+        if data:
+            found[arxiv_id] = data
+        else:
+            not_found.append(arxiv_id)
+    return found, not_found
+
+
+def batched(fetcher, arxiv_ids):
+    return fetcher.fetch_many(arxiv_ids)
+
+
+def run(label, stub, strategy, arxiv_ids):
+    """Time one enrichment strategy and count the requests it made"""
+    fetcher = SemanticScholarFetcher()
+    fetcher.BASE_URL = stub.base_url
+    requests_before, bytes_before = stub.requests, stub.bytes_sent
+    began = time.perf_counter()
+    # Silence the per-ID "not found" messages
+    with contextlib.redirect_stdout(io.StringIO()):
+        found, not_found = strategy(fetcher, arxiv_ids)
+    elapsed = time.perf_counter() - began
+    print(f"{label:<22}{len(found):>7}{len(not_found):>11}{stub.requests - requests_before:>10}"
+          f"{(stub.bytes_sent - bytes_before) / 1e6:>10.1f}{elapsed:>10.2f}")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the S2 batch endpoint")
+    parser.add_argument("--papers", type=int, default=200, help="arXiv IDs to enrich")
+    parser.add_argument("--unknown", type=float, default=0.1, help="Share of IDs S2 does not know")
+    parser.add_argument("--latency", type=float, default=0.1, help="Stub latency per request (s)")
+    args = parser.parse_args()
+
+    graph = synthetic_graph(size=2000)
+    rng = random.Random(3)
+    known = [p["externalIds"]["ArXiv"] for p in graph.values()]
+    unknown = int(args.papers * args.unknown)
+    arxiv_ids = rng.sample(known, args.papers - unknown) + [f"2611.{i:05d}" for i in range(unknown)]
+    rng.shuffle(arxiv_ids)
+
+    SemanticScholarFetcher.RATE_WINDOW = 1  # The stub enforces no quota
+    with StubS2Server(graph, latency=args.latency) as stub:
+        print(f"{len(arxiv_ids)} IDs ({unknown} unknown), stub latency {args.latency * 1000:.0f} ms")
+        print(f"{'strategy':<22}{'found':>7}{'not found':>11}{'requests':>10}{'MB':>10}{'time (s)':>10}")
+        per_id = run("GET /paper per ID", stub, sequential, arxiv_ids)
+        batch = run("POST /paper/batch", stub, batched, arxiv_ids)
+
+    print(f"Results identical: {per_id == batch}")
+
+
+if __name__ == "__main__":
+    main()
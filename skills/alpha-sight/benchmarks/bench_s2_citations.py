@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: inline citations.* / references.* vs paged top-N retrieval
+Fetches the most cited papers of a synthetic graph and reports bytes and time
+"""
+
+import argparse
+import time
+
+import requests
+
+from s2_stub import StubS2Server, synthetic_graph
+from semantic_scholar_fetcher import SemanticScholarFetcher
+
+LEGACY_FIELDS = SemanticScholarFetcher.PAPER_FIELDS + [
+    "citations", "citations.title", "citations.year", "citations.citationCount",
+    "references", "references.title", "references.year", "references.citationCount",
+]
+
+
+def legacy_fetch(base_url, arxiv_id):
+    """Previous behaviour: inline every citation and reference, keep 10 of each"""
+    response = requests.get(f"{base_url}/paper/arXiv:{arxiv_id}",
+                            params={"fields": ",".join(LEGACY_FIELDS)}, timeout=30)
+    data = response.json()
+    return data["citations"][:10], data["references"][:10]
+
+
+def measure(label, stub, fetch, arxiv_ids):
+    requests_before, bytes_before = stub.requests, stub.bytes_sent
+    began = time.perf_counter()
+    for arxiv_id in arxiv_ids:
+        fetch(arxiv_id)
+    elapsed = time.perf_counter() - began
+    sent = stub.bytes_sent - bytes_before
+    print(f"{label:<24}{stub.requests - requests_before:>10}{sent / 1e3:>12.0f}"
+          f"{sent / len(arxiv_ids) / 1e3:>12.1f}{elapsed:>10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark paged citation retrieval")
+    parser.add_argument("--graph", type=int, default=20000, help="Papers in the synthetic graph")
+    parser.add_argument("--papers", type=int, default=20, help="Most cited papers to fetch")
+    parser.add_argument("--top-n", type=int, default=10, help="Citations and references kept")
+    args = parser.parse_args()
+
+    graph = synthetic_graph(size=args.graph)
+    popular = sorted(graph.values(), key=lambda p: p["citationCount"], reverse=True)[:args.papers]
+    arxiv_ids = [p["externalIds"]["ArXiv"] for p in popular]
+    counts = [p["citationCount"] for p in popular]
+    print(f"{len(arxiv_ids)} most cited papers of {args.graph} "
+          f"({min(counts)}-{max(counts)} citations), top {args.top_n}")
+    print(f"{'strategy':<24}{'requests':>10}{'KB total':>12}{'KB/paper':>12}{'time (s)':>10}")
+
+    SemanticScholarFetcher.RATE_WINDOW = 1  # The stub enforces no quota
+    with StubS2Server(graph, latency=0.02) as stub:
+        measure("inline citations.*", stub, lambda i: legacy_fetch(stub.base_url, i), arxiv_ids)
+
+        fetcher = SemanticScholarFetcher()
+        fetcher.BASE_URL = stub.base_url
+        measure(f"paged, top {args.top_n}", stub,
+                lambda i: fetcher.fetch_paper_data(i, top_n=args.top_n), arxiv_ids)
+
+        fetcher = SemanticScholarFetcher()
+        fetcher.BASE_URL = stub.base_url
+        streamed = {"citations": 0}
+
+        def stream_all(arxiv_id):
+            streamed["citations"] += sum(1 for _ in fetcher.iter_citations(f"arXiv:{arxiv_id}", page_size=1000))
+
+        measure("iter_citations (all)", stub, stream_all, arxiv_ids)
+        print(f"Streamed {streamed['citations']} citations (expected {sum(counts)})")
+
+
+if __name__ == "__main__":
+    main()
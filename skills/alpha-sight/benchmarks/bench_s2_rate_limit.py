@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: fail-on-429 vs the shared adaptive rate limiter
+Hammers a quota-enforcing S2 stub from several threads and reports throughput
+"""
+
+import argparse
+import contextlib
+import io
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from s2_stub import StubS2Server, synthetic_graph
+from semantic_scholar_fetcher import SemanticScholarFetcher
+
+
+def legacy_fetch(base_url, arxiv_id):
+    """Previous behaviour: one attempt, None on 429"""
+    response = requests.get(f"{base_url}/paper/arXiv:{arxiv_id}", params={"fields": "paperId"}, timeout=30)
+    return response.json() if response.status_code == 200 else None
+
+
+def lookup(fetcher):
+    """One request per lookup, like legacy_fetch"""
+    return lambda arxiv_id: fetcher.fetch_paper_data(arxiv_id, top_n=0)
+
+
+def run(label, stub, fetch, arxiv_ids, workers, ceiling):
+    throttled_before = stub.throttled
+    began = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(fetch, arxiv_ids))
+    elapsed = time.perf_counter() - began
+    ok = sum(r is not None for r in results)
+    failed = len(results) - ok
+    # Throughput only means something when every lookup succeeded
+    share = f"{ok / elapsed / ceiling:>10.0%}" if not failed else f"{'-':>10}"
+    print(f"{label:<26}{ok:>6}{failed:>8}{stub.throttled - throttled_before:>7}{elapsed:>10.1f}{share}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the S2 rate limiter")
+    parser.add_argument("--papers", type=int, default=200, help="Lookups to perform")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent callers")
+    parser.add_argument("--window", type=float, default=10.0,
+                        help="Quota window in seconds (the real API uses 300; scaled down to run quickly)")
+    args = parser.parse_args()
+
+    quota = SemanticScholarFetcher.QUOTA_WITHOUT_KEY
+    ceiling = quota / args.window
+    graph = synthetic_graph(size=args.papers)
+    arxiv_ids = [p["externalIds"]["ArXiv"] for p in graph.values()]
+
+    # Give the fetcher the same scaled-down window as the stub
+    SemanticScholarFetcher.RATE_WINDOW = args.window
+
+    print(f"{args.papers} lookups, {args.workers} threads, quota {quota} requests / {args.window:.0f} s "
+          f"(ceiling {ceiling:.1f} req/s)")
+    print(f"{'strategy':<26}{'ok':>6}{'failed':>8}{'429s':>7}{'time (s)':>10}{'of quota':>10}")
+
+    with StubS2Server(graph, latency=0.05, quota=(quota, args.window)) as stub:
+        run("fail on first 429", stub, lambda i: legacy_fetch(stub.base_url, i), arxiv_ids, args.workers, ceiling)
+
+    with StubS2Server(graph, latency=0.05, quota=(quota, args.window)) as stub:
+        fetcher = SemanticScholarFetcher()
+        fetcher.BASE_URL = stub.base_url
+        run("shared token bucket", stub, lookup(fetcher), arxiv_ids, args.workers, ceiling)
+
+    # Another client spends part of the quota: the bucket overshoots and
+    # must recover through Retry-After instead of dropping lookups
+    shared = int(quota * 0.7)
+    with StubS2Server(graph, latency=0.05, quota=(shared, args.window)) as stub:
+        SemanticScholarFetcher._limiters.clear()
+        fetcher = SemanticScholarFetcher()
+        fetcher.BASE_URL = stub.base_url
+        run(f"bucket, {shared}/{quota} available", stub, lookup(fetcher), arxiv_ids,
+            args.workers, shared / args.window)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Local Semantic Scholar API Stub
+Serves a synthetic citation graph over HTTP so S2 benchmarks run offline
+"""
+
+import hashlib
+import json
+import math
+import random
+import socket
+import sys
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlparse
+
+# Make the skill scripts importable from benchmarks
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+LINK_KEYS = {"citations": "citingPaper", "references": "citedPaper"}
+
+
+def synthetic_graph(size: int = 1000, max_refs: int = 30, seed: int = 5) -> Dict[str, Dict]:
+    """
+    Build a deterministic citation graph
+
+    Papers only cite earlier papers. Half of the references are drawn in
+    proportion to existing citations, so a few papers become highly cited.
+
+    Args:
+        size: Number of papers
+        max_refs: Maximum references per paper
+        seed: Random seed
+
+    Returns:
+        Dictionary mapping paperId to paper dicts
+    """
+    rng = random.Random(seed)
+    papers = {}
+    order = []
+    position = {}
+    cited = []  # One entry per citation received, for preferential attachment
+    for serial in range(size):
+        paper_id = f"{rng.getrandbits(160):040x}"
+        wanted = min(len(order), rng.randint(0, max_refs))
+        refs = set()
+        while len(refs) < wanted:
+            pool = cited if cited and rng.random() < 0.5 else order
+            refs.add(rng.choice(pool))
+        refs = sorted(refs, key=position.get)
+        papers[paper_id] = {
+            "paperId": paper_id,
+            "title": f"Synthetic paper {serial}",
+            "abstract": " ".join(["Lorem ipsum dolor sit amet."] * 20),
+            "year": 2000 + serial * 26 // size,
+            "url": f"https://www.semanticscholar.org/paper/{paper_id}",
+            "externalIds": {"ArXiv": f"2510.{serial:05d}"},
+            "references": refs,
+            "citations": [],
+        }
+        for ref in refs:
+            papers[ref]["citations"].append(paper_id)
+        cited.extend(refs)
+        position[paper_id] = serial
+        order.append(paper_id)
+    for paper in papers.values():
+        paper["citationCount"] = len(paper["citations"])
+        paper["referenceCount"] = len(paper["references"])
+        paper["influentialCitationCount"] = paper["citationCount"] // 10 + rng.randint(0, 3)
+    return papers
+
+
+class StubS2Server:
+    """Threaded HTTP server answering Graph API paper lookups from a synthetic graph"""
+
+    def __init__(self, papers: Dict[str, Dict], latency: float = 0.1,
+                 quota: Optional[Tuple[int, float]] = None):
+        """
+        Initialize stub server
+
+        Args:
+            papers: Graph returned by synthetic_graph()
+            latency: Seconds each response is delayed, to mimic the real API
+            quota: (requests, window seconds) enforced with a sliding window;
+                requests over the quota get 429 with Retry-After
+        """
+        self.papers = papers
+        self.by_arxiv = {p["externalIds"]["ArXiv"]: pid for pid, p in papers.items()}
+        self.latency = latency
+        self.quota = quota
+        self.requests = 0
+        self.throttled = 0
+        self.not_modified = 0
+        self.bytes_sent = 0
+        self._admitted = deque()
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def base_url(self) -> str:
+        """Drop-in replacement for SemanticScholarFetcher.BASE_URL"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/graph/v1"
+
+    def resolve(self, key: str) -> Optional[Dict]:
+        """Look up a paper by paperId or arXiv:<id>"""
+        if key.startswith("arXiv:"):
+            key = self.by_arxiv.get(key[len("arXiv:"):].split("v")[0], "")
+        return self.papers.get(key)
+
+    def admit(self) -> Optional[int]:
+        """
+        Count a request against the quota
+
+        Returns:
+            None if admitted, otherwise the Retry-After value in seconds
+        """
+        if self.quota is None:
+            return None
+        limit, window = self.quota
+        with self._lock:
+            now = time.monotonic()
+            while self._admitted and self._admitted[0] <= now - window:
+                self._admitted.popleft()
+            if len(self._admitted) >= limit:
+                self.throttled += 1
+                return max(1, math.ceil(self._admitted[0] + window - now))
+            self._admitted.append(now)
+            return None
+
+    def summary(self, paper_id: str) -> Dict:
+        paper = self.papers[paper_id]
+        return {"paperId": paper_id, "title": paper["title"], "year": paper["year"],
+                "citationCount": paper["citationCount"],
+                "influentialCitationCount": paper["influentialCitationCount"],
+                "externalIds": paper["externalIds"]}
+
+    def page(self, paper: Dict, endpoint: str, offset: int, limit: int) -> Dict:
+        """Render one page of /paper/{id}/citations or /references"""
+        ids = paper[endpoint][offset:offset + limit]
+        page = {"offset": offset, "data": [{LINK_KEYS[endpoint]: self.summary(pid)} for pid in ids]}
+        if offset + limit < len(paper[endpoint]):
+            page["next"] = offset + limit
+        return page
+
+    def render(self, paper: Dict, fields: List[str]) -> Dict:
+        """Render a paper object with the requested fields"""
+        top = {f.split(".")[0] for f in fields} | {"paperId"}
+        data = {}
+        for field in top:
+            if field in ("citations", "references"):
+                data[field] = [self.summary(pid) for pid in paper[field]]
+            elif field in paper:
+                data[field] = paper[field]
+        return data
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                # Keep-alive responses are written in two parts; avoid Nagle stalls
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def _send(self, status: int, payload, headers: Dict = None):
+                body = json.dumps(payload).encode("utf-8")
+                if status == 200:
+                    # Strong validator so clients can revalidate with If-None-Match
+                    etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+                    headers = dict(headers or {}, ETag=etag)
+                    if self.headers.get("If-None-Match") == etag:
+                        status, body = 304, b""
+                with stub._lock:
+                    stub.requests += 1
+                    stub.bytes_sent += len(body)
+                    stub.not_modified += status == 304
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                if status == 304:
+                    self.end_headers()
+                    return
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _throttled(self) -> bool:
+                retry_after = stub.admit()
+                if retry_after is None:
+                    return False
+                self._send(429, {"message": "Too Many Requests"}, {"Retry-After": str(retry_after)})
+                return True
+
+            def _route(self):
+                url = urlparse(self.path)
+                params = parse_qs(url.query)
+                fields = params.get("fields", ["paperId"])[0].split(",")
+                parts = unquote(url.path).split("/")  # ['', 'graph', 'v1', 'paper', ...]
+                return parts[4:], params, fields
+
+            def do_GET(self):
+                if self._throttled():
+                    return
+                time.sleep(stub.latency)
+                path, params, fields = self._route()
+                paper = stub.resolve(path[0]) if path else None
+                if paper is None or len(path) > 2 or (len(path) == 2 and path[1] not in LINK_KEYS):
+                    self._send(404, {"error": "Paper not found"})
+                    return
+                if len(path) == 1:
+                    self._send(200, stub.render(paper, fields))
+                    return
+                offset = int(params.get("offset", ["0"])[0])
+                limit = int(params.get("limit", ["100"])[0])
+                self._send(200, stub.page(paper, path[1], offset, limit))
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                if self._throttled():
+                    return
+                time.sleep(stub.latency)
+                path, params, fields = self._route()
+                ids = body.get("ids", [])
+                if path != ["batch"]:
+                    self._send(404, {"error": "Not found"})
+                    return
+                if len(ids) > 500:
+                    self._send(400, {"error": "Cannot process more than 500 ids"})
+                    return
+                papers = [stub.resolve(i) for i in ids]
+                self._send(200, [stub.render(p, fields) if p else None for p in papers])
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
@@ -10,9 +10,14 @@ import io
 import requests
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterator, List, Optional
 import time
 
+from atom_parser import iter_entries
+from http_cache import CachedSession, get_shared_session
+from metadata_store import MetadataStore, split_version
+from pdf_downloader import PdfDownloader
+
 # Fix Windows console encoding issue
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
@@ -24,8 +29,25 @@ class ArxivFetcher:
 
     BASE_API_URL = "http://export.arxiv.org/api/query"
     BASE_PDF_URL = "https://arxiv.org/pdf"
+    BATCH_SIZE = 200  # IDs per id_list request
+    REQUEST_DELAY = 3  # arXiv asks for one request every 3 seconds
+
+    def __init__(self, output_dir: str = None, store_path: str = None,
+                 metadata_ttl: float = 7 * 24 * 3600, max_downloads: int = 8,
+                 per_host_downloads: int = 4, chunk_size: int = 256 * 1024,
+                 session: requests.Session = None):
+        """
+        Initialize fetcher
 
-    def __init__(self, output_dir: str = None):
+        Args:
+            output_dir: Directory for downloaded PDFs
+            store_path: Metadata store database (default: metadata.db next to output_dir)
+            metadata_ttl: Seconds before unversioned metadata is refreshed
+            max_downloads: Concurrent PDF downloads in download_pdfs()
+            per_host_downloads: Concurrent PDF downloads against one host
+            chunk_size: Download buffer size in bytes
+            session: HTTP session for API calls (default: the shared CachedSession)
+        """
         if output_dir is None:
             # Get the project root (4 levels up from scripts directory)
             script_dir = Path(__file__).parent
@@ -34,61 +56,160 @@ class ArxivFetcher:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-    def fetch_metadata(self, arxiv_id: str) -> Optional[Dict]:
+        if store_path is None:
+            store_path = self.output_dir.parent / "metadata.db"
+        self.store = MetadataStore(store_path, ttl=metadata_ttl)
+        self.session = session or get_shared_session()
+        self.downloader = PdfDownloader(max_workers=max_downloads, per_host=per_host_downloads,
+                                        chunk_size=chunk_size)
+
+    def fetch_metadata(self, arxiv_id: str, refresh: bool = False) -> Optional[Dict]:
         """
-        Fetch paper metadata from arXiv API
+        Fetch paper metadata, reading the local metadata store first
 
         Args:
             arxiv_id: arXiv ID (e.g., "2401.12345")
+            refresh: Ignore the store and query arXiv
 
         Returns:
             Dictionary with paper metadata or None if failed
         """
-        # Clean arxiv_id
-        arxiv_id = arxiv_id.replace("arxiv:", "").replace("arXiv:", "").strip()
+        arxiv_id = self._clean_id(arxiv_id)
+        metadata = self.fetch_metadata_many([arxiv_id], refresh=refresh).get(arxiv_id)
+        if metadata is None:
+            print(f"No entry found for arXiv ID: {arxiv_id}")
+        return metadata
 
-        # Build API URL
-        url = f"{self.BASE_API_URL}?id_list={arxiv_id}"
+    def fetch_metadata_many(self, arxiv_ids: List[str], refresh: bool = False) -> Dict[str, Dict]:
+        """
+        Fetch metadata for many papers with batched id_list queries
 
-        try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
+        IDs found fresh in the local store are served from it; the rest are
+        requested in batches of up to BATCH_SIZE IDs per API call.
+
+        Args:
+            arxiv_ids: arXiv IDs, optionally versioned
+            refresh: Ignore the store and query arXiv for every ID
+
+        Returns:
+            Dictionary mapping each requested ID to its metadata; IDs that could
+            not be fetched are omitted
+        """
+        results = {}
+        missing = []
+        for arxiv_id in dict.fromkeys(self._clean_id(i) for i in arxiv_ids):
+            cached = None if refresh else self.store.get(arxiv_id)
+            if cached is not None:
+                results[arxiv_id] = self._for_request(cached, arxiv_id)
+            else:
+                missing.append(arxiv_id)
+
+        for start in range(0, len(missing), self.BATCH_SIZE):
+            if start > 0:
+                time.sleep(self.REQUEST_DELAY)
+            batch = missing[start:start + self.BATCH_SIZE]
+            for arxiv_id, metadata in self._fetch_batch(batch).items():
+                results[arxiv_id] = self._for_request(metadata, arxiv_id)
+
+        return results
+
+    def _fetch_batch(self, arxiv_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Query arXiv for one id_list batch and store the results
+
+        Args:
+            arxiv_ids: Up to BATCH_SIZE arXiv IDs
+
+        Returns:
+            Dictionary mapping requested IDs to metadata
+        """
+        params = {"id_list": ",".join(arxiv_ids), "max_results": len(arxiv_ids)}
 
-            # Parse XML
-            root = ET.fromstring(response.content)
-            ns = {'atom': 'http://www.w3.org/2005/Atom'}
-
-            entry = root.find('atom:entry', ns)
-            if entry is None:
-                print(f"No entry found for arXiv ID: {arxiv_id}")
-                return None
-
-            # Extract metadata
-            metadata = {
-                'arxiv_id': arxiv_id,
-                'title': entry.find('atom:title', ns).text.strip().replace('\n', ' '),
-                'abstract': entry.find('atom:summary', ns).text.strip(),
-                'published_date': entry.find('atom:published', ns).text.split('T')[0],
-                'updated_date': entry.find('atom:updated', ns).text.split('T')[0],
-                'authors': [
-                    author.find('atom:name', ns).text
-                    for author in entry.findall('atom:author', ns)
-                ],
-                'categories': [
-                    cat.get('term')
-                    for cat in entry.findall('atom:category', ns)
-                ],
-                'pdf_url': f"{self.BASE_PDF_URL}/{arxiv_id}.pdf"
-            }
-
-            return metadata
+        # Entries come back versioned; map them to the requested form
+        by_base = {split_version(i)[0]: i for i in arxiv_ids if split_version(i)[1] is None}
+        requested = set(arxiv_ids)
+        found = {}
+
+        try:
+            # IDs only get here when the metadata store missed (absent, expired or
+            # refresh), so the HTTP cache must not answer with an older copy
+            for entry in self._stream_entries(params, cache_ttl=0):
+                metadata = self._parse_entry(entry)
+                if metadata is None:
+                    continue
+                versioned_id = f"{metadata['arxiv_id']}v{metadata['version']}"
+                self.store.put(metadata['arxiv_id'], metadata['version'], metadata)
+                if versioned_id in requested:
+                    found[versioned_id] = metadata
+                if metadata['arxiv_id'] in by_base:
+                    found[by_base[metadata['arxiv_id']]] = metadata
+
+            return found
 
         except requests.RequestException as e:
             print(f"Error fetching metadata: {e}")
-            return None
+            return found
         except ET.ParseError as e:
             print(f"Error parsing XML: {e}")
+            return found
+
+    def _stream_entries(self, params: Dict, cache_ttl: Optional[float] = None) -> Iterator[Dict]:
+        """
+        Query the arXiv API and parse entries while the response streams in
+
+        Args:
+            params: Query parameters
+            cache_ttl: HTTP cache lifetime for this query (None: the session's
+                rule, 0: always ask arXiv)
+
+        Yields:
+            Entry dictionaries from atom_parser.iter_entries
+        """
+        kwargs = {} if cache_ttl is None or not isinstance(self.session, CachedSession) else {"cache_ttl": cache_ttl}
+        with self.session.get(self.BASE_API_URL, params=params, timeout=30, stream=True, **kwargs) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            yield from iter_entries(response.raw)
+
+    def _parse_entry(self, entry: Dict) -> Optional[Dict]:
+        """
+        Extract metadata from a parsed Atom entry
+
+        Args:
+            entry: Entry dictionary from atom_parser.iter_entries
+
+        Returns:
+            Metadata dictionary with unversioned 'arxiv_id' and 'version', or
+            None for error entries returned for unknown IDs
+        """
+        entry_id = entry.get('id', '')
+        if '/abs/' not in entry_id:
             return None
+        base_id, version = split_version(entry_id.split('/abs/')[-1])
+
+        return {
+            'arxiv_id': base_id,
+            'version': version or 1,
+            'title': entry.get('title', '').strip().replace('\n', ' '),
+            'abstract': entry.get('summary', '').strip(),
+            'published_date': entry.get('published', '').split('T')[0],
+            'updated_date': entry.get('updated', '').split('T')[0],
+            'authors': entry['authors'],
+            'categories': entry['categories'],
+            'pdf_url': f"{self.BASE_PDF_URL}/{base_id}.pdf"
+        }
+
+    def _for_request(self, metadata: Dict, arxiv_id: str) -> Dict:
+        """Return a copy of stored metadata addressed by the requested ID"""
+        result = dict(metadata)
+        result['arxiv_id'] = arxiv_id
+        result['pdf_url'] = f"{self.BASE_PDF_URL}/{arxiv_id}.pdf"
+        return result
+
+    @staticmethod
+    def _clean_id(arxiv_id: str) -> str:
+        """Strip arxiv: prefixes and whitespace"""
+        return arxiv_id.replace("arxiv:", "").replace("arXiv:", "").strip()
 
     def download_pdf(self, arxiv_id: str, max_retries: int = 3) -> Optional[Path]:
         """
@@ -96,44 +217,30 @@ class ArxivFetcher:
 
         Args:
             arxiv_id: arXiv ID
-            max_retries: Maximum number of retry attempts
+            max_retries: Maximum number of attempts; later attempts resume the
+                partial download
 
         Returns:
             Path to downloaded PDF or None if failed
         """
-        arxiv_id = arxiv_id.replace("arxiv:", "").replace("arXiv:", "").strip()
-        pdf_url = f"{self.BASE_PDF_URL}/{arxiv_id}.pdf"
-        pdf_path = self.output_dir / f"{arxiv_id}.pdf"
-
-        # Check if already downloaded
-        if pdf_path.exists():
-            print(f"PDF already exists: {pdf_path}")
-            return pdf_path
-
-        # Download with retries
-        for attempt in range(max_retries):
-            try:
-                print(f"Downloading PDF (attempt {attempt + 1}/{max_retries})...")
-                response = requests.get(pdf_url, timeout=60, stream=True)
-                response.raise_for_status()
+        arxiv_id = self._clean_id(arxiv_id)
+        return self.downloader.download(f"{self.BASE_PDF_URL}/{arxiv_id}.pdf",
+                                        self.output_dir / f"{arxiv_id}.pdf", max_retries)
 
-                # Save PDF
-                with open(pdf_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-
-                print(f"PDF downloaded: {pdf_path}")
-                return pdf_path
+    def download_pdfs(self, arxiv_ids: List[str]) -> Dict[str, Optional[Path]]:
+        """
+        Download many paper PDFs in parallel
 
-            except requests.RequestException as e:
-                print(f"Download attempt {attempt + 1} failed: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
-                else:
-                    print("Max retries reached. Download failed.")
-                    return None
+        Args:
+            arxiv_ids: arXiv IDs
 
-        return None
+        Returns:
+            Dictionary mapping each ID to its PDF path, or None if failed
+        """
+        ids = list(dict.fromkeys(self._clean_id(i) for i in arxiv_ids))
+        jobs = [(f"{self.BASE_PDF_URL}/{i}.pdf", self.output_dir / f"{i}.pdf") for i in ids]
+        paths = self.downloader.download_many(jobs)
+        return {i: paths[dest] for i, (_, dest) in zip(ids, jobs)}
 
     def search_papers(self, query: str, max_results: int = 10) -> list:
         """
@@ -146,34 +253,26 @@ class ArxivFetcher:
         Returns:
             List of paper metadata dictionaries
         """
-        url = f"{self.BASE_API_URL}?search_query=all:{query}&max_results={max_results}&sortBy=submittedDate&sortOrder=descending"
+        params = {
+            "search_query": f"all:{query}",
+            "max_results": max_results,
+            "sortBy": "submittedDate",
+            "sortOrder": "descending"
+        }
 
         try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-
-            root = ET.fromstring(response.content)
-            ns = {'atom': 'http://www.w3.org/2005/Atom'}
-
             papers = []
-            for entry in root.findall('atom:entry', ns):
+            for entry in self._stream_entries(params):
                 # Extract arXiv ID from entry ID
-                entry_id = entry.find('atom:id', ns).text
-                arxiv_id = entry_id.split('/abs/')[-1]
+                arxiv_id = entry.get('id', '').split('/abs/')[-1]
 
                 paper = {
                     'arxiv_id': arxiv_id,
-                    'title': entry.find('atom:title', ns).text.strip().replace('\n', ' '),
-                    'abstract': entry.find('atom:summary', ns).text.strip()[:200] + '...',
-                    'published_date': entry.find('atom:published', ns).text.split('T')[0],
-                    'authors': [
-                        author.find('atom:name', ns).text
-                        for author in entry.findall('atom:author', ns)
-                    ][:3],  # First 3 authors
-                    'categories': [
-                        cat.get('term')
-                        for cat in entry.findall('atom:category', ns)
-                    ]
+                    'title': entry.get('title', '').strip().replace('\n', ' '),
+                    'abstract': entry.get('summary', '').strip()[:200] + '...',
+                    'published_date': entry.get('published', '').split('T')[0],
+                    'authors': entry['authors'][:3],  # First 3 authors
+                    'categories': entry['categories']
                 }
                 papers.append(paper)
 
@@ -188,12 +287,23 @@ if __name__ == "__main__":
     import sys
 
     if len(sys.argv) < 2:
-        print("Usage: python arxiv_fetcher.py <arxiv_id>")
+        print("Usage: python arxiv_fetcher.py <arxiv_id> [<arxiv_id> ...]")
         sys.exit(1)
 
-    arxiv_id = sys.argv[1]
     fetcher = ArxivFetcher()
 
+    if len(sys.argv) > 2:
+        # Batch mode: download every PDF in parallel
+        paths = fetcher.download_pdfs(sys.argv[1:])
+        failed = [i for i, path in paths.items() if path is None]
+        print(f"\n[OK] {len(paths) - len(failed)}/{len(paths)} PDFs saved to: {fetcher.output_dir}")
+        if failed:
+            print(f"Failed: {', '.join(failed)}")
+            sys.exit(1)
+        sys.exit(0)
+
+    arxiv_id = sys.argv[1]
+
     # Fetch metadata
     metadata = fetcher.fetch_metadata(arxiv_id)
     if metadata:
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Streaming Atom Parser for Alpha-Sight
+Yields arXiv API entries one at a time while the response is being read
+"""
+
+import xml.etree.ElementTree as ET
+from typing import BinaryIO, Dict, Iterator
+
+ATOM = "{http://www.w3.org/2005/Atom}"
+ARXIV = "{http://arxiv.org/schemas/atom}"
+
+_ENTRY = ATOM + "entry"
+_TEXT_FIELDS = {
+    ATOM + "id": "id",
+    ATOM + "title": "title",
+    ATOM + "summary": "summary",
+    ATOM + "published": "published",
+    ATOM + "updated": "updated",
+    ARXIV + "comment": "comment",
+    ARXIV + "journal_ref": "journal_ref",
+    ARXIV + "doi": "doi",
+}
+
+
+def _entry_to_dict(entry: ET.Element) -> Dict:
+    """Convert an <entry> element in a single pass over its children"""
+    data = {"authors": [], "categories": []}
+    for child in entry:
+        tag = child.tag
+        if tag in _TEXT_FIELDS:
+            data[_TEXT_FIELDS[tag]] = child.text or ""
+        elif tag == ATOM + "author":
+            for part in child:
+                if part.tag == ATOM + "name":
+                    data["authors"].append(part.text or "")
+        elif tag == ATOM + "category":
+            data["categories"].append(child.get("term"))
+        elif tag == ARXIV + "primary_category":
+            data["primary_category"] = child.get("term")
+    return data
+
+
+def iter_entries(source: BinaryIO) -> Iterator[Dict]:
+    """
+    Parse an arXiv Atom feed incrementally
+
+    Each entry is yielded as soon as its closing tag has been read, then
+    cleared so memory stays bounded by a single entry.
+
+    Args:
+        source: Binary file-like object (e.g. a streamed response.raw)
+
+    Yields:
+        Entry dictionaries with id, title, summary, published, updated,
+        authors, categories and, when present, primary_category, comment,
+        journal_ref and doi
+
+    Raises:
+        xml.etree.ElementTree.ParseError: If the feed is malformed
+    """
+    root = None
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = elem
+            continue
+        if elem.tag == _ENTRY:
+            yield _entry_to_dict(elem)
+            # Drop the processed entry (and feed header elements) from the tree
+            root.clear()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Author Index for Alpha-Sight
+Prebuilt lookup table mapping author name variants to signal authors
+"""
+
+import csv
+import json
+import os
+import re
+import unicodedata
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+INDEX_VERSION = 2
+
+_PUNCTUATION = re.compile(r"[.\-,'’‐_]+")
+_CJK = re.compile(r"[぀-ヿ㐀-䶿一-鿿가-힯]")
+
+
+def _strip_accents(text: str) -> str:
+    return "".join(ch for ch in unicodedata.normalize("NFD", text) if not unicodedata.combining(ch))
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize an author name to its lookup key
+
+    Casefolds, strips accents and punctuation, and collapses whitespace.
+    CJK names are joined without spaces ("张 伟" -> "张伟"); their characters
+    are kept whole, so Hangul syllables and kana voicing marks survive.
+
+    Args:
+        name: Author name as written
+
+    Returns:
+        Normalized key
+    """
+    text = "".join(ch if _CJK.match(ch) else _strip_accents(ch) for ch in unicodedata.normalize("NFKC", name))
+    text = _PUNCTUATION.sub(" ", text.casefold())
+    tokens = text.split()
+    if _CJK.search(text):
+        return "".join(tokens)
+    return " ".join(tokens)
+
+
+def name_variants(name: str) -> List[str]:
+    """
+    Generate the secondary lookup keys for a signal author
+
+    Args:
+        name: Signal author name
+
+    Returns:
+        Keys other than the primary normalized form: swapped given/family order
+        for two-part names and initials plus surname ("y lecun")
+    """
+    key = normalize_name(name)
+    tokens = key.split()
+    if len(tokens) < 2:
+        return []
+
+    variants = []
+    if len(tokens) == 2:
+        # Chinese, Japanese and Korean names are often written family name first
+        variants.append(f"{tokens[1]} {tokens[0]}")
+    initials = " ".join(t[0] for t in tokens[:-1])
+    variants.append(f"{initials} {tokens[-1]}")
+    return variants
+
+
+class AuthorIndex:
+    """Signal author matcher backed by a prebuilt variant index"""
+
+    def __init__(self, keys: Dict[str, str]):
+        """
+        Initialize author index
+
+        Args:
+            keys: Mapping of normalized key -> canonical signal author name
+        """
+        self.keys = keys
+        self.authors = set(keys.values())
+        # Raw name -> match result; each distinct name is normalized at most once
+        self._memo: Dict[str, Optional[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.authors)
+
+    @classmethod
+    def from_names(cls, names: Iterable[str]) -> "AuthorIndex":
+        """
+        Build the index from signal author names
+
+        Primary keys always win. A variant key shared by several authors is
+        ambiguous and dropped.
+
+        Args:
+            names: Signal author names
+
+        Returns:
+            AuthorIndex instance
+        """
+        names = [n.strip() for n in names if n and n.strip()]
+        keys = {}
+        for name in names:
+            keys.setdefault(normalize_name(name), name)
+
+        variants: Dict[str, str] = {}
+        ambiguous = set()
+        for name in names:
+            for variant in name_variants(name):
+                if variant in keys:
+                    continue
+                if variant in variants and variants[variant] != name:
+                    ambiguous.add(variant)
+                variants[variant] = name
+        for variant, name in variants.items():
+            if variant not in ambiguous:
+                keys[variant] = name
+
+        return cls(keys)
+
+    @classmethod
+    def load(cls, signal_file: str, index_file: Optional[str] = None) -> "AuthorIndex":
+        """
+        Load the index for a signal CSV, rebuilding it when the CSV has changed
+
+        Args:
+            signal_file: Signal CSV with a 'name' column
+            index_file: Index path (default: <signal_file>.author_index.json)
+
+        Returns:
+            AuthorIndex instance
+        """
+        signal_path = Path(signal_file)
+        index_path = Path(index_file) if index_file else signal_path.with_suffix(".author_index.json")
+        stat = signal_path.stat()
+        source = {"mtime": stat.st_mtime, "size": stat.st_size}
+
+        if index_path.exists():
+            try:
+                with open(index_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get("version") == INDEX_VERSION and data.get("source") == source:
+                    return cls(data["keys"])
+            except (OSError, ValueError, KeyError):
+                pass
+
+        with open(signal_path, 'r', encoding='utf-8-sig') as f:
+            index = cls.from_names(row.get('name') or "" for row in csv.DictReader(f))
+
+        tmp_path = index_path.with_suffix(index_path.suffix + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": INDEX_VERSION, "source": source, "keys": index.keys},
+                      f, ensure_ascii=False)
+        os.replace(tmp_path, index_path)
+        return index
+
+    def lookup(self, name: str) -> Optional[str]:
+        """
+        Find the signal author for one author name
+
+        Args:
+            name: Author name as returned by arXiv
+
+        Returns:
+            Canonical signal author name or None
+        """
+        try:
+            return self._memo[name]
+        except KeyError:
+            match = self.keys.get(normalize_name(name))
+            self._memo[name] = match
+            return match
+
+    def match(self, names: Iterable[str]) -> List[str]:
+        """
+        Match a paper's author list against the signal authors
+
+        Args:
+            names: Author names of one paper
+
+        Returns:
+            Matched canonical signal author names, in author order
+        """
+        matched = []
+        for name in names:
+            author = self.lookup(name)
+            if author and author not in matched:
+                matched.append(author)
+        return matched
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Bulk Report Generator for Alpha-Sight
+Regenerates many reports at once from the index and per-paper JSON inputs
+"""
+
+import sys
+import io
+import os
+import json
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from index_manager import open_index
+from report_generator import ReportGenerator, _atomic_write
+
+# Fix Windows console encoding issue
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+INPUT_KINDS = ("metadata", "analysis", "reproduction", "citations")
+
+# Generator of a worker process, created by _init_worker
+_worker_generator: Optional[ReportGenerator] = None
+
+
+def _init_worker(skill_path: str):
+    global _worker_generator
+    _worker_generator = ReportGenerator(skill_path)
+
+
+def _render_jobs(jobs: List[Dict]) -> List[Tuple[str, Optional[str]]]:
+    """
+    Render and write a chunk of reports (runs in a worker process)
+
+    Returns:
+        (arxiv_id, error message or None) per job
+    """
+    results = []
+    for job in jobs:
+        try:
+            report = _worker_generator.generate_report(job["arxiv_id"], **job["inputs"],
+                                                       language=job["language"], depth=job["depth"])
+            output_path = Path(job["output"])
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            _atomic_write(output_path, report)
+            results.append((job["arxiv_id"], None))
+        except Exception as e:
+            results.append((job["arxiv_id"], f"{type(e).__name__}: {e}"))
+    return results
+
+
+class BulkReportGenerator:
+    """Regenerate reports for many papers, skipping those whose inputs are unchanged"""
+
+    def __init__(self, index_path: Optional[str] = None, input_dir: Optional[str] = None,
+                 output_dir: Optional[str] = None, skill_path: Optional[str] = None,
+                 workers: Optional[int] = None, batch_size: int = 200, chunk_size: int = 25):
+        """
+        Initialize bulk generator
+
+        Args:
+            index_path: index.json or SQLite index supplying paper entries (default: project index)
+            input_dir: Directory of {arxiv_id}_{metadata|analysis|reproduction|citations}.json
+                files; these override what the index holds (optional)
+            output_dir: Reports directory (default: ./alpha-sight/reports)
+            skill_path: Path to alpha-sight skill directory (optional)
+            workers: Rendering processes (default: CPU count; 1 renders in this process)
+            batch_size: Papers whose inputs are loaded at a time
+            chunk_size: Reports sent to a worker per task
+        """
+        if output_dir is None:
+            # Get project root (4 levels up from scripts directory)
+            project_root = Path(__file__).parent.parent.parent.parent
+            output_dir = project_root / "alpha-sight" / "reports"
+        self.index = open_index(index_path)
+        self.input_dir = Path(input_dir) if input_dir else None
+        self.output_dir = Path(output_dir)
+        self.generator = ReportGenerator(skill_path)
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+
+    def select(self, arxiv_ids: Optional[List[str]] = None, **query) -> List[str]:
+        """
+        Pick the papers to generate reports for
+
+        Args:
+            arxiv_ids: Explicit IDs; if omitted, IDs come from the index
+            **query: Filters passed to the index's query() (tags, categories,
+                date_from, date_to, limit)
+
+        Returns:
+            arXiv IDs in index order (or the given order)
+        """
+        if arxiv_ids:
+            return list(dict.fromkeys(arxiv_ids))
+        return [paper["arxiv_id"] for paper in self.index.query(sort_by='index', **query)]
+
+    def _read_json(self, path: Path) -> Optional[Dict]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _load_inputs(self, arxiv_ids: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Load the report inputs of a batch of papers
+
+        Returns:
+            arxiv_id -> {metadata, analysis, reproduction, citations}, or None
+            when there is no metadata for the paper
+        """
+        loaded = {}
+        for arxiv_id in arxiv_ids:
+            entry = self.index.get_paper(arxiv_id)
+            if entry is None:
+                loaded[arxiv_id] = {kind: None for kind in INPUT_KINDS}
+                continue
+            citations = entry.get("citations")
+            loaded[arxiv_id] = {
+                "metadata": entry,
+                "analysis": entry.get("analysis"),
+                "reproduction": entry.get("reproduction"),
+                "citations": {"citation_count": citations.get("cited_by_count", 0)} if citations else None,
+            }
+
+        if self.input_dir is not None:
+            paths = [(arxiv_id, kind, self.input_dir / f"{arxiv_id}_{kind}.json")
+                     for arxiv_id in arxiv_ids for kind in INPUT_KINDS]
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                for (arxiv_id, kind, _), data in zip(paths, pool.map(lambda p: self._read_json(p[2]), paths)):
+                    if data is not None:
+                        loaded[arxiv_id][kind] = data
+
+        return {arxiv_id: inputs if inputs["metadata"] is not None else None
+                for arxiv_id, inputs in loaded.items()}
+
+    def generate(self, arxiv_ids: List[str], language: str = "english", depth: str = "medium",
+                 force: bool = False) -> Dict:
+        """
+        Generate reports for arxiv_ids
+
+        Args:
+            arxiv_ids: Papers to generate reports for
+            language: Report language
+            depth: Analysis depth
+            force: Regenerate even when inputs and template are unchanged
+
+        Returns:
+            Counts of written and skipped reports, and the IDs that were
+            missing or failed
+        """
+        manifest = self.generator.manifest(self.output_dir)
+        template = self.generator.compile_template(language)
+        stats = {"written": 0, "skipped": 0, "missing": [], "failed": []}
+        entries: Dict[str, Dict] = {}
+
+        def collect(results):
+            for arxiv_id, error in results:
+                if error is None:
+                    manifest.record(self.output_dir / f"{arxiv_id}_analysis.md", entries.pop(arxiv_id))
+                    stats["written"] += 1
+                else:
+                    entries.pop(arxiv_id, None)
+                    print(f"Failed to generate report for {arxiv_id}: {error}")
+                    stats["failed"].append(arxiv_id)
+
+        pool = None
+        if self.workers > 1:
+            pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                       initargs=(str(self.generator.skill_path),))
+        else:
+            _init_worker(str(self.generator.skill_path))
+        pending = set()
+        try:
+            for start in range(0, len(arxiv_ids), self.batch_size):
+                jobs = []
+                for arxiv_id, inputs in self._load_inputs(arxiv_ids[start:start + self.batch_size]).items():
+                    if inputs is None:
+                        stats["missing"].append(arxiv_id)
+                        continue
+                    output_path = self.output_dir / f"{arxiv_id}_analysis.md"
+                    entry = self.generator.manifest_entry(
+                        template, arxiv_id, inputs["metadata"], inputs["analysis"], inputs["reproduction"],
+                        inputs["citations"], language, depth)
+                    if not force and manifest.is_fresh(output_path, entry):
+                        stats["skipped"] += 1
+                        continue
+                    entries[arxiv_id] = entry
+                    jobs.append({"arxiv_id": arxiv_id, "inputs": inputs, "language": language,
+                                 "depth": depth, "output": str(output_path)})
+
+                for i in range(0, len(jobs), self.chunk_size):
+                    chunk = jobs[i:i + self.chunk_size]
+                    if pool is None:
+                        collect(_render_jobs(chunk))
+                        continue
+                    pending.add(pool.submit(_render_jobs, chunk))
+                    # Keep a bounded number of chunks in flight
+                    while len(pending) > 2 * self.workers:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            collect(future.result())
+
+            for future in pending:
+                collect(future.result())
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+            manifest.save()
+
+        return stats
+
+
+def main():
+    """Command-line interface"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate analysis reports for many papers")
+    parser.add_argument("arxiv_ids", nargs="*", help="arXiv IDs (default: papers selected from the index)")
+    parser.add_argument("--all", action="store_true", help="Every paper in the index")
+    parser.add_argument("--tag", action="append", dest="tags", help="Index papers with this tag (repeatable)")
+    parser.add_argument("--category", action="append", dest="categories",
+                        help="Index papers in this category (repeatable)")
+    parser.add_argument("--since", dest="date_from", help="Analyzed on or after this date (e.g. 2024-03)")
+    parser.add_argument("--until", dest="date_to", help="Analyzed on or before this date (e.g. 2024-03-31)")
+    parser.add_argument("--limit", type=int, help="At most this many papers from the index")
+    parser.add_argument("--index", help="index.json or SQLite index (default: project index)")
+    parser.add_argument("--input-dir", help="Directory of {arxiv_id}_{metadata|analysis|reproduction|citations}.json")
+    parser.add_argument("--output-dir", help="Reports directory (default: ./alpha-sight/reports)")
+    parser.add_argument("--language", choices=["english", "chinese"], default="english",
+                        help="Report language (default: english)")
+    parser.add_argument("--depth", choices=["shallow", "medium", "deep"], default="medium",
+                        help="Analysis depth (default: medium)")
+    parser.add_argument("--workers", type=int, help="Rendering processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Regenerate reports even if unchanged")
+    parser.add_argument("--skill-path", help="Path to alpha-sight skill directory (optional)")
+    args = parser.parse_args()
+
+    query = {k: v for k, v in (("tags", args.tags), ("categories", args.categories), ("date_from", args.date_from),
+                               ("date_to", args.date_to), ("limit", args.limit)) if v}
+    if not (args.arxiv_ids or args.all or query):
+        parser.error("give arXiv IDs, --all, or an index filter (--tag, --category, --since, --until)")
+
+    bulk = BulkReportGenerator(index_path=args.index, input_dir=args.input_dir, output_dir=args.output_dir,
+                               skill_path=args.skill_path, workers=args.workers)
+    arxiv_ids = bulk.select(args.arxiv_ids, **query)
+    print(f"Generating {len(arxiv_ids)} reports ({args.language}, {args.depth})...")
+    stats = bulk.generate(arxiv_ids, language=args.language, depth=args.depth, force=args.force)
+
+    print(f"\n✓ Written: {stats['written']}, unchanged: {stats['skipped']}")
+    if stats["missing"]:
+        print(f"No metadata for: {', '.join(stats['missing'])}")
+    if stats["failed"]:
+        print(f"✗ Failed: {', '.join(stats['failed'])}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Citation Graph Crawler for Alpha-Sight
+Bounded BFS over Semantic Scholar citations and references around seed papers
+"""
+
+import sys
+import io
+import heapq
+import json
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import requests
+
+from semantic_scholar_fetcher import SemanticScholarFetcher
+
+# Fix Windows console encoding issue
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+NODE_FIELDS = ["paperId", "title", "year", "citationCount", "influentialCitationCount", "externalIds"]
+
+
+class GraphStore:
+    """SQLite adjacency store for a crawl: nodes, edges and expansion state"""
+
+    def __init__(self, db_path: str):
+        """
+        Open or create a graph store
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS nodes (
+                paper_id TEXT PRIMARY KEY,
+                arxiv_id TEXT,
+                title TEXT,
+                year INTEGER,
+                citation_count INTEGER,
+                influential_count INTEGER,
+                depth INTEGER NOT NULL,
+                expanded INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE TABLE IF NOT EXISTS edges (
+                citing TEXT NOT NULL,
+                cited TEXT NOT NULL,
+                PRIMARY KEY (citing, cited)
+            );
+            CREATE INDEX IF NOT EXISTS edges_cited ON edges (cited);
+            """
+        )
+        self._conn.commit()
+
+    def node_count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM nodes").fetchone()[0]
+
+    def edge_count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM edges").fetchone()[0]
+
+    def has_node(self, paper_id: str) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM nodes WHERE paper_id = ?", (paper_id,)).fetchone() is not None
+
+    def pending(self, max_depth: int) -> List[Tuple[str, int, int]]:
+        """Return (paper_id, depth, influential_count) of nodes still to expand"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT paper_id, depth, influential_count FROM nodes WHERE expanded = 0 AND depth < ?",
+                (max_depth,)
+            ).fetchall()
+
+    def add_nodes(self, papers: List[Dict], depth: int) -> List[Dict]:
+        """
+        Insert papers not yet in the graph
+
+        Args:
+            papers: Paper objects with NODE_FIELDS
+            depth: Hop distance from the seeds
+
+        Returns:
+            The papers that were new
+        """
+        added = []
+        with self._lock, self._conn:
+            for paper in papers:
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO nodes (paper_id, arxiv_id, title, year, citation_count, "
+                    "influential_count, depth) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (paper["paperId"], (paper.get("externalIds") or {}).get("ArXiv"), paper.get("title"),
+                     paper.get("year"), paper.get("citationCount") or 0,
+                     paper.get("influentialCitationCount") or 0, depth)
+                )
+                if cursor.rowcount:
+                    added.append(paper)
+        return added
+
+    def complete_expansion(self, paper_id: str, edges: List[Tuple[str, str]]):
+        """Record a node's edges and mark it expanded in one transaction"""
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR IGNORE INTO edges (citing, cited) VALUES (?, ?)", edges)
+            self._conn.execute("UPDATE nodes SET expanded = 1 WHERE paper_id = ?", (paper_id,))
+
+    def export(self) -> Dict:
+        """Return the whole graph as {"nodes": [...], "edges": [[citing, cited], ...]}"""
+        with self._lock:
+            self._conn.row_factory = sqlite3.Row
+            try:
+                nodes = [dict(row) for row in self._conn.execute(
+                    "SELECT * FROM nodes ORDER BY depth, influential_count DESC, paper_id")]
+            finally:
+                self._conn.row_factory = None
+            edges = [list(row) for row in self._conn.execute("SELECT citing, cited FROM edges ORDER BY citing, cited")]
+        return {"nodes": nodes, "edges": edges}
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+class CitationGraphCrawler:
+    """Bounded, resumable BFS over the Semantic Scholar citation graph"""
+
+    def __init__(self, fetcher: SemanticScholarFetcher, store: GraphStore,
+                 max_depth: int = 2, max_nodes: int = 1000, links_per_node: int = 100,
+                 workers: int = 4):
+        """
+        Initialize crawler
+
+        Args:
+            fetcher: Fetcher whose shared rate limiter paces every request
+            store: Adjacency store; an existing store resumes its crawl
+            max_depth: Hops from the seeds to expand
+            max_nodes: Stop once the graph holds this many papers
+            links_per_node: Citations and references followed per paper and direction
+            workers: Nodes expanded concurrently
+        """
+        self.fetcher = fetcher
+        self.store = store
+        self.max_depth = max_depth
+        self.max_nodes = max_nodes
+        self.links_per_node = links_per_node
+        self.workers = workers
+        self.failed: List[str] = []
+
+        # Frontier ordered by depth (BFS), then by influential citations; the
+        # paperId tie-break keeps the order identical when a crawl is resumed
+        self._frontier: List[Tuple[int, int, str]] = []
+
+    def _push(self, paper_id: str, depth: int, influential: int):
+        if depth < self.max_depth:
+            heapq.heappush(self._frontier, (depth, -influential, paper_id))
+
+    def add_seeds(self, arxiv_ids: List[str]) -> List[str]:
+        """
+        Resolve seed papers and put them in the graph at depth 0
+
+        Args:
+            arxiv_ids: arXiv IDs of the seed papers
+
+        Returns:
+            arXiv IDs Semantic Scholar does not know; IDs whose lookup failed
+            are in neither the graph nor this list
+        """
+        found, not_found = self.fetcher.fetch_many(arxiv_ids, top_n=0)
+        self.store.add_nodes([{
+            "paperId": data["paper_id"],
+            "title": data["title"],
+            "year": data["year"],
+            "citationCount": data["citation_count"],
+            "influentialCitationCount": data["influential_citation_count"],
+            "externalIds": data["external_ids"],
+        } for data in found.values()], depth=0)
+        return not_found
+
+    def _neighbors(self, paper_id: str) -> Tuple[List[Dict], List[Dict]]:
+        """Fetch up to links_per_node citing and cited papers"""
+        page_size = min(self.links_per_node, 1000)
+        citing = list(islice(self.fetcher.iter_citations(paper_id, NODE_FIELDS, page_size), self.links_per_node))
+        cited = list(islice(self.fetcher.iter_references(paper_id, NODE_FIELDS, page_size), self.links_per_node))
+        return citing, cited
+
+    def _apply(self, paper_id: str, depth: int, citing: List[Dict], cited: List[Dict]):
+        """Add neighbors within the node budget and record edges among known papers"""
+        # A paper can both cite and be cited by this one; count it once against the budget
+        neighbors = {}
+        for paper in citing + cited:
+            if paper.get("paperId"):
+                neighbors.setdefault(paper["paperId"], paper)
+        room = self.max_nodes - self.store.node_count()
+        candidates = [p for p in neighbors.values() if not self.store.has_node(p["paperId"])]
+        # Spend the remaining budget on the most influential neighbors
+        candidates.sort(key=lambda p: p.get("influentialCitationCount") or 0, reverse=True)
+        for paper in self.store.add_nodes(candidates[:max(room, 0)], depth + 1):
+            self._push(paper["paperId"], depth + 1, paper.get("influentialCitationCount") or 0)
+
+        edges = [(p["paperId"], paper_id) for p in citing if p.get("paperId") and self.store.has_node(p["paperId"])]
+        edges += [(paper_id, p["paperId"]) for p in cited if p.get("paperId") and self.store.has_node(p["paperId"])]
+        self.store.complete_expansion(paper_id, edges)
+
+    def crawl(self) -> Dict[str, int]:
+        """
+        Expand the frontier until it is empty or the node budget is reached
+
+        Safe to interrupt: each node's edges and new neighbors are committed
+        together, and a later call continues with the unexpanded nodes.
+
+        Returns:
+            Crawl statistics
+        """
+        self._frontier = []
+        for paper_id, depth, influential in self.store.pending(self.max_depth):
+            self._push(paper_id, depth, influential or 0)
+
+        expanded = 0
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            while self._frontier and self.store.node_count() < self.max_nodes:
+                # Expand the best nodes of the current level concurrently
+                level = self._frontier[0][0]
+                batch = []
+                while self._frontier and self._frontier[0][0] == level and len(batch) < self.workers:
+                    batch.append(heapq.heappop(self._frontier))
+                futures = [(entry, pool.submit(self._neighbors, entry[2])) for entry in batch]
+
+                for entry, future in futures:
+                    depth, _, paper_id = entry
+                    if self.store.node_count() >= self.max_nodes:
+                        # Budget reached mid-batch: leave the rest for a later run
+                        heapq.heappush(self._frontier, entry)
+                        continue
+                    try:
+                        citing, cited = future.result()
+                    except (requests.RequestException, json.JSONDecodeError) as e:
+                        print(f"Failed to expand {paper_id}: {e}")
+                        self.failed.append(paper_id)
+                        continue
+                    self._apply(paper_id, depth, citing, cited)
+                    expanded += 1
+
+        return {
+            "expanded": expanded,
+            "nodes": self.store.node_count(),
+            "edges": self.store.edge_count(),
+            "frontier": len(self._frontier),
+            "failed": len(self.failed),
+        }
+
+
+def main():
+    """Command-line interface"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Crawl the citation neighborhood of seed papers")
+    parser.add_argument("arxiv_ids", nargs="+", help="Seed arXiv IDs")
+    parser.add_argument("--store", default="citation_graph.db", help="Adjacency store (resumed if it exists)")
+    parser.add_argument("--depth", type=int, default=2, help="Hops from the seeds (default: 2)")
+    parser.add_argument("--max-nodes", type=int, default=1000, help="Node budget (default: 1000)")
+    parser.add_argument("--links-per-node", type=int, default=100,
+                        help="Citations and references followed per paper (default: 100)")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent expansions (default: 4)")
+    parser.add_argument("--api-key", help="Semantic Scholar API key (optional)")
+    parser.add_argument("--output", help="Export the graph as JSON (optional)")
+    args = parser.parse_args()
+
+    store = GraphStore(args.store)
+    crawler = CitationGraphCrawler(SemanticScholarFetcher(api_key=args.api_key), store,
+                                   max_depth=args.depth, max_nodes=args.max_nodes,
+                                   links_per_node=args.links_per_node, workers=args.workers)
+    try:
+        if store.node_count() == 0:
+            not_found = crawler.add_seeds(args.arxiv_ids)
+            if not_found:
+                print(f"Seeds not found in Semantic Scholar: {', '.join(not_found)}")
+        else:
+            print(f"Resuming crawl from {args.store} ({store.node_count()} papers)")
+
+        stats = crawler.crawl()
+        print("\n=== Citation Graph ===")
+        print(f"Papers: {stats['nodes']}, Edges: {stats['edges']}, Expanded this run: {stats['expanded']}")
+        if stats["failed"]:
+            print(f"Failed expansions (retried on next run): {stats['failed']}")
+
+        if args.output:
+            output_path = Path(args.output)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(store.export(), f, indent=2, ensure_ascii=False)
+            print(f"\n✓ Graph saved to: {output_path}")
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
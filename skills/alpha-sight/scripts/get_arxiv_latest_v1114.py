@@ -1,84 +1,217 @@
 import arxiv
 import csv
-from datetime import datetime, timedelta
+import json
+from datetime import datetime, timedelta, timezone
 import time
 import os
 import requests
 from urllib.parse import urlencode
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+from author_index import AuthorIndex
+from rate_limiter import TokenBucket
+
+
+# arXiv 使用条款：每 3 秒不超过 1 个请求
+ARXIV_REQUEST_RATE = 1 / 3
+
+# 列表页抓取：并发数、缓存文件和提交数量的快速匹配模式
+ARXIV_LISTING_URL = "https://arxiv.org/list/{category}/{type}"
+LISTING_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+LISTING_WORKERS = 8
+LISTING_CACHE_FILE = ".arxiv_listing_cache.json"
+
+# 增量模式：每个类别的高水位文件，以及累积保存匹配论文的存储
+HIGH_WATER_FILE = ".arxiv_high_water.json"
+DELTA_STORE_FILE = "arxiv_signal_papers.jsonl"
+TOTAL_ENTRIES_PATTERN = re.compile(rb'Total of (\d+) entries')
+
+# 新鲜度探针：结论按 UTC 日期缓存；RSS 的 lastBuildDate 用来判断是否需要重新查询
+PROBE_CACHE_FILE = ".arxiv_probe_cache.json"
+PROBE_CATEGORY = "cs.AI"
+ARXIV_RSS_URL = "https://rss.arxiv.org/rss/{category}"
+LAST_BUILD_DATE_PATTERN = re.compile(rb'<lastBuildDate>\s*([^<]+?)\s*</lastBuildDate>')
+
+# 合并查询 (cat:A OR cat:B ...) 的最大长度，超过则拆分成多段查询
+MAX_QUERY_LENGTH = 1000
+
+# 计算机科学相关类别（包括交叉学科）
+CATEGORIES = [
+    # 主要AI/ML相关
+    "cs.AI", "cs.LG", "cs.CV", "cs.CL", "cs.NE", "cs.RO", "cs.IR",
+    # 系统和架构
+    "cs.DC", "cs.OS", "cs.AR", "cs.PF", "cs.NI",
+    # 软件工程和编程语言
+    "cs.SE", "cs.PL", "cs.LO", "cs.FL",
+    # 理论计算机科学
+    "cs.DS", "cs.CC", "cs.DM", "cs.GT", "cs.IT",
+    # 应用领域
+    "cs.DB", "cs.CR", "cs.GR", "cs.MM", "cs.HC", "cs.CY", "cs.ET",
+    # 数学计算
+    "cs.NA", "cs.MS", "cs.SC", "cs.CE",
+    # 其他
+    "cs.OH", "cs.SY",
+    # 交叉学科
+    "stat.ML", "math.OC", "math.ST", "eess.IV", "eess.SP", "eess.AS",
+    "econ.EM", "q-bio.QM", "physics.data-an"
+]
 
 
 def load_signal_authors(file_path):
-    """加载信号源看板中的作者名单"""
-    authors = set()
+    """加载信号源看板中的作者名单
+
+    返回预先构建的作者索引（大小写、重音、姓名缩写、姓名顺序等变体都映射到信号源作者），
+    索引保存在信号源文件旁边，文件未变化时直接加载。
+    """
     try:
-        with open(file_path, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row.get('name'):
-                    author_name = row['name'].strip().title()
-                    authors.add(author_name)
+        return AuthorIndex.load(file_path)
     except Exception as e:
         print(f"⚠️ 加载信号源文件出错: {e}")
-    return authors
+        return AuthorIndex({})
+
+class ListingCache:
+    """列表页的 ETag/Last-Modified 缓存，保存在磁盘上供下次条件请求使用"""
+
+    def __init__(self, path=LISTING_CACHE_FILE):
+        self.path = path
+        self.lock = threading.Lock()
+        self.entries = {}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠️ 读取列表页缓存出错，忽略缓存: {e}")
+
+    def get(self, url):
+        with self.lock:
+            return self.entries.get(url)
+
+    def put(self, url, response, count):
+        """记录响应的校验头和解析出的数量；服务器没有给校验头时不缓存"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        with self.lock:
+            self.entries[url] = {'etag': etag, 'last_modified': last_modified, 'count': count}
+
+    def save(self):
+        with self.lock:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+
+
+def create_listing_session(pool_size=LISTING_WORKERS):
+    """创建抓取列表页共用的 Session，连接池大小与并发数一致"""
+    session = requests.Session()
+    session.headers['User-Agent'] = LISTING_USER_AGENT
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
 
-def get_daily_submission_count(category, type):
-    """获取指定类别的新提交论文数量"""
+
+def parse_submission_count(content):
+    """从列表页中解析提交数量，返回 (数量, 是否为备用计数)，失败返回 (None, False)"""
+    # 先在原始字节上做正则预扫描，绝大多数页面不需要构建完整的 DOM
+    match = TOTAL_ENTRIES_PATTERN.search(content)
+    if match:
+        return int(match.group(1)), False
+
+    soup = BeautifulSoup(content, 'html.parser')
+
+    # 查找"Total of XX entries"文本
+    total_text = soup.find(string=re.compile(r'Total of \d+ entries'))
+    if total_text:
+        match = re.search(r'Total of (\d+) entries', total_text)
+        if match:
+            return int(match.group(1)), False
+
+    # 如果没找到，尝试备用方法
+    dd_tags = soup.find_all('dd')
+    if dd_tags:
+        return len(dd_tags), True
+
+    return None, False
+
+
+def get_daily_submission_count(category, type, session=None, cache=None):
+    """获取指定类别的新提交论文数量
+
+    有缓存时发送条件请求（If-None-Match / If-Modified-Since），页面未变化时服务器返回 304，
+    直接使用缓存的数量。
+    """
     try:
-        url = f"https://arxiv.org/list/{category}/{type}"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
+        url = ARXIV_LISTING_URL.format(category=category, type=type)
+        session = session or create_listing_session(pool_size=1)
+
+        headers = {}
+        cached = cache.get(url) if cache else None
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        response = session.get(url, headers=headers, timeout=10)
+
         if response.status_code == 429:
             retry = int(response.headers.get("Retry-After", 10))
-            print(f"⏳ 被限流，等待 {retry} 秒后重试...")
+            print(f"⏳ {category}: 被限流，等待 {retry} 秒后重试...")
             time.sleep(retry)
-            response = requests.get(url, headers=headers, timeout=10)
+            response = session.get(url, headers=headers, timeout=10)
 
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # 查找"Total of XX entries"文本
-        total_text = soup.find(string=re.compile(r'Total of \d+ entries'))
-        if total_text:
-            # 提取数字
-            match = re.search(r'Total of (\d+) entries', total_text)
-            if match:
-                count = int(match.group(1))
-                print(f"   📊 {category}: {count} 篇新提交")
-                return count
-        
-        # 如果没找到，尝试备用方法
-        dd_tags = soup.find_all('dd')
-        if dd_tags:
-            count = len(dd_tags)
+        if response.status_code == 304 and cached:
+            print(f"   📊 {category}: {cached['count']} 篇新提交 (未变化，使用缓存)")
+            return cached['count']
+
+        response.raise_for_status()
+
+        count, is_fallback = parse_submission_count(response.content)
+        if count is None:
+            print(f"   ⚠️ {category}: 无法获取提交数量")
+            return 0
+
+        if is_fallback:
             print(f"   📊 {category}: ~{count} 篇新提交 (备用计数)")
-            return count
-            
-        print(f"   ⚠️ {category}: 无法获取提交数量")
-        return 0
+        else:
+            print(f"   📊 {category}: {count} 篇新提交")
+            if cache:
+                cache.put(url, response, count)
+        return count
         
     except Exception as e:
         print(f"   ❌ {category}: 获取提交数量失败 - {e}")
         return 0
 
-def get_category_submission_counts(categories, type):
-    """批量获取所有类别的当天提交数量"""
+def get_category_submission_counts(categories, type, max_workers=LISTING_WORKERS, session=None):
+    """批量获取所有类别的当天提交数量（有限并发 + 条件请求缓存）"""
     print("🔍 获取各类别当天新提交数量...")
     category_counts = {}
-    total_count = 0
-    
-    for category in categories:
-        count = get_daily_submission_count(category, type)
-        category_counts[category] = count
-        total_count += count
-        time.sleep(0.5)  # 避免请求过于频繁
-    
+    session = session or create_listing_session(pool_size=max_workers)
+    cache = ListingCache()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(get_daily_submission_count, category, type, session, cache): category
+            for category in categories
+        }
+        for future in as_completed(futures):
+            category_counts[futures[future]] = future.result()
+
+    try:
+        cache.save()
+    except OSError as e:
+        print(f"⚠️ 保存列表页缓存出错: {e}")
+
+    total_count = sum(category_counts.values())
     print(f"📈 总计: {total_count} 篇新提交论文")
     return category_counts, total_count
 
@@ -114,87 +247,37 @@ def format_arxiv_url(entry_id):
     return f"https://arxiv.org/abs/{paper_id}"
 
 
-def _ping_arxiv():
-    """只测连通性，不测数据量"""
-    try:
-        h = {"User-Agent": "QijiFetcher/1.0 (contact: youremail@example.com)"}
-        r = requests.get(
-            "https://export.arxiv.org/api/query",
-            params={"search_query": "all:ai", "max_results": 1},
-            headers=h, timeout=20
-        )
-        return r.status_code == 200
-    except Exception:
-        return False
-
-def test_arxiv_connection():
-    """测试 arXiv：使用日期范围查询最新论文"""
-    try:
-        print("🔍 测试arXiv连接...")
-        os.environ["ARXIV_USER_AGENT"] = "QijiFetcher/1.0 (contact: youremail@example.com)"
-        if not _ping_arxiv():
-            print("❌ 连通性测试失败（无法获得 200）")
-            return False
-
-        import arxiv
-        client = arxiv.Client(page_size=5, delay_seconds=5, num_retries=8)
-        
-        # 使用日期范围查询最近3天的论文
-        today = datetime.now().date()
-        start_date = today - timedelta(days=3)
-        date_query = f"submittedDate:[{start_date.strftime('%Y%m%d')}0000 TO {today.strftime('%Y%m%d')}2359]"
-        
-        search = arxiv.Search(
-            query=f"cat:cs.AI AND {date_query}",
-            max_results=5,
-            sort_by=arxiv.SortCriterion.SubmittedDate,
-            sort_order=arxiv.SortOrder.Descending
-        )
-        results = list(client.results(search))
-        if results:
-            print("✅ arXiv连接正常（拿到最新结果）")
-            latest_paper = results[0]
-            print(f"   最新论文示例: {latest_paper.title[:50]}...")
-            print(f"   发布日期: {latest_paper.published.date()}")
-            print(f"   更新日期: {latest_paper.updated.date()}")
-        else:
-            print("⚠️ 连接正常，但最近3天没有 cs.AI 论文")
+def test_arxiv_connection(probe=None):
+    """测试 arXiv：复用新鲜度探针的 1 条结果查询，今天已探测成功时不再发请求"""
+    print("🔍 测试arXiv连接...")
+    probe = probe or create_probe()
+    cached = probe.cached_latest()
+    if cached:
+        print(f"✅ arXiv连接正常（今天已探测，最新论文提交于 {cached}）")
         return True
-    except Exception as e:
-        print(f"❌ arXiv连接测试失败（异常）：{e}")
+
+    latest = probe.latest_date()
+    if latest is None:
+        print("❌ arXiv连接测试失败（未拿到最新论文）")
         return False
+    print(f"✅ arXiv连接正常（最新论文提交于 {latest}）")
+    return True
 
 
-def probe_api_batch_top_dates(start_date, end_date):
-    """批次探针：使用日期范围查询确认能否获取到指定日期的论文"""
-    try:
-        client = arxiv.Client(page_size=10, delay_seconds=3.2)
-        
-        # 构造日期范围查询
-        date_query = f"submittedDate:[{start_date.strftime('%Y%m%d')}0000 TO {end_date.strftime('%Y%m%d')}2359]"
-        
-        search = arxiv.Search(
-            query=f"cat:cs.AI AND {date_query}",
-            sort_by=arxiv.SortCriterion.SubmittedDate,
-            sort_order=arxiv.SortOrder.Descending,
-            max_results=5
-        )
-        top = []
-        for r in client.results(search):
-            top.append((r.published.date().isoformat(), r.title[:60]))
-        
-        if top:
-            print("🧪 API 顶部5条论文日期：")
-            for d, t in top:
-                print("   ", d, "|", t)
-            return [d for d, _ in top]
-        else:
-            print("⚠️ 指定日期范围内没有找到论文")
-            return []
-            
-    except Exception as e:
-        print(f"❌ 批次探针失败: {e}")
+def probe_api_batch_top_dates(start_date, end_date=None, *, probe=None):
+    """批次探针：确认 API 是否已有 start_date 及之后提交的论文
+
+    返回 [最新提交日期]，探测失败时返回空列表，供 should_proceed_today() 判断。
+    end_date 只为兼容旧的调用方式而保留：探针查看的是最新提交，不再按日期范围查询。
+    """
+    probe = probe or create_probe()
+    sent = probe.requests
+    latest = probe.latest_date(start_date)
+    if latest is None:
         return []
+    source = "今日缓存，未发请求" if probe.requests == sent else f"{probe.requests - sent} 个请求"
+    print(f"🧪 {probe.category} 最新论文提交日期：{latest}（{source}）")
+    return [latest]
 
 def should_proceed_today(latest_dates_iso, expect_floor):
     """
@@ -219,187 +302,724 @@ def should_proceed_today(latest_dates_iso, expect_floor):
         print(f"⚠️ 解析日期时出错: {e}，继续执行")
         return True
 
-def get_latest_papers(signal_authors, start_date, end_date, category_counts=None):
-    """获取最新论文的核心函数 - 使用日期范围查询"""
-    
+class RateLimitedClient(arxiv.Client):
+    """所有 API 请求先从共享令牌桶取令牌，多个线程共用一个全局速率"""
+
+    def __init__(self, limiter, page_size=100, num_retries=5):
+        # 速率由令牌桶统一控制，关闭 arxiv.Client 自带的单客户端延时
+        super().__init__(page_size=page_size, delay_seconds=0, num_retries=num_retries)
+        self.limiter = limiter
+        self.pages = 0
+        self.bytes_received = 0
+        self._session.hooks['response'].append(self._count_response)
+
+    def _count_response(self, response, *args, **kwargs):
+        """统计实际请求的页数和下载字节数"""
+        self.pages += 1
+        self.bytes_received += len(response.content)
+
+    def _parse_feed(self, url, first_page=True, _try_index=0):
+        # 重试时 arxiv.Client 会递归调用 _parse_feed，因此每次重试也会消耗令牌
+        self.limiter.acquire()
+        return super()._parse_feed(url, first_page=first_page, _try_index=_try_index)
+
+
+class FreshnessProbe:
+    """每日抓取前的新鲜度探针
+
+    用 1 条结果的查询取类别中最新提交论文的日期，结论按 UTC 日期缓存在磁盘上：
+    当天已看到足够新的论文时，重复运行直接使用缓存，不发任何请求；
+    结论是"尚未更新"时，下次先对 RSS 发条件请求，lastBuildDate 没变就沿用结论，
+    变了才重新查询 API。查询走爬虫的 RateLimitedClient（共享令牌桶），RSS 走列表页 Session。
+    """
+
+    def __init__(self, client, session=None, path=PROBE_CACHE_FILE, category=PROBE_CATEGORY):
+        self.client = client
+        self.session = session or create_listing_session()
+        self.path = path
+        self.category = category
+        self.requests = 0  # 探针实际发出的请求数
+        self.checked = False  # 本次运行是否已经探测过
+        self.state = {}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.state = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠️ 读取探针缓存出错，忽略: {e}")
+
+    @staticmethod
+    def _today():
+        return datetime.now(timezone.utc).date().isoformat()
+
+    def cached_latest(self):
+        """今天（UTC）已探测到的最新提交日期，没有时返回 None"""
+        if self.state.get('day') == self._today():
+            return self.state.get('latest')
+        return None
+
+    def latest_date(self, expect_floor=None):
+        """返回最新提交论文的日期（ISO 字符串），探测失败返回 None
+
+        expect_floor: 期望至少看到的日期；今天缓存的结论已满足时直接返回
+        """
+        latest = self.cached_latest()
+        floor = expect_floor.isoformat() if expect_floor else None
+        if latest and (self.checked or floor is None or latest >= floor):
+            return latest
+
+        # 先取 RSS 的 lastBuildDate 作为基准，再查询 API，避免两者之间的更新被漏掉
+        cached_feed = self.state.get('feed') if latest else None
+        feed = self._fetch_feed(cached_feed)
+        if (latest and feed and cached_feed and feed.get('last_build')
+                and feed['last_build'] == cached_feed.get('last_build')):
+            self.checked = True
+            return latest
+
+        latest = self._query_latest()
+        if latest is None:
+            return None
+        self.state = {'day': self._today(), 'latest': latest, 'feed': feed}
+        self.checked = True
+        self._save()
+        return latest
+
+    def _query_latest(self):
+        """1 条结果的查询：类别中最新提交论文的日期"""
+        search = arxiv.Search(
+            query=f"cat:{self.category}",
+            max_results=1,
+            sort_by=arxiv.SortCriterion.SubmittedDate,
+            sort_order=arxiv.SortOrder.Descending
+        )
+        self.requests += 1
+        try:
+            result = next(self.client.results(search), None)
+        except Exception as e:
+            print(f"❌ 探针查询失败: {e}")
+            return None
+        return result.published.date().isoformat() if result else None
+
+    def _fetch_feed(self, cached):
+        """取 RSS 的 lastBuildDate 和校验头；有缓存时发条件请求，304 时返回缓存"""
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        self.requests += 1
+        try:
+            response = self.session.get(ARXIV_RSS_URL.format(category=self.category),
+                                        headers=headers, timeout=10)
+            if response.status_code == 304 and cached:
+                return cached
+            response.raise_for_status()
+        except requests.RequestException as e:
+            print(f"⚠️ 获取 RSS 出错: {e}")
+            return None
+        match = LAST_BUILD_DATE_PATTERN.search(response.content)
+        return {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'last_build': match.group(1).decode('utf-8', 'replace') if match else None
+        }
+
+    def _save(self):
+        try:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.state, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠️ 保存探针缓存出错: {e}")
+
+
+def create_probe(limiter=None, session=None, path=PROBE_CACHE_FILE):
+    """创建新鲜度探针；传入爬虫的令牌桶，探针的请求也计入全局速率"""
+    client = RateLimitedClient(limiter or TokenBucket(ARXIV_REQUEST_RATE), page_size=1, num_retries=3)
+    return FreshnessProbe(client, session, path)
+
+
+class HighWaterMarks:
+    """每个类别（或合并查询段）已见过的最新论文（submittedDate 和 entry_id），跨运行持久化"""
+
+    def __init__(self, path=HIGH_WATER_FILE):
+        self.path = path
+        self.lock = threading.Lock()
+        self.marks = {}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.marks = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠️ 读取高水位文件出错，忽略: {e}")
+
+    def get(self, key):
+        """返回 {'published', 'entry_id'}，没有记录时返回 None"""
+        with self.lock:
+            return self.marks.get(key)
+
+    def advance(self, key, published, entry_id):
+        """只有更新的论文才会推进高水位"""
+        with self.lock:
+            current = self.marks.get(key)
+            if current and current['published'] >= published:
+                return
+            self.marks[key] = {'published': published, 'entry_id': entry_id}
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.marks, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+
+
+class CrawlState:
+    """并发抓取时各类别共享的去重与统计状态
+
+    匹配到的论文不保存在内存中，而是逐条追加到 JSONL spool 文件并立即刷盘；
+    spool 已存在时（上次运行中断）先恢复其中的论文，避免重复写入。
+
+    checkpoint_file 记录每个类别（或合并查询段）已处理到的偏移和最新 entry_id，
+    以及 processed_papers 和统计信息，重跑时跳过已完成的类别、从偏移继续未完成的类别。
+    论文的登记与 spool 追加在同一把锁内完成，保存 checkpoint 前先 fsync spool，
+    因此 checkpoint 中已处理的匹配论文一定已经落盘。
+    """
+
+    def __init__(self, spool_file, checkpoint_file=None, high_water=None):
+        self.lock = threading.Lock()
+        self.total_papers = 0
+        self.matched_papers = 0
+        self.resumed_papers = 0
+        self.date_stats = {}
+        self.category_stats = {}
+        self.processed_papers = set()
+        self.progress = {}
+        self.spool_file = spool_file
+        self.checkpoint_file = checkpoint_file
+        self.high_water = high_water
+        if os.path.exists(spool_file):
+            self._resume_spool()
+        if checkpoint_file and os.path.exists(checkpoint_file):
+            self._load_checkpoint()
+        self.spool = open(spool_file, 'a', encoding='utf-8')
+
+    def _resume_spool(self):
+        """读取上次中断留下的 spool，丢弃末尾写了一半的行"""
+        valid_end = 0
+        with open(self.spool_file, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    paper = json.loads(line)
+                except ValueError:
+                    break
+                self.processed_papers.add(paper['id'])
+                self.matched_papers += 1
+                valid_end += len(line)
+        if valid_end < os.path.getsize(self.spool_file):
+            with open(self.spool_file, 'r+b') as f:
+                f.truncate(valid_end)
+        self.resumed_papers = self.matched_papers
+
+    def _load_checkpoint(self):
+        """恢复上次中断时的类别进度、已处理论文和统计"""
+        try:
+            with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ 读取 checkpoint 出错，从头开始: {e}")
+            return
+        self.progress = data.get('progress', {})
+        self.processed_papers.update(data.get('processed_papers', []))
+        self.total_papers = data.get('total_papers', 0)
+        self.date_stats = data.get('date_stats', {})
+        self.category_stats = data.get('category_stats', {})
+
+    def _save_checkpoint(self):
+        """先把 spool 刷到磁盘，再原子地写入 checkpoint（调用方需持有 self.lock）"""
+        if not self.checkpoint_file:
+            return
+        self.spool.flush()
+        os.fsync(self.spool.fileno())
+        data = {
+            'progress': self.progress,
+            'processed_papers': list(self.processed_papers),
+            'total_papers': self.total_papers,
+            'date_stats': self.date_stats,
+            'category_stats': self.category_stats
+        }
+        tmp_path = f"{self.checkpoint_file}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.checkpoint_file)
+
+    def progress_for(self, key):
+        """返回某个类别（或合并查询段）的进度 {'offset', 'newest_entry_id', 'done'}"""
+        with self.lock:
+            return dict(self.progress.get(key, {}))
+
+    def record_progress(self, key, offset, newest_entry_id, newest_published):
+        """记录已处理到的偏移和本次见到的最新论文，并保存 checkpoint"""
+        with self.lock:
+            self.progress[key] = {
+                'offset': offset,
+                'newest_entry_id': newest_entry_id,
+                'newest_published': newest_published,
+                'done': False
+            }
+            self._save_checkpoint()
+
+    def mark_done(self, key):
+        """标记类别已完成并保存 checkpoint；完整抓取后才推进高水位"""
+        with self.lock:
+            progress = self.progress.setdefault(key, {})
+            progress['done'] = True
+            self._save_checkpoint()
+        if self.high_water and progress.get('newest_published'):
+            self.high_water.advance(key, progress['newest_published'], progress['newest_entry_id'])
+
+    def claim(self, paper_id, pub_date, primary_category, paper_data=None):
+        """登记一篇论文并更新统计，匹配到的论文（paper_data）同时追加到 spool；
+        已被其他类别处理过则返回 False"""
+        with self.lock:
+            if paper_id in self.processed_papers:
+                return False
+            if paper_data is not None:
+                self.spool.write(json.dumps(paper_data, ensure_ascii=False) + '\n')
+                self.spool.flush()
+                self.matched_papers += 1
+            self.processed_papers.add(paper_id)
+            date_str = pub_date.strftime("%Y-%m-%d")
+            self.date_stats[date_str] = self.date_stats.get(date_str, 0) + 1
+            self.category_stats[primary_category] = self.category_stats.get(primary_category, 0) + 1
+            self.total_papers += 1
+            return True
+
+    def close(self):
+        self.spool.close()
+
+
+def write_csv_from_spool(spool_file, output_file):
+    """把 spool 中的匹配论文按发布日期排序（最新的在前）写成CSV，返回写入篇数
+
+    排序时内存中只保留 (发布日期, 行偏移)，写出时再逐行回读。
+    """
+    keys = []
+    with open(spool_file, 'rb') as spool:
+        offset = 0
+        for line in spool:
+            try:
+                keys.append((json.loads(line)['published_date'], -offset))
+            except (ValueError, KeyError):
+                pass
+            offset += len(line)
+
+        # 日期相同时保持写入顺序
+        keys.sort(reverse=True)
+
+        with open(output_file, mode='w', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            writer.writerow(["ID", "Title", "Authors", "Matched_Authors", "Published_Date","Primary_Category", "All_Categories", "Abstract", "Abstract_URL"])
+
+            for _, neg_offset in keys:
+                spool.seek(-neg_offset)
+                paper = json.loads(spool.readline())
+                writer.writerow([
+                    paper['id'],
+                    paper['title'],
+                    paper['authors'],
+                    paper['matched_authors'],
+                    paper['published_date'],
+                    paper['primary_category'],
+                    paper['all_categories'],
+                    paper['abstract'],
+                    paper['abs_url']
+                ])
+
+    return len(keys)
+
+
+def merge_spool_into_store(spool_file, store_file):
+    """把 spool 中的论文追加到累积存储（JSONL，按论文ID去重），返回新增篇数"""
+    known = set()
+    if os.path.exists(store_file):
+        with open(store_file, 'r', encoding='utf-8') as store:
+            for line in store:
+                try:
+                    known.add(json.loads(line)['id'])
+                except (ValueError, KeyError):
+                    continue
+
+    added = 0
+    with open(spool_file, 'r', encoding='utf-8') as spool, \
+            open(store_file, 'a', encoding='utf-8') as store:
+        for line in spool:
+            try:
+                paper_id = json.loads(line)['id']
+            except (ValueError, KeyError):
+                continue
+            if paper_id in known:
+                continue
+            known.add(paper_id)
+            store.write(line if line.endswith('\n') else line + '\n')
+            added += 1
+    return added
+
+
+def build_paper_data(result, paper_id, authors, matched_authors):
+    """把 arxiv.Result 转成写入CSV的论文数据
+
+    匹配在作者索引内部做标准化；CSV 中的作者名仍按原来的格式（title case）输出。
+    """
+    return {
+        'id': paper_id,
+        'title': result.title.strip().replace('\n', ' '),
+        'authors': ", ".join(normalize_author_name(a) for a in authors),
+        'matched_authors': ", ".join(normalize_author_name(a) for a in matched_authors),
+        'published_date': result.published.date().isoformat(),
+        'primary_category': result.primary_category,
+        'all_categories': ", ".join(result.categories),
+        'abstract': clean_abstract(result.summary),
+        'abs_url': format_arxiv_url(result.entry_id),
+        'has_match': True
+    }
+
+
+def resume_results(client, search, key, state, since=None):
+    """从 checkpoint 记录的偏移继续遍历搜索结果，每处理完一页保存一次进度
+
+    since 为高水位 {'published', 'entry_id'} 时，遇到上次见过的最新论文或更早的论文即停止。
+    """
+    progress = state.progress_for(key)
+    offset = progress.get('offset', 0)
+    newest_entry_id = progress.get('newest_entry_id')
+    newest_published = progress.get('newest_published')
+    if offset:
+        print(f"   [{key}] ♻️ 从偏移 {offset} 继续")
+
+    for result in client.results(search, offset=offset):
+        published = result.published.isoformat()
+        if since and (result.entry_id == since['entry_id'] or published < since['published']):
+            print(f"   [{key}] ⏹️ 已到达上次的高水位，停止")
+            break
+        if newest_entry_id is None:
+            newest_entry_id = result.entry_id
+            newest_published = published
+            state.record_progress(key, offset, newest_entry_id, newest_published)
+        yield result
+        # 调用方处理完这篇之后才会回到这里，偏移之前的结果都已处理
+        offset += 1
+        if offset % client.page_size == 0:
+            state.record_progress(key, offset, newest_entry_id, newest_published)
+
+
+def crawl_category(client, category, date_query, expected_count, signal_authors, state, since=None):
+    """抓取单个类别在日期范围内的论文，结果写入共享的 state（since 见 resume_results）"""
+    if state.progress_for(category).get('done'):
+        print(f"\n⏭️ 类别 {category} 已在上次运行中完成，跳过")
+        return 0, 0
+
+    print(f"\n🔍 查询类别: {category}")
+
+    # 关键修改：使用日期范围过滤
+    query = f"cat:{category} AND {date_query}"
+
+    # 根据预期数量调整查询上限
+    max_results = max(expected_count * 2, 200) if expected_count > 0 else 2000
+    print(f"   [{category}] 📊 预期论文数: {expected_count}, 查询上限: {max_results}")
+
+    search = arxiv.Search(
+        query=query,
+        sort_by=arxiv.SortCriterion.SubmittedDate,
+        sort_order=arxiv.SortOrder.Descending,
+        max_results=max_results
+    )
+
+    category_count = 0
+    category_matched = 0
+    processed_in_category = 0
+
+    for result in resume_results(client, search, category, state, since):
+        try:
+            pub_date = result.published.date()
+            paper_id = result.entry_id.split('/')[-1]
+            processed_in_category += 1
+
+            # 每处理50篇显示进度
+            if processed_in_category % 50 == 0:
+                print(f"   [{category}] 📊 已处理 {processed_in_category} 篇")
+
+            # 日期范围已经在查询中过滤了，这里直接处理
+            authors = [a.name for a in result.authors]
+
+            # 检查匹配的作者（索引查找，每个作者名只在首次出现时标准化）
+            matched_authors = signal_authors.match(authors)
+
+            # 只有匹配到信号源作者的论文才写入数据；已被其他类别处理过的（交叉列出的论文）跳过
+            paper_data = build_paper_data(result, paper_id, authors, matched_authors) if matched_authors else None
+            if not state.claim(paper_id, pub_date, result.primary_category, paper_data):
+                continue
+
+            if matched_authors:
+                category_matched += 1
+                print(f"   [{category}] ✅ [{pub_date}] 匹配: {', '.join(matched_authors)} | {result.title[:40]}...")
+
+            category_count += 1
+
+            # 如果已获取足够数量且有预期，可以提前结束
+            if expected_count > 0 and category_count >= expected_count * 1.5:
+                print(f"   [{category}] ✅ 已获取足够论文，提前结束")
+                break
+
+        except Exception as e:
+            print(f"   [{category}] ⚠️ 处理论文时出错: {e}")
+            continue
+
+    state.mark_done(category)
+    return category_count, category_matched
+
+
+def build_category_queries(categories, date_query, max_length=MAX_QUERY_LENGTH):
+    """把类别合并成 (cat:A OR cat:B ...) AND 日期 的查询，超长时拆分成多段
+
+    Returns:
+        [(该段包含的类别列表, 查询语句), ...]
+    """
+    def render(chunk):
+        return f"({' OR '.join(f'cat:{c}' for c in chunk)}) AND {date_query}"
+
+    queries = []
+    chunk = []
+    for category in categories:
+        if chunk and len(render(chunk + [category])) > max_length:
+            queries.append((chunk, render(chunk)))
+            chunk = []
+        chunk.append(category)
+    if chunk:
+        queries.append((chunk, render(chunk)))
+    return queries
+
+
+def sweep_categories(client, chunk, query, signal_authors, state, since=None):
+    """用一条合并查询遍历多个类别，再根据 result.categories 在本地分配类别
+
+    交叉列出的论文只下载和解析一次。
+
+    Returns:
+        (本段新处理的论文数, 匹配数, {类别: 命中论文数})
+    """
+    wanted = set(chunk)
+    category_hits = {category: 0 for category in chunk}
+    swept = 0
+    matched = 0
+
+    key = ",".join(chunk)
+    if state.progress_for(key).get('done'):
+        print(f"\n⏭️ 合并查询 [{key}] 已在上次运行中完成，跳过")
+        return swept, matched, category_hits
+
+    print(f"\n🔍 合并查询 {len(chunk)} 个类别")
+    print(f"🔎 查询语句: {query}")
+
+    # 不设上限：日期范围已经限定了结果集
+    search = arxiv.Search(
+        query=query,
+        sort_by=arxiv.SortCriterion.SubmittedDate,
+        sort_order=arxiv.SortOrder.Descending,
+        max_results=None
+    )
+
+    for result in resume_results(client, search, key, state, since):
+        try:
+            pub_date = result.published.date()
+            paper_id = result.entry_id.split('/')[-1]
+
+            authors = [a.name for a in result.authors]
+            matched_authors = signal_authors.match(authors)
+            paper_data = build_paper_data(result, paper_id, authors, matched_authors) if matched_authors else None
+
+            # 多段查询之间仍可能重复
+            if not state.claim(paper_id, pub_date, result.primary_category, paper_data):
+                continue
+
+            for category in wanted.intersection(result.categories):
+                category_hits[category] += 1
+
+            if matched_authors:
+                matched += 1
+                print(f"   ✅ [{pub_date}] 匹配: {', '.join(matched_authors)} | {result.title[:40]}...")
+
+            swept += 1
+            if swept % 500 == 0:
+                print(f"   📊 已处理 {swept} 篇")
+
+        except Exception as e:
+            print(f"   ⚠️ 处理论文时出错: {e}")
+            continue
+
+    state.mark_done(key)
+    return swept, matched, category_hits
+
+
+def report_sweep_savings(category_hits, page_size, pages, bytes_received, entries):
+    """估算逐类别查询需要的页数和字节数，与合并查询的实际消耗对比"""
+    if not entries:
+        return
+    bytes_per_entry = bytes_received / entries
+    # 逐类别查询时，每个类别至少请求一页，交叉列出的论文在每个类别都会重复下载
+    loop_pages = sum(max(1, -(-hits // page_size)) for hits in category_hits.values())
+    loop_bytes = sum(category_hits.values()) * bytes_per_entry
+
+    print(f"\n📉 合并查询 vs 逐类别查询（估算）:")
+    print(f"   • API 页数: {pages} vs ~{loop_pages}，节省 ~{loop_pages - pages} 页")
+    print(f"   • 下载量: {bytes_received / 1e6:.1f} MB vs ~{loop_bytes / 1e6:.1f} MB，"
+          f"节省 ~{(loop_bytes - bytes_received) / 1e6:.1f} MB")
+
+
+def get_latest_papers(signal_authors, start_date, end_date, category_counts=None,
+                      categories=None, max_workers=4, rate=ARXIV_REQUEST_RATE,
+                      mode="per_category", page_size=100, spool_file=None, checkpoint_file=None,
+                      delta=False, store_file=None, high_water_file=HIGH_WATER_FILE, limiter=None):
+    """获取最新论文的核心函数 - 使用日期范围查询
+
+    各类别并发查询，所有请求共享一个全局令牌桶（默认每 3 秒 1 个请求），
+    等待某个类别响应的同时其他类别可以继续使用空闲的请求配额。
+
+    mode:
+        "per_category" - 每个类别单独查询（交叉列出的论文会被重复下载）
+        "sweep" - 合并成 (cat:A OR cat:B ...) 查询，只遍历一次，再在本地分配类别
+
+    匹配结果边抓取边写入 spool_file（默认按日期范围命名），运行中断后用同样的参数重跑
+    会从 spool 继续；全部完成后再排序生成CSV并删除 spool。
+
+    抓取进度记录在 checkpoint_file（同样按日期范围命名）中，重跑时跳过已完成的类别，
+    未完成的类别从上次的页偏移继续；有类别出错时保留 spool 和 checkpoint 供下次继续。
+
+    每个类别（sweep 模式下为每段合并查询）完整抓取后，其最新论文记录到 high_water_file。
+    delta=True 时只抓取比高水位更新的论文（没有高水位的类别仍使用完整日期范围），
+    新匹配的论文合并到累积存储 store_file（默认 DELTA_STORE_FILE）。
+
+    limiter: 共享的令牌桶（例如新鲜度探针使用的那个），默认按 rate 新建
+    """
+
     print(f"📅 查询时间范围：{start_date} 至 {end_date}")
     print(f"📊 信号源作者数量：{len(signal_authors)}")
-    
+
     # 生成输出文件名
     output_file = f"latest_arxiv_papers_{datetime.now().strftime('%Y%m%d_%H%M')}.csv"
-    
+
     counter = 1
     base_name, ext = os.path.splitext(output_file)
     while os.path.exists(output_file):
         output_file = f"{base_name}_{counter}{ext}"
         counter += 1
-    
-    # 更保守的客户端配置
-    client = arxiv.Client(
-        page_size=100,  # 增加页面大小提高效率
-        delay_seconds=3,
-        num_retries=5
-    )
-    
-    # 统计信息
-    total_papers = 0
-    matched_papers = 0
-    date_stats = {}
-    category_stats = {}
-    processed_papers = set()
-    all_papers_data = []
-    
-    print(f"\n🔍 开始查询论文（使用日期范围过滤）...")
-    
+
+    print(f"\n🔍 开始查询论文（使用日期范围过滤，{max_workers} 个并发线程）...")
+
     # 构造日期范围查询字符串
     date_query = f"submittedDate:[{start_date.strftime('%Y%m%d')}0000 TO {end_date.strftime('%Y%m%d')}2359]"
     print(f"📅 日期过滤: {date_query}")
-    
-    # 计算机科学相关类别（包括交叉学科）
-    categories = [
-        # 主要AI/ML相关
-        "cs.AI", "cs.LG", "cs.CV", "cs.CL", "cs.NE", "cs.RO", "cs.IR",
-        # 系统和架构
-        "cs.DC", "cs.OS", "cs.AR", "cs.PF", "cs.NI",
-        # 软件工程和编程语言
-        "cs.SE", "cs.PL", "cs.LO", "cs.FL",
-        # 理论计算机科学
-        "cs.DS", "cs.CC", "cs.DM", "cs.GT", "cs.IT",
-        # 应用领域
-        "cs.DB", "cs.CR", "cs.GR", "cs.MM", "cs.HC", "cs.CY", "cs.ET",
-        # 数学计算
-        "cs.NA", "cs.MS", "cs.SC", "cs.CE",
-        # 其他
-        "cs.OH", "cs.SY",
-        # 交叉学科
-        "stat.ML", "math.OC", "math.ST", "eess.IV", "eess.SP", "eess.AS",
-        "econ.EM", "q-bio.QM", "physics.data-an"
-    ]
-    
-    for category in categories:
-        print(f"\n🔍 查询类别: {category}")
-        
-        # 获取该类别的预期论文数量
+
+    window = f"latest_arxiv_papers_{start_date.strftime('%Y%m%d')}_{end_date.strftime('%Y%m%d')}"
+    spool_file = spool_file or f"{window}.spool.jsonl"
+    checkpoint_file = checkpoint_file or f"{window}.checkpoint.json"
+
+    categories = categories or CATEGORIES
+    limiter = limiter or TokenBucket(rate)
+    state = CrawlState(spool_file, checkpoint_file, HighWaterMarks(high_water_file))
+    if state.resumed_papers:
+        print(f"♻️ 从 {spool_file} 恢复 {state.resumed_papers} 篇已匹配论文")
+    if state.progress:
+        finished = sum(1 for p in state.progress.values() if p.get('done'))
+        print(f"♻️ 从 {checkpoint_file} 恢复进度：{finished} 个类别已完成，"
+              f"{len(state.progress) - finished} 个类别继续")
+    failed = False
+
+    # requests.Session 不保证线程安全，每个工作线程使用自己的客户端
+    local = threading.local()
+    clients = []
+
+    def thread_client():
+        if not hasattr(local, 'client'):
+            local.client = RateLimitedClient(limiter, page_size=page_size, num_retries=5)
+            with state.lock:
+                clients.append(local.client)
+        return local.client
+
+    def since_for(key):
+        return state.high_water.get(key) if delta else None
+
+    def date_query_since(since):
+        """增量模式：查询窗口从高水位所在的分钟开始"""
+        if not since:
+            return date_query
+        start = datetime.fromisoformat(since['published'])
+        return f"submittedDate:[{start.strftime('%Y%m%d%H%M')} TO {end_date.strftime('%Y%m%d')}2359]"
+
+    def run_category(category):
         expected_count = category_counts.get(category, 0) if category_counts else 0
-        
-        try:
-            # 关键修改：使用日期范围过滤
-            query = f"cat:{category} AND {date_query}"
-            
-            # 根据预期数量调整查询上限
-            max_results = max(expected_count * 2, 200) if expected_count > 0 else 2000
-            print(f"📊 预期论文数: {expected_count}, 查询上限: {max_results}")
-            print(f"🔎 查询语句: {query}")
-            
-            search = arxiv.Search(
-                query=query,
-                sort_by=arxiv.SortCriterion.SubmittedDate,
-                sort_order=arxiv.SortOrder.Descending,
-                max_results=max_results
-            )
-            
-            category_count = 0
-            category_matched = 0
-            processed_in_category = 0
-            
-            print(f"      🔄 开始获取论文...")
-            
-            for result in client.results(search):
-                try:
-                    pub_date = result.published.date()
-                    update_date = result.updated.date()
-                    paper_id = result.entry_id.split('/')[-1]
-                    processed_in_category += 1
-                    
-                    # 每处理50篇显示进度
-                    if processed_in_category % 50 == 0:
-                        print(f"      📊 已处理 {processed_in_category} 篇")
-                    
-                    # 检查是否已经处理过这篇论文
-                    if paper_id in processed_papers:
-                        continue
-                    
-                    # 日期范围已经在查询中过滤了，这里直接处理
-                    authors = [normalize_author_name(a.name) for a in result.authors]
-                    
-                    # 将论文ID添加到已处理集合
-                    processed_papers.add(paper_id)
-                    
-                    # 更新统计
-                    date_str = pub_date.strftime("%Y-%m-%d")
-                    date_stats[date_str] = date_stats.get(date_str, 0) + 1
-                    category_stats[result.primary_category] = category_stats.get(result.primary_category, 0) + 1
-                    
-                    # 检查匹配的作者
-                    matched_authors = [a for a in authors if a in signal_authors]
-                    
-                    # 只有匹配到信号源作者的论文才写入数据
-                    if matched_authors:
-                        formatted_url = format_arxiv_url(result.entry_id)
-                        
-                        # 准备论文数据
-                        paper_data = {
-                            'id': paper_id,
-                            'title': result.title.strip().replace('\n', ' '),
-                            'authors': ", ".join(authors),
-                            'matched_authors': ", ".join(matched_authors),
-                            'published_date': pub_date,
-                            'primary_category': result.primary_category,
-                            'all_categories': ", ".join(result.categories),
-                            'abstract': clean_abstract(result.summary),
-                            'abs_url': formatted_url,
-                            'has_match': True
-                        }
-                        
-                        all_papers_data.append(paper_data)
-                        category_matched += 1
-                        matched_papers += 1
-                        print(f"         ✅ [{pub_date}] 匹配: {', '.join(matched_authors)} | {result.title[:40]}...")
-                    
-                    category_count += 1
-                    total_papers += 1
-                    
-                    # 如果已获取足够数量且有预期，可以提前结束
-                    if expected_count > 0 and category_count >= expected_count * 1.5:
-                        print(f"      ✅ 已获取足够论文，提前结束")
-                        break
-                        
-                except Exception as e:
-                    print(f"         ⚠️ 处理论文时出错: {e}")
-                    continue
-            
-            print(f"      📊 {category}: {category_count}篇论文, {category_matched}篇匹配")
-            
-        except Exception as e:
-            print(f"      ❌ 类别 {category} 查询出错: {e}")
-            continue
-    
+        since = since_for(category)
+        return crawl_category(thread_client(), category, date_query_since(since), expected_count,
+                              signal_authors, state, since)
+
+    def run_sweep(chunk, query):
+        since = since_for(",".join(chunk))
+        query = query.replace(date_query, date_query_since(since))
+        return sweep_categories(thread_client(), chunk, query, signal_authors, state, since)
+
+    # 中途异常或被终止时 spool 保留在磁盘上，重跑即可继续
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            if mode == "sweep":
+                category_hits = {}
+                futures = {executor.submit(run_sweep, chunk, query): ", ".join(chunk)
+                           for chunk, query in build_category_queries(categories, date_query)}
+                for future in as_completed(futures):
+                    try:
+                        swept, matched, hits = future.result()
+                        category_hits.update(hits)
+                        print(f"      📊 合并查询: {swept}篇论文, {matched}篇匹配")
+                    except Exception as e:
+                        failed = True
+                        print(f"      ❌ 合并查询 [{futures[future]}] 出错: {e}")
+            else:
+                futures = {executor.submit(run_category, category): category for category in categories}
+                for future in as_completed(futures):
+                    category = futures[future]
+                    try:
+                        category_count, category_matched = future.result()
+                        print(f"      📊 {category}: {category_count}篇论文, {category_matched}篇匹配")
+                    except Exception as e:
+                        failed = True
+                        print(f"      ❌ 类别 {category} 查询出错: {e}")
+    finally:
+        state.close()
+
+    pages = sum(c.pages for c in clients)
+    bytes_received = sum(c.bytes_received for c in clients)
+    print(f"\n🌐 共请求 {pages} 页，下载 {bytes_received / 1e6:.1f} MB")
+    if mode == "sweep":
+        report_sweep_savings(category_hits, page_size, pages, bytes_received, state.total_papers)
+
     # 写入CSV文件 - 只写入匹配的论文
-    print(f"\n📝 写入CSV文件，共 {len(all_papers_data)} 篇匹配论文...")
-    
-    with open(output_file, mode='w', newline='', encoding='utf-8') as file:
-        writer = csv.writer(file)
-        writer.writerow(["ID", "Title", "Authors", "Matched_Authors", "Published_Date","Primary_Category", "All_Categories", "Abstract", "Abstract_URL"])
-        
-        # 按发布日期排序，最新的在前
-        all_papers_data.sort(key=lambda x: x['published_date'], reverse=True)
-        
-        for paper in all_papers_data:
-            writer.writerow([
-                paper['id'],
-                paper['title'],
-                paper['authors'],
-                paper['matched_authors'],
-                paper['published_date'],
-                paper['primary_category'],
-                paper['all_categories'],
-                paper['abstract'],
-                paper['abs_url']
-            ])
-    
-    print(f"✅ 数据写入完成，共写入 {len(all_papers_data)} 篇匹配论文")
-    
-    return output_file, total_papers, matched_papers, date_stats, category_stats
+    print(f"\n📝 写入CSV文件，共 {state.matched_papers} 篇匹配论文...")
+    written = write_csv_from_spool(spool_file, output_file)
+    print(f"✅ 数据写入完成，共写入 {written} 篇匹配论文")
+
+    store_file = store_file or (DELTA_STORE_FILE if delta else None)
+    if store_file:
+        added = merge_spool_into_store(spool_file, store_file)
+        print(f"🗃️ 新增 {added} 篇论文到累积存储 {store_file}")
+
+    if failed:
+        print(f"⚠️ 部分类别未完成，保留 {spool_file} 和 {checkpoint_file}，重跑即可继续")
+    else:
+        os.remove(spool_file)
+        if os.path.exists(checkpoint_file):
+            os.remove(checkpoint_file)
+
+    return output_file, state.total_papers, state.matched_papers, state.date_stats, state.category_stats
 
 def preview_csv(file_path):
     """预览CSV文件前几行"""
@@ -463,8 +1083,12 @@ def print_results(output_file, total_papers, matched_papers, date_stats, categor
             os.remove(output_file)
             print(f"   已删除空的输出文件: {output_file}")
 
-def get_latest_papers_by_days(signal_file, days_back=1):
-    """根据指定天数获取最新论文的主函数"""
+def get_latest_papers_by_days(signal_file, days_back=1, mode="per_category", delta=False, probe=None):
+    """根据指定天数获取最新论文的主函数
+
+    delta=True 时只抓取各类别上次运行之后的新论文，days_back 仅作为没有高水位时的窗口。
+    probe: 新鲜度探针；抓取复用它的令牌桶和列表页 Session
+    """
     
     print("🚀 获取最新论文模式")
     print("=" * 30)
@@ -484,39 +1108,25 @@ def get_latest_papers_by_days(signal_file, days_back=1):
     
     # 批次探针：检查API是否有指定日期的论文
     print("\n🧪 执行批次探针检查...")
-    top_dates = probe_api_batch_top_dates(start_date, today)
+    probe = probe or create_probe()
+    top_dates = probe_api_batch_top_dates(start_date, probe=probe)
     if not should_proceed_today(top_dates, start_date):
         print("💤 指定日期范围内暂无论文，跳过本次抓取")
         return None
     
     category_counts = None
-    categories = [
-        "cs.AI", "cs.LG", "cs.CV", "cs.CL", "cs.NE", "cs.RO", "cs.IR",
-        "cs.DC", "cs.OS", "cs.AR", "cs.PF", "cs.NI",
-        "cs.SE", "cs.PL", "cs.LO", "cs.FL",
-        "cs.DS", "cs.CC", "cs.DM", "cs.GT", "cs.IT",
-        "cs.DB", "cs.CR", "cs.GR", "cs.MM", "cs.HC", "cs.CY", "cs.ET",
-        "cs.NA", "cs.MS", "cs.SC", "cs.CE",
-        "cs.OH", "cs.SY",
-        # 交叉学科
-        "stat.ML", "math.OC", "math.ST", "eess.IV", "eess.SP", "eess.AS",
-        "econ.EM", "q-bio.QM", "physics.data-an"
-    ]
+    categories = CATEGORIES
     
-    # 如果查询最近1天，先获取当天各类别的提交数量
-    if days_back == 1:
-        type = "new"
-        category_counts, total_expected = get_category_submission_counts(categories, type)
-        print(f"📊 预期总论文数: {total_expected}")        
-        time.sleep(3.2)
-
-    elif days_back > 1:
-        type = "recent"
-        category_counts, total_expected = get_category_submission_counts(categories, type)
+    # 如果查询最近1天，先获取当天各类别的提交数量；多天则使用 recent 列表
+    # 合并查询不按类别提前结束，增量模式只抓少量新论文，都不需要预期数量
+    if mode != "sweep" and not delta:
+        type = "new" if days_back == 1 else "recent"
+        category_counts, total_expected = get_category_submission_counts(categories, type, session=probe.session)
         print(f"📊 预期总论文数: {total_expected}")
         time.sleep(3.2)
-        
-    return get_latest_papers(signal_authors, start_date, today, category_counts)
+
+    return get_latest_papers(signal_authors, start_date, today, category_counts, mode=mode, delta=delta,
+                             limiter=probe.client.limiter)
 
 def main():
     """主函数"""
@@ -534,7 +1144,8 @@ def main():
     
     print(f"📋 使用信号源文件: {signal_file}")
     
-    ok = test_arxiv_connection()
+    probe = create_probe()
+    ok = test_arxiv_connection(probe)
     if not ok:
         print("❌ 无法连接到 arXiv（连通性失败）")
         return
@@ -549,9 +1160,15 @@ def main():
         days_back = 2
     
     print(f"📅 将查询最近 {days_back} 天的论文")
+
+    mode_input = input("是否使用合并查询模式，交叉列出的论文只下载一次 (y/N): ").strip().lower()
+    mode = "sweep" if mode_input == "y" else "per_category"
+
+    delta_input = input("是否只抓取上次运行之后的新论文（增量模式）(y/N): ").strip().lower()
+    delta = delta_input == "y"
     
     # 执行获取最新论文
-    result = get_latest_papers_by_days(signal_file, days_back)
+    result = get_latest_papers_by_days(signal_file, days_back, mode, delta, probe)
     if result:
         print_results(*result)
     else:
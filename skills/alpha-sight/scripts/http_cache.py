@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTTP Response Cache for Alpha-Sight
+Pooled requests session with an on-disk response store shared by the fetchers
+"""
+
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+# Project root is 4 levels up from the scripts directory (as in ArxivFetcher)
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent.parent.parent / "alpha-sight" / "http_cache"
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+# Seconds a response stays fresh, by normalized URL prefix (longest prefix wins).
+# arXiv id_list lookups are not listed: ArxivFetcher caches metadata in its
+# MetadataStore and sends them with cache_ttl=0.
+DEFAULT_TTLS = {
+    "http://export.arxiv.org/api/query?": HOUR,
+    "https://api.semanticscholar.org/graph/v1/paper/": DAY,
+    "https://api.semanticscholar.org/graph/v1/paper/batch": DAY,
+    "https://api.semanticscholar.org/graph/v1/paper/search": HOUR,
+}
+
+# Headers that describe the transfer rather than the stored (decoded) body
+_TRANSFER_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+def normalize_url(url: str) -> str:
+    """Lowercase scheme and host, sort query parameters and drop the fragment"""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ""))
+
+
+def cache_key(method: str, normalized_url: str, body=None) -> str:
+    """
+    Content address of a request
+
+    Args:
+        method: HTTP method
+        normalized_url: URL from normalize_url()
+        body: JSON-serializable payload, or raw bytes/str body
+
+    Returns:
+        SHA-256 hex digest
+    """
+    if body is None:
+        body = b""
+    elif isinstance(body, str):
+        body = body.encode("utf-8")
+    elif not isinstance(body, bytes):
+        body = json.dumps(body, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(method.encode() + b" " + normalized_url.encode() + b"\n" + body).hexdigest()
+
+
+class _CachedBody(io.BufferedReader):
+    """Stored body served as response.raw (accepts attributes like decode_content)"""
+
+
+class _SpoolingBody(io.RawIOBase):
+    """
+    Decoded network body that is written to a temporary file as it is read
+
+    The entry is stored (on_complete) once the reader reaches the end; a body
+    closed early or cut off by a network error leaves no entry behind.
+    """
+
+    def __init__(self, response: requests.Response, tmp_path: Path, on_complete: Callable[[], None]):
+        self._response = response
+        self._chunks = response.iter_content(chunk_size=64 * 1024)
+        self._tmp_path = tmp_path
+        self._file = open(tmp_path, 'wb')
+        self._on_complete = on_complete
+        self._pending = memoryview(b"")
+        self._complete = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        try:
+            while not self._pending:
+                if self._complete:
+                    return 0
+                chunk = next(self._chunks, None)
+                if chunk is None:
+                    self._file.close()
+                    self._on_complete()
+                    self._complete = True
+                    return 0
+                self._file.write(chunk)
+                self._pending = memoryview(chunk)
+        except BaseException:
+            self.close()
+            raise
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+    def close(self):
+        if not self.closed:
+            self._file.close()
+            self._response.close()
+            if self._tmp_path.exists():
+                self._tmp_path.unlink()
+        super().close()
+
+
+class CachedSession(requests.Session):
+    """
+    requests.Session with connection pooling and an on-disk response cache
+
+    Successful GET and POST responses whose URL matches a TTL rule are stored
+    under a content address (SHA-256 of method, normalized URL and body).
+    Fresh entries are served without touching the network; stale entries with
+    an ETag or Last-Modified header are revalidated with a conditional request.
+    With stream=True a miss is read from the network as it arrives and written
+    to the store alongside.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+                 ttls: Optional[Dict[str, float]] = None, pool_size: int = 10):
+        """
+        Initialize cached session
+
+        Args:
+            cache_dir: Response store directory, created on first write (None disables caching)
+            ttls: Freshness lifetime in seconds by URL prefix (default: DEFAULT_TTLS)
+            pool_size: Connections kept alive per host
+        """
+        super().__init__()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self._lock = threading.Lock()
+
+    def ttl_for(self, url: str) -> float:
+        """Return the TTL of the longest matching prefix rule, or 0"""
+        best = ""
+        for prefix in self.ttls:
+            if url.startswith(prefix) and len(prefix) > len(best):
+                best = prefix
+        return self.ttls[best] if best else 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache hit/miss counters"""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "revalidated": self.revalidated}
+
+    def _count(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def request(self, method: str, url: str, params=None, data=None, headers=None,
+                json=None, cache_ttl: Optional[float] = None,
+                throttle: Optional[Callable[[], object]] = None, **kwargs) -> requests.Response:
+        """
+        Send a request, answering from the cache when possible
+
+        Args:
+            cache_ttl: Override the TTL rule for this request (0 bypasses the cache)
+            throttle: Called before the request goes to the network, e.g. a
+                rate limiter's acquire; cache hits skip it
+            Other arguments are passed to requests.Session.request
+        """
+        def send(**extra):
+            if throttle is not None:
+                throttle()
+            return super(CachedSession, self).request(method, url, params=params, data=data,
+                                                      json=json, **extra)
+
+        method = method.upper()
+        prepared = self.prepare_request(requests.Request(method, url, params=params, data=data, json=json))
+        normalized = normalize_url(prepared.url)
+        ttl = self.ttl_for(normalized) if cache_ttl is None else cache_ttl
+
+        if self.cache_dir is None or ttl <= 0 or method not in ("GET", "POST"):
+            return send(headers=headers, **kwargs)
+
+        key = cache_key(method, normalized, json if json is not None else prepared.body)
+        meta_path = self.cache_dir / key[:2] / f"{key}.json"
+        body_path = meta_path.with_suffix(".body")
+
+        meta = self._load_meta(meta_path)
+        if meta is not None and body_path.exists() and time.time() - meta["fetched_at"] < ttl:
+            self._count("hits")
+            return self._cached_response(meta, body_path, prepared)
+
+        headers = dict(headers or {})
+        if meta is not None and body_path.exists():
+            validators = CaseInsensitiveDict(meta["headers"])
+            if validators.get("ETag"):
+                headers["If-None-Match"] = validators["ETag"]
+            if validators.get("Last-Modified"):
+                headers["If-Modified-Since"] = validators["Last-Modified"]
+
+        streamed = kwargs.get("stream", False)
+        kwargs["stream"] = True
+        response = send(headers=headers, **kwargs)
+
+        if response.status_code == 304 and meta is not None:
+            response.close()
+            meta["fetched_at"] = time.time()
+            self._write_meta(meta_path, meta)
+            self._count("revalidated")
+            return self._cached_response(meta, body_path, prepared)
+
+        self._count("misses")
+        if response.status_code != 200:
+            return response
+
+        meta = {
+            "url": normalized,
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {k: v for k, v in response.headers.items() if k.lower() not in _TRANSFER_HEADERS},
+            "fetched_at": time.time(),
+        }
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = body_path.with_name(
+            f"{body_path.name}.{os.getpid()}.{threading.get_ident()}.{id(response)}.tmp")
+
+        def store():
+            os.replace(tmp_path, body_path)
+            self._write_meta(meta_path, meta)
+
+        if streamed:
+            # The caller reads the network body as it arrives; it is stored once read to the end
+            return self._build_response(meta, _CachedBody(_SpoolingBody(response, tmp_path, store)), prepared)
+
+        # Spool the decoded body to disk, then serve it from the stored file
+        try:
+            with response, open(tmp_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    f.write(chunk)
+            store()
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+        return self._cached_response(meta, body_path, prepared)
+
+    @staticmethod
+    def _load_meta(path: Path) -> Optional[Dict]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_meta(path: Path, meta: Dict):
+        """Write entry metadata atomically"""
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def _cached_response(cls, meta: Dict, body_path: Path, prepared: requests.PreparedRequest) -> requests.Response:
+        """Build a Response whose body streams from the stored file"""
+        return cls._build_response(meta, _CachedBody(io.FileIO(str(body_path), 'rb')), prepared)
+
+    @staticmethod
+    def _build_response(meta: Dict, raw: io.BufferedReader, prepared: requests.PreparedRequest) -> requests.Response:
+        """Build a Response from entry metadata and a body stream"""
+        response = requests.Response()
+        response.status_code = meta["status"]
+        response.reason = meta["reason"]
+        response.headers = CaseInsensitiveDict(meta["headers"])
+        response.url = prepared.url
+        response.request = prepared
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.raw = raw
+        return response
+
+
+_shared_session: Optional[CachedSession] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_session() -> CachedSession:
+    """Return the process-wide CachedSession used by the fetchers"""
+    global _shared_session
+    with _shared_lock:
+        if _shared_session is None:
+            _shared_session = CachedSession()
+        return _shared_session
@@ -2,17 +2,68 @@
 """
 Index Manager for Alpha-Sight
 Manages the index.json file for tracking analyzed papers
+
+index.json is a snapshot. Adds and updates are appended to index.json.journal
+under an advisory file lock and folded back into the snapshot when the
+journal grows, so concurrent sessions never lose each other's writes.
 """
 
+import bisect
+import heapq
 import json
+import os
+import pickle
+import sys
+import tempfile
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Set
 from datetime import datetime
 
+if sys.platform == 'win32':
+    import msvcrt
+else:
+    import fcntl
+
+
+def _copy(data):
+    """Deep copy of JSON-like data (a pickle round trip is several times faster than copy.deepcopy)"""
+    return pickle.loads(pickle.dumps(data, pickle.HIGHEST_PROTOCOL))
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat() + "Z"
+
+
+@contextmanager
+def _file_lock(path: Path, exclusive: bool):
+    """Hold an advisory lock on path (Windows only has exclusive locks)"""
+    with open(path, 'a+b') as f:
+        if sys.platform == 'win32':
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
 
 class IndexManager:
     """Manager for alpha-sight index.json"""
 
+    # Fold the journal into the snapshot once it exceeds this many bytes,
+    # or COMPACT_RATIO times the snapshot size if that is larger
+    COMPACT_BYTES = 1024 * 1024
+    COMPACT_RATIO = 0.5
+
     def __init__(self, index_path: str = None):
         if index_path is None:
             # Get the project root (4 levels up from scripts directory)
@@ -21,89 +72,250 @@ class IndexManager:
             index_path = project_root / "alpha-sight" / "index.json"
         self.index_path = Path(index_path)
         self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self.journal_path = self.index_path.with_name(self.index_path.name + ".journal")
+        self.lock_path = self.index_path.with_name(self.index_path.name + ".lock")
+
+        # In-memory state: snapshot plus the journal up to _journal_offset,
+        # valid while the snapshot's stamp and the journal size match
+        self._index: Optional[Dict] = None
+        self._positions: Dict[str, int] = {}
+        self._stamp = None
+        self._journal_offset = 0
+        self._secondary: Optional[Dict] = None  # Built on first query, see _secondary_indexes()
+
+        # Writes of the current batch, as serialized journal operations
+        self._batch_depth = 0
+        self._pending: List[str] = []
+        self._compact_requested = False
+        self._thread_lock = threading.RLock()
+
         self._ensure_index_exists()
 
     def _ensure_index_exists(self):
         """Create index.json if it doesn't exist"""
-        if not self.index_path.exists():
-            initial_data = {
-                "version": "1.0",
-                "last_updated": datetime.utcnow().isoformat() + "Z",
-                "papers": [],
-                "statistics": {
-                    "total_papers": 0,
-                    "by_status": {
-                        "analyzed_only": 0,
-                        "reproduced": 0,
-                        "failed": 0
-                    },
-                    "by_category": {}
+        if self.index_path.exists():
+            return
+        with _file_lock(self.lock_path, exclusive=True):
+            if not self.index_path.exists():
+                initial_data = {
+                    "version": "1.0",
+                    "last_updated": _now(),
+                    "papers": [],
+                    "statistics": {
+                        "total_papers": 0,
+                        "by_status": {
+                            "analyzed_only": 0,
+                            "reproduced": 0,
+                            "failed": 0
+                        },
+                        "by_category": {}
+                    }
                 }
-            }
-            self._save_index(initial_data)
+                self._write_index(initial_data)
 
-    def _load_index(self) -> Dict:
-        """Load index.json"""
-        with open(self.index_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+    def _file_stamp(self):
+        stat = self.index_path.stat()
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _journal_size(self) -> int:
+        try:
+            return self.journal_path.stat().st_size
+        except FileNotFoundError:
+            return 0
 
-    def _save_index(self, data: Dict):
-        """Save index.json"""
-        data["last_updated"] = datetime.utcnow().isoformat() + "Z"
-        with open(self.index_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    def _load_index(self) -> Dict:
+        """Load index.json and replay the journal, reusing the in-memory copy unless either changed"""
+        if self._index is not None and (self._batch_depth or (
+                self._file_stamp() == self._stamp and self._journal_size() == self._journal_offset)):
+            return self._index
+
+        # A shared lock keeps compaction from swapping files between the two reads
+        with _file_lock(self.lock_path, exclusive=False):
+            self._refresh()
+        return self._index
+
+    def _refresh(self):
+        """Bring the in-memory copy up to date (caller holds the file lock)"""
+        stamp = self._file_stamp()
+        if self._index is None or stamp != self._stamp or self._journal_size() < self._journal_offset:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self._index = json.load(f)
+            self._stamp = stamp
+            self._journal_offset = 0
+            self._positions = {p['arxiv_id']: i for i, p in enumerate(self._index['papers'])}
+            self._secondary = None
+
+        if self._journal_size() > self._journal_offset:
+            with open(self.journal_path, 'rb') as f:
+                f.seek(self._journal_offset)
+                tail = f.read()
+            # A line without its newline is a write cut short by a crash; leave it
+            for line in tail.split(b'\n')[:-1]:
+                self._journal_offset += len(line) + 1
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    print(f"Skipping corrupt journal entry in {self.journal_path}")
+                    continue
+                for op in entry['ops']:
+                    self._apply(self._index, op)
+                self._index['last_updated'] = entry['at']
+
+    def _write_index(self, data: Dict):
+        """Write index.json to a temp file and move it into place (caller holds the file lock)"""
+        data["last_updated"] = _now()
+        fd, tmp_path = tempfile.mkstemp(dir=self.index_path.parent, prefix=".index.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.index_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self._stamp = self._file_stamp()
+
+    def _append_journal(self, ops: List[str]):
+        """Append one journal entry holding ops (caller holds the exclusive lock)"""
+        line = f'{{"at": {json.dumps(_now())}, "ops": [{", ".join(ops)}]}}\n'.encode('utf-8')
+        with open(self.journal_path, 'ab') as f:
+            # Drop a torn entry left by a crashed writer so ours starts on a fresh line
+            if f.tell() > self._journal_offset:
+                f.truncate(self._journal_offset)
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        self._journal_offset += len(line)
+        self._index['last_updated'] = json.loads(line)['at']
+
+    def _compact(self):
+        """Fold the journal into a new snapshot (caller holds the exclusive lock)"""
+        self._write_index(self._index)
+        with open(self.journal_path, 'wb') as f:
+            os.fsync(f.fileno())
+        self._journal_offset = 0
+
+    def compact(self):
+        """Write the current state to index.json and empty the journal"""
+        with self.batch():
+            self._compact_requested = True
+
+    @contextmanager
+    def batch(self):
+        """
+        Apply many adds and updates as one journal entry
+
+        The index file lock is held for the whole block, so other writers
+        wait and no update is lost. Changes are appended to the journal in
+        a single write when the outermost batch exits. If the block raises,
+        nothing is written and the in-memory copy is dropped.
+
+        Example:
+            with manager.batch():
+                for paper in papers:
+                    manager.add_paper(paper)
+        """
+        with self._thread_lock:
+            if self._batch_depth:
+                self._batch_depth += 1
+                try:
+                    yield self
+                finally:
+                    self._batch_depth -= 1
+                return
+
+            with _file_lock(self.lock_path, exclusive=True):
+                self._refresh()
+                self._batch_depth = 1
+                try:
+                    yield self
+                except BaseException:
+                    self._index = None
+                    raise
+                else:
+                    if self._pending:
+                        self._append_journal(self._pending)
+                    snapshot_size = self._stamp[2]
+                    if self._compact_requested or self._journal_offset > max(
+                            self.COMPACT_BYTES, snapshot_size * self.COMPACT_RATIO):
+                        self._compact()
+                finally:
+                    self._batch_depth = 0
+                    self._pending = []
+                    self._compact_requested = False
+
+    def _log(self, op: Dict):
+        """Apply an operation in memory and queue it for the journal (inside a batch)"""
+        self._apply(self._index, op)
+        self._pending.append(json.dumps(op, ensure_ascii=False))
+
+    def _apply(self, index: Dict, op: Dict):
+        """Apply one journal operation to index; replaying an operation twice is harmless"""
+        if op['op'] == 'add':
+            paper = op['paper']
+            if paper['arxiv_id'] in self._positions:
+                return
+            index['papers'].append(paper)
+            self._positions[paper['arxiv_id']] = len(index['papers']) - 1
+            self._reindex(None, paper, len(index['papers']) - 1)
+
+            # Update statistics
+            self._count_paper(index['statistics'], paper, 1)
+
+        elif op['op'] == 'update':
+            position = self._positions.get(op['arxiv_id'])
+            if position is None:
+                return
+
+            # Deep merge updates
+            old = index['papers'][position]
+            new = self._deep_merge(old, op['updates'])
+            index['papers'][position] = new
+            self._reindex(old, new, position)
+
+            # Update statistics (only the counters this paper moves between)
+            if self._status_bucket(old) != self._status_bucket(new) or old.get('categories') != new.get('categories'):
+                self._count_paper(index['statistics'], old, -1)
+                self._count_paper(index['statistics'], new, 1)
+
+        elif op['op'] == 'statistics':
+            index['statistics'] = op['statistics']
 
     def paper_exists(self, arxiv_id: str) -> bool:
         """Check if paper already exists in index"""
-        index = self._load_index()
-        return any(p['arxiv_id'] == arxiv_id for p in index['papers'])
+        self._load_index()
+        return arxiv_id in self._positions
 
     def get_paper(self, arxiv_id: str) -> Optional[Dict]:
         """Get paper entry by arXiv ID"""
         index = self._load_index()
-        for paper in index['papers']:
-            if paper['arxiv_id'] == arxiv_id:
-                return paper
-        return None
+        position = self._positions.get(arxiv_id)
+        if position is None:
+            return None
+        return _copy(index['papers'][position])
 
     def add_paper(self, paper_data: Dict):
         """Add new paper to index"""
-        index = self._load_index()
-
-        # Check if already exists
-        if self.paper_exists(paper_data['arxiv_id']):
-            print(f"Paper {paper_data['arxiv_id']} already exists. Use update_paper() instead.")
-            return
-
-        # Add paper
-        index['papers'].append(paper_data)
-
-        # Update statistics
-        self._update_statistics(index)
-
-        # Save
-        self._save_index(index)
+        with self.batch():
+            # Check if already exists
+            if paper_data['arxiv_id'] in self._positions:
+                print(f"Paper {paper_data['arxiv_id']} already exists. Use update_paper() instead.")
+                return
+
+            # Add paper
+            self._log({'op': 'add', 'paper': _copy(paper_data)})
         print(f"Added paper {paper_data['arxiv_id']} to index")
 
     def update_paper(self, arxiv_id: str, updates: Dict):
         """Update existing paper entry"""
-        index = self._load_index()
+        with self.batch():
+            # Find and update paper
+            if arxiv_id not in self._positions:
+                print(f"Paper {arxiv_id} not found in index")
+                return
 
-        # Find and update paper
-        for i, paper in enumerate(index['papers']):
-            if paper['arxiv_id'] == arxiv_id:
-                # Deep merge updates
-                index['papers'][i] = self._deep_merge(paper, updates)
-                break
-        else:
-            print(f"Paper {arxiv_id} not found in index")
-            return
-
-        # Update statistics
-        self._update_statistics(index)
-
-        # Save
-        self._save_index(index)
+            self._log({'op': 'update', 'arxiv_id': arxiv_id, 'updates': _copy(updates)})
         print(f"Updated paper {arxiv_id} in index")
 
     def _deep_merge(self, base: Dict, updates: Dict) -> Dict:
@@ -116,8 +328,35 @@ class IndexManager:
                 result[key] = value
         return result
 
+    @staticmethod
+    def _status_bucket(paper: Dict) -> str:
+        """by_status counter a paper belongs to"""
+        status = paper.get('reproduction', {}).get('status', 'not_started')
+        if status == 'completed':
+            return 'reproduced'
+        elif status in ['failed', 'partial']:
+            return 'failed'
+        return 'analyzed_only'
+
+    @classmethod
+    def _count_paper(cls, statistics: Dict, paper: Dict, delta: int):
+        """Add (delta=1) or remove (delta=-1) one paper's contribution to the statistics"""
+        statistics['total_papers'] = statistics.get('total_papers', 0) + delta
+
+        by_status = statistics.setdefault('by_status', {"analyzed_only": 0, "reproduced": 0, "failed": 0})
+        bucket = cls._status_bucket(paper)
+        by_status[bucket] = by_status.get(bucket, 0) + delta
+
+        by_category = statistics.setdefault('by_category', {})
+        for cat in paper.get('categories', []):
+            count = by_category.get(cat, 0) + delta
+            if count:
+                by_category[cat] = count
+            else:
+                by_category.pop(cat, None)
+
     def _update_statistics(self, index: Dict):
-        """Update statistics in index"""
+        """Recount statistics from every paper in index"""
         papers = index['papers']
 
         # Total papers
@@ -148,32 +387,227 @@ class IndexManager:
 
         index['statistics']['by_category'] = by_category
 
-    def list_papers(self, sort_by: str = 'date', limit: Optional[int] = None) -> List[Dict]:
-        """List all papers with optional sorting and limit"""
-        index = self._load_index()
-        papers = index['papers']
+    # Sort keys of the sorted views; list_papers orders by these, descending
+    # (normalized like index_store.py, so null dates and scores still compare)
+    SORT_KEYS = {
+        'date': lambda p: p.get('analyzed_date') or '',
+        'relevance': lambda p: (p.get('analysis') or {}).get('relevance_score') or 0,
+    }
 
-        # Sort
-        if sort_by == 'date':
-            papers = sorted(papers, key=lambda p: p.get('analyzed_date', ''), reverse=True)
-        elif sort_by == 'relevance':
-            papers = sorted(papers, key=lambda p: p.get('analysis', {}).get('relevance_score', 0), reverse=True)
+    def _secondary_indexes(self, views: Iterable[str] = ()) -> Dict:
+        """
+        Inverted and sorted indexes over the in-memory papers
+
+        Papers are referenced by position in index['papers']:
+            tag, category: value -> set of positions
+            date, relevance: ascending list of (sort key, -position), so
+                walking it backwards gives the order of a stable descending sort
+
+        The inverted indexes are built on first use; each sorted view only
+        when a query first asks for it (see views).
+        """
+        papers = self._load_index()['papers']
+        if self._secondary is None:
+            self._secondary = {'tag': {}, 'category': {}}
+            for position, paper in enumerate(papers):
+                self._index_paper(paper, position)
+        for view in views:
+            if view not in self._secondary:
+                key = self.SORT_KEYS[view]
+                self._secondary[view] = sorted((key(paper), -position) for position, paper in enumerate(papers))
+        return self._secondary
+
+    def _index_paper(self, paper: Dict, position: int):
+        secondary = self._secondary
+        for field, values in (('tag', paper.get('tags')), ('category', paper.get('categories'))):
+            for value in values or []:
+                secondary[field].setdefault(value, set()).add(position)
+        for view, key in self.SORT_KEYS.items():
+            if view in secondary:
+                bisect.insort(secondary[view], (key(paper), -position))
+
+    def _unindex_paper(self, paper: Dict, position: int):
+        secondary = self._secondary
+        for field, values in (('tag', paper.get('tags')), ('category', paper.get('categories'))):
+            for value in values or []:
+                positions = secondary[field].get(value)
+                if positions is not None:
+                    positions.discard(position)
+                    if not positions:
+                        del secondary[field][value]
+        for view, key in self.SORT_KEYS.items():
+            if view not in secondary:
+                continue
+            entries = secondary[view]
+            entry = (key(paper), -position)
+            i = bisect.bisect_left(entries, entry)
+            if i < len(entries) and entries[i] == entry:
+                del entries[i]
+
+    def _reindex(self, old: Optional[Dict], new: Dict, position: int):
+        """Move a paper within the secondary indexes after an add (old=None) or update"""
+        if self._secondary is None:
+            return
+        if old is not None:
+            if (old.get('tags') == new.get('tags') and old.get('categories') == new.get('categories')
+                    and all(key(old) == key(new) for key in self.SORT_KEYS.values())):
+                return
+            self._unindex_paper(old, position)
+        self._index_paper(new, position)
+
+    def query(self, tags: Optional[Iterable[str]] = None, categories: Optional[Iterable[str]] = None,
+              date_from: Optional[str] = None, date_to: Optional[str] = None,
+              sort_by: str = 'date', limit: Optional[int] = None) -> List[Dict]:
+        """
+        Find papers matching all given conditions
+
+        Args:
+            tags: Papers must have every one of these tags
+            categories: Papers must be in every one of these categories
+            date_from: Earliest analyzed_date (inclusive, ISO prefix such as "2024-03")
+            date_to: Latest analyzed_date (inclusive, ISO prefix such as "2024-03-31")
+            sort_by: 'date' or 'relevance' (descending); anything else keeps index order
+            limit: Maximum number of papers returned
+
+        Returns:
+            Matching paper entries
+
+        Example:
+            manager.query(tags=["MoE"], categories=["cs.LG"], date_from="2024-01", limit=10)
+        """
+        papers = self._load_index()['papers']
+        dated = date_from is not None or date_to is not None
+        views = {sort_by} & self.SORT_KEYS.keys() | ({'date'} if dated else set())
+        secondary = self._secondary_indexes(views)
+        total = len(papers)
+
+        # Inverted-index sets a paper must be in, smallest first
+        sets: List[Set[int]] = sorted(
+            (secondary[field].get(value, set())
+             for field, values in (('tag', tags), ('category', categories)) for value in values or []),
+            key=len)
+
+        # Date range as a slice [lo, hi) of the ascending date view
+        date_view = secondary.get('date', [])
+        lo, hi = 0, total
+        if date_from is not None:
+            lo = bisect.bisect_left(date_view, (date_from,))
+        if date_to is not None:
+            # U+FFFF sorts after any character, so the date_to prefix is inclusive
+            hi = bisect.bisect_left(date_view, (date_to + '\uffff',))
+        date_key = self.SORT_KEYS['date']
+
+        def in_range(position):
+            key = date_key(papers[position])
+            return ((date_from is None or key >= date_from)
+                    and (date_to is None or key < date_to + '\uffff'))
+
+        if sort_by in self.SORT_KEYS:
+            view = secondary[sort_by]
+            span = hi - lo if sort_by == 'date' else total
+
+            # Walking the sorted view costs about limit / (share of matching papers)
+            # entries; intersecting costs the size of the smallest candidate set
+            share = (hi - lo) / total if total else 0
+            for positions in sets:
+                share *= len(positions) / total
+            walk_cost = min(span, limit / share) if limit and share else span
+            scan_cost = len(sets[0]) if sets else hi - lo
+
+            if walk_cost <= scan_cost:
+                start = hi if sort_by == 'date' else total
+                stop = lo if sort_by == 'date' else 0
+                check_dates = dated and sort_by != 'date'
+                ordered = []
+                for i in range(start - 1, stop - 1, -1):
+                    position = -view[i][1]
+                    if (all(position in positions for positions in sets)
+                            and (not check_dates or in_range(position))):
+                        ordered.append(position)
+                        if len(ordered) == limit:
+                            break
+                return _copy([papers[position] for position in ordered])
+
+        # Intersect the candidate sets, then sort only the matches
+        if sets:
+            candidates = sets[0]
+            for positions in sets[1:]:
+                candidates = candidates & positions
+            if dated:
+                candidates = [position for position in candidates if in_range(position)]
+        elif dated:
+            candidates = [-position for _, position in date_view[lo:hi]]
+        else:
+            candidates = range(total)
 
-        # Limit
-        if limit:
-            papers = papers[:limit]
+        if sort_by in self.SORT_KEYS:
+            key = self.SORT_KEYS[sort_by]
 
-        return papers
+            def rank(position):
+                return key(papers[position]), -position
+            if limit:
+                ordered = heapq.nlargest(limit, candidates, key=rank)
+            else:
+                ordered = sorted(candidates, key=rank, reverse=True)
+        else:
+            ordered = sorted(candidates)[:limit or None]
+
+        return _copy([papers[position] for position in ordered])
+
+    def list_papers(self, sort_by: str = 'date', limit: Optional[int] = None) -> List[Dict]:
+        """List all papers with optional sorting and limit"""
+        return self.query(sort_by=sort_by, limit=limit)
 
     def search_by_tag(self, tag: str) -> List[Dict]:
         """Search papers by tag"""
-        index = self._load_index()
-        return [p for p in index['papers'] if tag in p.get('tags', [])]
+        return self.query(tags=[tag], sort_by='index')
 
     def get_statistics(self) -> Dict:
         """Get index statistics"""
         index = self._load_index()
-        return index['statistics']
+        return _copy(index['statistics'])
+
+    def verify_statistics(self, repair: bool = True) -> bool:
+        """
+        Recount statistics from all papers and compare with the stored counters
+
+        Args:
+            repair: Save the recounted statistics if they differ
+
+        Returns:
+            True if the stored statistics were consistent
+        """
+        index = self._load_index()
+        stored = _copy(index['statistics'])
+        recounted = {'papers': index['papers'], 'statistics': {}}
+        self._update_statistics(recounted)
+        if stored == recounted['statistics']:
+            return True
+
+        print(f"Index statistics out of date: {stored} != {recounted['statistics']}")
+        if repair:
+            with self.batch():
+                # Recount under the lock in case another writer got in first
+                recounted = {'papers': self._index['papers'], 'statistics': {}}
+                self._update_statistics(recounted)
+                self._log({'op': 'statistics', 'statistics': recounted['statistics']})
+        return False
+
+
+def open_index(index_path: str = None):
+    """
+    Open an index with the backend matching its file extension
+
+    Args:
+        index_path: index.json (JSON backend) or a .db/.sqlite file (SQLite backend)
+
+    Returns:
+        IndexManager or SQLiteIndexManager
+    """
+    if index_path is not None and Path(index_path).suffix in ('.db', '.sqlite', '.sqlite3'):
+        from index_store import SQLiteIndexManager
+        return SQLiteIndexManager(index_path)
+    return IndexManager(index_path)
 
 
 if __name__ == "__main__":
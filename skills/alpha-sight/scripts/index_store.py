@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+SQLite Index Store for Alpha-Sight
+Indexed SQLite backend with the same public API as IndexManager
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+INDEX_VERSION = "1.0"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS papers (
+    arxiv_id TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    analyzed_date TEXT NOT NULL DEFAULT '',
+    relevance_score REAL NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'not_started',
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS papers_position ON papers (position);
+CREATE INDEX IF NOT EXISTS papers_analyzed_date ON papers (analyzed_date);
+CREATE INDEX IF NOT EXISTS papers_relevance_score ON papers (relevance_score);
+CREATE TABLE IF NOT EXISTS paper_tags (
+    tag TEXT NOT NULL,
+    arxiv_id TEXT NOT NULL,
+    PRIMARY KEY (tag, arxiv_id)
+);
+CREATE INDEX IF NOT EXISTS paper_tags_arxiv_id ON paper_tags (arxiv_id);
+CREATE TABLE IF NOT EXISTS paper_categories (
+    category TEXT NOT NULL,
+    arxiv_id TEXT NOT NULL,
+    PRIMARY KEY (category, arxiv_id)
+);
+CREATE INDEX IF NOT EXISTS paper_categories_arxiv_id ON paper_categories (arxiv_id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat() + "Z"
+
+
+class SQLiteIndexManager:
+    """Manager for an alpha-sight index stored in SQLite"""
+
+    def __init__(self, index_path: str = None):
+        if index_path is None:
+            # Get the project root (4 levels up from scripts directory)
+            script_dir = Path(__file__).parent
+            project_root = script_dir.parent.parent.parent.parent
+            index_path = project_root / "alpha-sight" / "index.db"
+        self.index_path = Path(index_path)
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.index_path), check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('version', ?)", (INDEX_VERSION,))
+        self._conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('last_updated', ?)", (_now(),))
+        self._conn.commit()
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+    def _write_paper(self, paper: Dict, position: int):
+        """Insert or replace one paper row and its tag/category rows (caller holds the lock)"""
+        arxiv_id = paper['arxiv_id']
+        self._conn.execute(
+            "INSERT OR REPLACE INTO papers (arxiv_id, position, analyzed_date, relevance_score, status, data) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (arxiv_id, position, paper.get('analyzed_date') or '',
+             (paper.get('analysis') or {}).get('relevance_score') or 0,
+             (paper.get('reproduction') or {}).get('status') or 'not_started',
+             json.dumps(paper, ensure_ascii=False))
+        )
+        self._conn.execute("DELETE FROM paper_tags WHERE arxiv_id = ?", (arxiv_id,))
+        self._conn.execute("DELETE FROM paper_categories WHERE arxiv_id = ?", (arxiv_id,))
+        self._conn.executemany("INSERT OR IGNORE INTO paper_tags (tag, arxiv_id) VALUES (?, ?)",
+                               [(tag, arxiv_id) for tag in paper.get('tags') or []])
+        self._conn.executemany("INSERT OR IGNORE INTO paper_categories (category, arxiv_id) VALUES (?, ?)",
+                               [(cat, arxiv_id) for cat in paper.get('categories') or []])
+        self._conn.execute("UPDATE meta SET value = ? WHERE key = 'last_updated'", (_now(),))
+
+    def _next_position(self) -> int:
+        row = self._conn.execute("SELECT MAX(position) FROM papers").fetchone()
+        return (row[0] if row[0] is not None else -1) + 1
+
+    def paper_exists(self, arxiv_id: str) -> bool:
+        """Check if paper already exists in index"""
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM papers WHERE arxiv_id = ?", (arxiv_id,)).fetchone() is not None
+
+    def get_paper(self, arxiv_id: str) -> Optional[Dict]:
+        """Get paper entry by arXiv ID"""
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM papers WHERE arxiv_id = ?", (arxiv_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def add_paper(self, paper_data: Dict):
+        """Add new paper to index"""
+        with self._lock, self._conn:
+            exists = self._conn.execute("SELECT 1 FROM papers WHERE arxiv_id = ?",
+                                        (paper_data['arxiv_id'],)).fetchone()
+            if not exists:
+                self._write_paper(paper_data, self._next_position())
+
+        if exists:
+            print(f"Paper {paper_data['arxiv_id']} already exists. Use update_paper() instead.")
+            return
+        print(f"Added paper {paper_data['arxiv_id']} to index")
+
+    def update_paper(self, arxiv_id: str, updates: Dict):
+        """Update existing paper entry"""
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT data, position FROM papers WHERE arxiv_id = ?", (arxiv_id,)).fetchone()
+            if row:
+                # Deep merge updates
+                self._write_paper(self._deep_merge(json.loads(row[0]), updates), row[1])
+
+        if not row:
+            print(f"Paper {arxiv_id} not found in index")
+            return
+        print(f"Updated paper {arxiv_id} in index")
+
+    def _deep_merge(self, base: Dict, updates: Dict) -> Dict:
+        """Deep merge two dictionaries"""
+        result = base.copy()
+        for key, value in updates.items():
+            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
+                result[key] = self._deep_merge(result[key], value)
+            else:
+                result[key] = value
+        return result
+
+    def query(self, tags: Optional[Iterable[str]] = None, categories: Optional[Iterable[str]] = None,
+              date_from: Optional[str] = None, date_to: Optional[str] = None,
+              sort_by: str = 'date', limit: Optional[int] = None) -> List[Dict]:
+        """
+        Find papers matching all given conditions (see IndexManager.query)
+        """
+        conditions, params = [], []
+        for tag in tags or []:
+            conditions.append("arxiv_id IN (SELECT arxiv_id FROM paper_tags WHERE tag = ?)")
+            params.append(tag)
+        for category in categories or []:
+            conditions.append("arxiv_id IN (SELECT arxiv_id FROM paper_categories WHERE category = ?)")
+            params.append(category)
+        if date_from is not None:
+            conditions.append("analyzed_date >= ?")
+            params.append(date_from)
+        if date_to is not None:
+            # U+FFFF sorts after any character, so the date_to prefix is inclusive
+            conditions.append("analyzed_date < ?")
+            params.append(date_to + '\uffff')
+
+        order = {
+            'date': "analyzed_date DESC, position",
+            'relevance': "relevance_score DESC, position",
+        }.get(sort_by, "position")
+        sql = "SELECT data FROM papers"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += f" ORDER BY {order}"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def list_papers(self, sort_by: str = 'date', limit: Optional[int] = None) -> List[Dict]:
+        """List all papers with optional sorting and limit"""
+        return self.query(sort_by=sort_by, limit=limit)
+
+    def search_by_tag(self, tag: str) -> List[Dict]:
+        """Search papers by tag"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT p.data FROM paper_tags t JOIN papers p ON p.arxiv_id = t.arxiv_id "
+                "WHERE t.tag = ? ORDER BY p.position",
+                (tag,)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def get_statistics(self) -> Dict:
+        """Get index statistics"""
+        with self._lock:
+            total = self._conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
+            statuses = self._conn.execute("SELECT status, COUNT(*) FROM papers GROUP BY status").fetchall()
+            categories = self._conn.execute(
+                "SELECT category, COUNT(*) FROM paper_categories GROUP BY category ORDER BY MIN(rowid)"
+            ).fetchall()
+        return self._statistics(total, statuses, categories)
+
+    @staticmethod
+    def _statistics(total: int, statuses: Iterable, categories: Iterable) -> Dict:
+        """Build the statistics dict from (status, count) and (category, count) rows"""
+        by_status = {
+            "analyzed_only": 0,
+            "reproduced": 0,
+            "failed": 0
+        }
+        for status, n in statuses:
+            if status == 'completed':
+                by_status['reproduced'] += n
+            elif status in ['failed', 'partial']:
+                by_status['failed'] += n
+            else:
+                by_status['analyzed_only'] += n
+
+        return {
+            "total_papers": total,
+            "by_status": by_status,
+            "by_category": dict(categories)
+        }
+
+    def verify_statistics(self, repair: bool = True) -> bool:
+        """
+        Recount statistics from the stored paper entries and compare with the
+        counts from the indexed status and category columns
+
+        Args:
+            repair: Rewrite the indexed columns of every paper from its entry if they differ
+
+        Returns:
+            True if the indexed columns were consistent
+        """
+        stored = self.get_statistics()
+        with self._lock:
+            total = self._conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
+            statuses = self._conn.execute(
+                "SELECT json_extract(data, '$.reproduction.status') AS status, COUNT(*) FROM papers GROUP BY status"
+            ).fetchall()
+            categories = self._conn.execute(
+                "SELECT c.value, COUNT(DISTINCT p.arxiv_id) FROM papers p, json_each(p.data, '$.categories') c "
+                "WHERE json_type(p.data, '$.categories') = 'array' GROUP BY c.value"
+            ).fetchall()
+        recounted = self._statistics(total, statuses, categories)
+        if stored == recounted:
+            return True
+
+        print(f"Index statistics out of date: {stored} != {recounted}")
+        if repair:
+            with self._lock, self._conn:
+                for data, position in self._conn.execute("SELECT data, position FROM papers").fetchall():
+                    self._write_paper(json.loads(data), position)
+        return False
+
+    def import_papers(self, papers: Iterable[Dict]) -> int:
+        """
+        Bulk-insert papers in one transaction, skipping IDs already present
+
+        Args:
+            papers: Paper entries in index order
+
+        Returns:
+            Number of papers added
+        """
+        added = 0
+        with self._lock, self._conn:
+            position = self._next_position()
+            for paper in papers:
+                if self._conn.execute("SELECT 1 FROM papers WHERE arxiv_id = ?",
+                                      (paper['arxiv_id'],)).fetchone():
+                    continue
+                self._write_paper(paper, position)
+                position += 1
+                added += 1
+        return added
+
+    def migrate_from_json(self, json_path: str) -> int:
+        """
+        Import an existing index.json, including writes still in its journal
+
+        Args:
+            json_path: Path to index.json
+
+        Returns:
+            Number of papers added
+        """
+        from index_manager import IndexManager
+        if not Path(json_path).exists():
+            raise FileNotFoundError(json_path)
+        return self.import_papers(IndexManager(json_path).list_papers(sort_by='index'))
+
+    def export_json(self, json_path: str):
+        """
+        Write the index in the index.json format used by IndexManager
+
+        Args:
+            json_path: Output path
+        """
+        with self._lock:
+            last_updated = self._conn.execute("SELECT value FROM meta WHERE key = 'last_updated'").fetchone()[0]
+        data = {
+            "version": INDEX_VERSION,
+            "last_updated": last_updated,
+            "papers": self.list_papers(sort_by='position'),
+            "statistics": self.get_statistics()
+        }
+        json_path = Path(json_path)
+        json_path.parent.mkdir(parents=True, exist_ok=True)
+        from index_manager import _file_lock
+        with _file_lock(json_path.with_name(json_path.name + ".lock"), exclusive=True):
+            tmp_path = json_path.with_name(f".{json_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, json_path)
+            # Writes journaled against the replaced index no longer apply
+            journal_path = json_path.with_name(json_path.name + ".journal")
+            if journal_path.exists():
+                journal_path.unlink()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Migrate an alpha-sight index between JSON and SQLite")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    migrate = subparsers.add_parser("migrate", help="Import index.json into a SQLite index")
+    migrate.add_argument("json_path", help="Source index.json")
+    migrate.add_argument("db_path", help="Target SQLite database")
+    export = subparsers.add_parser("export", help="Export a SQLite index to index.json")
+    export.add_argument("db_path", help="Source SQLite database")
+    export.add_argument("json_path", help="Target index.json")
+    args = parser.parse_args()
+
+    manager = SQLiteIndexManager(args.db_path)
+    try:
+        if args.command == "migrate":
+            added = manager.migrate_from_json(args.json_path)
+            print(f"Imported {added} papers into {args.db_path}")
+        else:
+            manager.export_json(args.json_path)
+            print(f"Exported {manager.get_statistics()['total_papers']} papers to {args.json_path}")
+    finally:
+        manager.close()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Metadata Store for Alpha-Sight
+Local SQLite cache of arXiv paper metadata keyed by arXiv ID and version
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+_VERSION = re.compile(r"v(\d+)$")
+
+
+def split_version(arxiv_id: str) -> Tuple[str, Optional[int]]:
+    """
+    Split an arXiv ID into base ID and version
+
+    Args:
+        arxiv_id: arXiv ID, optionally versioned (e.g., "2401.12345v2")
+
+    Returns:
+        (base_id, version or None)
+    """
+    match = _VERSION.search(arxiv_id)
+    if match:
+        return arxiv_id[:match.start()], int(match.group(1))
+    return arxiv_id, None
+
+
+class MetadataStore:
+    """SQLite-backed store for arXiv metadata"""
+
+    def __init__(self, db_path: str, ttl: float = 7 * 24 * 3600):
+        """
+        Initialize metadata store
+
+        Args:
+            db_path: Path to the SQLite database file
+            ttl: Seconds after which unversioned lookups are refreshed from arXiv
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS papers (
+                arxiv_id TEXT NOT NULL,
+                version INTEGER NOT NULL,
+                data TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (arxiv_id, version)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get(self, arxiv_id: str) -> Optional[Dict]:
+        """
+        Get stored metadata
+
+        A versioned ID returns that exact version; versions never change, so
+        they do not expire. An unversioned ID returns the latest stored version
+        unless it is older than the TTL.
+
+        Args:
+            arxiv_id: arXiv ID, optionally versioned
+
+        Returns:
+            Metadata dictionary or None if missing or stale
+        """
+        base_id, version = split_version(arxiv_id)
+        with self._lock:
+            if version is not None:
+                row = self._conn.execute(
+                    "SELECT data, fetched_at FROM papers WHERE arxiv_id = ? AND version = ?",
+                    (base_id, version)
+                ).fetchone()
+            else:
+                row = self._conn.execute(
+                    "SELECT data, fetched_at FROM papers WHERE arxiv_id = ? ORDER BY version DESC LIMIT 1",
+                    (base_id,)
+                ).fetchone()
+
+        if row is None:
+            return None
+        data, fetched_at = row
+        if version is None and time.time() - fetched_at > self.ttl:
+            return None
+        return json.loads(data)
+
+    def put(self, base_id: str, version: int, metadata: Dict):
+        """
+        Store metadata for one paper version
+
+        Args:
+            base_id: arXiv ID without version
+            version: Version number
+            metadata: Metadata dictionary
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO papers (arxiv_id, version, data, fetched_at) VALUES (?, ?, ?, ?)",
+                (base_id, version, json.dumps(metadata, ensure_ascii=False), time.time())
+            )
+            self._conn.commit()
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Paper Pipeline for Alpha-Sight
+Fetches metadata, PDFs and citation data for many papers at once, renders
+their initial reports and records them in a single index commit
+"""
+
+import sys
+import io
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from arxiv_fetcher import ArxivFetcher
+from index_manager import _now, open_index
+from report_generator import ReportGenerator
+from semantic_scholar_fetcher import SemanticScholarFetcher
+
+# Fix Windows console encoding issue
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+
+class PaperPipeline:
+    """
+    Acquire and report on many papers concurrently
+
+    The fetchers stay synchronous (requests, the shared CachedSession and the
+    S2 token bucket); an asyncio event loop schedules their calls on a thread
+    pool. Per service:
+
+    - arXiv API: one fetch_metadata_many() call for every ID, which batches
+      BATCH_SIZE IDs per request and keeps arXiv's request spacing
+    - Semantic Scholar: one fetch_many() call for citation counts, batched
+      and rate limited by the shared token bucket (citation lists are not paged)
+    - PDFs: one download per paper, at most pdf_concurrency at a time
+    - Reports: rendered and saved one at a time, as each paper's inputs arrive
+
+    Papers are added to (or updated in) the index in one batch at the end.
+    Papers already in the index only get the fields this run fetched; their
+    existing reports are left alone.
+    """
+
+    def __init__(self, arxiv: Optional[ArxivFetcher] = None, s2: Optional[SemanticScholarFetcher] = None,
+                 generator: Optional[ReportGenerator] = None, index_path: Optional[str] = None,
+                 reports_dir: Optional[str] = None, pdf_concurrency: int = 4,
+                 download_pdfs: bool = True, fetch_citations: bool = True):
+        """
+        Initialize pipeline
+
+        Args:
+            arxiv: arXiv fetcher (default: ArxivFetcher())
+            s2: Semantic Scholar fetcher (default: SemanticScholarFetcher())
+            generator: Report generator (default: ReportGenerator())
+            index_path: index.json or SQLite index (default: project index)
+            reports_dir: Reports directory (default: ./alpha-sight/reports)
+            pdf_concurrency: PDF downloads in flight at once
+            download_pdfs: Download each paper's PDF
+            fetch_citations: Fetch citation data from Semantic Scholar
+        """
+        if reports_dir is None:
+            # Get project root (4 levels up from scripts directory)
+            project_root = Path(__file__).parent.parent.parent.parent
+            reports_dir = project_root / "alpha-sight" / "reports"
+        self.arxiv = arxiv or ArxivFetcher()
+        self.s2 = s2 if s2 is not None or not fetch_citations else SemanticScholarFetcher()
+        self.generator = generator or ReportGenerator()
+        self.index = open_index(index_path)
+        self.reports_dir = Path(reports_dir)
+        self.pdf_concurrency = pdf_concurrency
+        self.download_pdfs = download_pdfs
+        self.fetch_citations = fetch_citations
+
+    def run(self, arxiv_ids: List[str], language: str = "english", depth: str = "medium") -> Dict:
+        """Run the pipeline from synchronous code; see run_async()"""
+        return asyncio.run(self.run_async(arxiv_ids, language, depth))
+
+    async def run_async(self, arxiv_ids: List[str], language: str = "english",
+                        depth: str = "medium") -> Dict:
+        """
+        Fetch, report on and index many papers
+
+        Args:
+            arxiv_ids: arXiv IDs, optionally versioned
+            language: Report language
+            depth: Analysis depth recorded in reports and the index
+
+        Returns:
+            Lists of arXiv IDs: 'added' and 'updated' in the index, 'missing'
+            (no arXiv metadata), 'pdf_failed' and 'no_citations'
+        """
+        ids = list(dict.fromkeys(self.arxiv._clean_id(i) for i in arxiv_ids))
+        loop = asyncio.get_running_loop()
+        pool = ThreadPoolExecutor(max_workers=self.pdf_concurrency + 3)
+        pdf_slots = asyncio.Semaphore(self.pdf_concurrency)
+        report_slot = asyncio.Semaphore(1)  # ReportManifest is not thread-safe
+
+        def call(fn, *args):
+            return loop.run_in_executor(pool, fn, *args)
+
+        async def download(arxiv_id):
+            if not self.download_pdfs:
+                return None
+            async with pdf_slots:
+                return await call(self.arxiv.download_pdf, arxiv_id)
+
+        async def fetch_citations():
+            if not self.fetch_citations:
+                return {}
+            # Only the counts are indexed; top_n=0 keeps it to one request per batch
+            found, _ = await call(self.s2.fetch_many, ids, 0)
+            return found
+
+        metadata_task = asyncio.ensure_future(call(self.arxiv.fetch_metadata_many, ids))
+        citations_task = asyncio.ensure_future(fetch_citations())
+
+        async def process(arxiv_id):
+            pdf_path = await download(arxiv_id)
+            metadata = (await metadata_task).get(arxiv_id)
+            if metadata is None:
+                return None
+            citations = (await citations_task).get(arxiv_id)
+            existing = self.index.get_paper(arxiv_id)
+            report_path = self._report_path(arxiv_id, existing)
+            if not report_path.exists():
+                async with report_slot:
+                    await call(self._write_report, arxiv_id, metadata, citations, existing,
+                               language, depth, report_path)
+            return metadata, citations, pdf_path, report_path, existing
+
+        try:
+            results = await asyncio.gather(*(process(arxiv_id) for arxiv_id in ids))
+        finally:
+            pool.shutdown(wait=False)
+
+        stats = {"added": [], "updated": [], "missing": [], "pdf_failed": [], "no_citations": []}
+        with getattr(self.index, 'batch', nullcontext)():
+            for arxiv_id, result in zip(ids, results):
+                if result is None:
+                    stats["missing"].append(arxiv_id)
+                    continue
+                metadata, citations, pdf_path, report_path, existing = result
+                if self.download_pdfs and pdf_path is None:
+                    stats["pdf_failed"].append(arxiv_id)
+                if self.fetch_citations and citations is None:
+                    stats["no_citations"].append(arxiv_id)
+                if existing is not None:
+                    self.index.update_paper(arxiv_id, self._index_updates(metadata, citations, pdf_path))
+                    stats["updated"].append(arxiv_id)
+                else:
+                    self.index.add_paper(self._index_entry(metadata, citations, pdf_path, report_path,
+                                                           language, depth))
+                    stats["added"].append(arxiv_id)
+        return stats
+
+    def _report_path(self, arxiv_id: str, existing: Optional[Dict]) -> Path:
+        """Report recorded in the index entry, or the default path for a new paper"""
+        recorded = (existing or {}).get("analysis", {}).get("report_path")
+        return Path(recorded) if recorded else self.reports_dir / f"{arxiv_id}_analysis.md"
+
+    def _write_report(self, arxiv_id: str, metadata: Dict, citations: Optional[Dict], existing: Optional[Dict],
+                      language: str, depth: str, report_path: Path):
+        """Render a missing report, from the stored analysis when the paper is already indexed"""
+        existing = existing or {}
+        report = self.generator.generate_report(arxiv_id, metadata, existing.get("analysis"),
+                                                existing.get("reproduction"), citations, language=language,
+                                                depth=depth, output_path=report_path)
+        self.generator.save_report(report, report_path)
+
+    @staticmethod
+    def _index_updates(metadata: Dict, citations: Optional[Dict], pdf_path: Optional[Path]) -> Dict:
+        """Fields of an indexed paper refreshed by this run; everything else is kept"""
+        updates = {key: metadata[key] for key in
+                   ("title", "authors", "published_date", "categories", "abstract")}
+        if pdf_path:
+            updates["analysis"] = {"pdf_path": str(pdf_path)}
+        if citations:
+            updates["citations"] = {"cited_by_count": citations.get("citation_count", 0),
+                                    "references_count": citations.get("reference_count", 0)}
+        return updates
+
+    @staticmethod
+    def _index_entry(metadata: Dict, citations: Optional[Dict], pdf_path: Optional[Path],
+                     report_path: Path, language: str, depth: str) -> Dict:
+        """Build the index entry of a freshly acquired paper"""
+        entry = {
+            "arxiv_id": metadata["arxiv_id"],
+            "title": metadata["title"],
+            "authors": metadata["authors"],
+            "published_date": metadata["published_date"],
+            "analyzed_date": _now(),
+            "categories": metadata["categories"],
+            "abstract": metadata["abstract"],
+            "analysis": {
+                "depth": depth,
+                "language": language,
+                "report_path": str(report_path),
+                "pdf_path": str(pdf_path) if pdf_path else None
+            },
+            "reproduction": {
+                "status": "not_started",
+                "method": "none",
+                "repo_url": None,
+                "sandbox_path": None,
+                "iterations": 0,
+                "success_rate": 0.0,
+                "notes": ""
+            },
+            "tags": []
+        }
+        if citations:
+            entry["citations"] = {
+                "cited_by_count": citations.get("citation_count", 0),
+                "references_count": citations.get("reference_count", 0),
+                "related_papers": []
+            }
+        return entry
+
+
+def main():
+    """Command-line interface"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Fetch, report on and index many papers at once")
+    parser.add_argument("arxiv_ids", nargs="+", help="arXiv IDs")
+    parser.add_argument("--language", choices=["english", "chinese"], default="english",
+                        help="Report language (default: english)")
+    parser.add_argument("--depth", choices=["shallow", "medium", "deep"], default="medium",
+                        help="Analysis depth (default: medium)")
+    parser.add_argument("--index", help="index.json or SQLite index (default: project index)")
+    parser.add_argument("--reports-dir", help="Reports directory (default: ./alpha-sight/reports)")
+    parser.add_argument("--papers-dir", help="PDF directory (default: ./alpha-sight/papers)")
+    parser.add_argument("--pdf-concurrency", type=int, default=4, help="PDF downloads at once (default: 4)")
+    parser.add_argument("--no-pdf", action="store_true", help="Skip PDF downloads")
+    parser.add_argument("--no-citations", action="store_true", help="Skip Semantic Scholar")
+    parser.add_argument("--skill-path", help="Path to alpha-sight skill directory (optional)")
+    args = parser.parse_args()
+
+    pipeline = PaperPipeline(arxiv=ArxivFetcher(output_dir=args.papers_dir),
+                             generator=ReportGenerator(args.skill_path), index_path=args.index,
+                             reports_dir=args.reports_dir, pdf_concurrency=args.pdf_concurrency,
+                             download_pdfs=not args.no_pdf, fetch_citations=not args.no_citations)
+    print(f"Processing {len(args.arxiv_ids)} papers...")
+    stats = pipeline.run(args.arxiv_ids, language=args.language, depth=args.depth)
+
+    print(f"\n✓ Added: {len(stats['added'])}, updated: {len(stats['updated'])}")
+    if stats["no_citations"]:
+        print(f"No citation data for: {', '.join(stats['no_citations'])}")
+    if stats["pdf_failed"]:
+        print(f"✗ PDF download failed: {', '.join(stats['pdf_failed'])}")
+    if stats["missing"]:
+        print(f"✗ No arXiv metadata for: {', '.join(stats['missing'])}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PDF Download Manager for Alpha-Sight
+Parallel, resumable PDF downloads with per-host concurrency limits
+"""
+
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+PDF_MAGIC = b"%PDF-"
+CONTENT_RANGE_PATTERN = re.compile(r"bytes (\d+)-\d+/(\d+|\*)")
+
+
+def is_pdf(path: Path) -> bool:
+    """Check that a file starts with the %PDF- header"""
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(PDF_MAGIC)) == PDF_MAGIC
+    except OSError:
+        return False
+
+
+class DownloadError(Exception):
+    """A download produced a response that cannot become a valid PDF"""
+
+
+class PdfDownloader:
+    """Downloads PDFs through .part files and renames them once validated"""
+
+    def __init__(self, max_workers: int = 8, per_host: int = 4,
+                 chunk_size: int = 256 * 1024, max_retries: int = 3,
+                 timeout: float = 60):
+        """
+        Initialize download manager
+
+        Args:
+            max_workers: Concurrent downloads across all hosts
+            per_host: Concurrent downloads against a single host
+            chunk_size: Bytes read from the socket and written to disk per step
+            max_retries: Attempts per file; later attempts resume with Range
+            timeout: Connect/read timeout in seconds
+        """
+        self.max_workers = max_workers
+        self.per_host = per_host
+        self.chunk_size = chunk_size
+        self.max_retries = max_retries
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.per_host)
+            return self._host_slots[host]
+
+    def download(self, url: str, dest: Path, max_retries: int = None) -> Optional[Path]:
+        """
+        Download one PDF
+
+        The body is written to ``<dest>.part``. A failed attempt keeps the
+        partial file and the next attempt asks for the remaining bytes with an
+        HTTP Range request. The file is renamed to ``dest`` only after the
+        %PDF header and the advertised length have been checked.
+
+        Args:
+            url: PDF URL
+            dest: Final file path
+            max_retries: Override the manager's attempt count
+
+        Returns:
+            Path to the PDF or None if failed
+        """
+        dest = Path(dest)
+        if dest.exists():
+            if is_pdf(dest):
+                print(f"PDF already exists: {dest}")
+                return dest
+            print(f"Discarding invalid PDF: {dest}")
+            dest.unlink()
+
+        if max_retries is None:
+            max_retries = self.max_retries
+        part = dest.with_name(dest.name + ".part")
+        for attempt in range(max_retries):
+            try:
+                with self._host_slot(url):
+                    self._fetch(url, part)
+                os.replace(part, dest)
+                print(f"PDF downloaded: {dest}")
+                return dest
+
+            except DownloadError as e:
+                print(f"Download of {url} failed: {e}")
+                part.unlink(missing_ok=True)
+                return None
+            except (requests.RequestException, OSError) as e:
+                print(f"Download attempt {attempt + 1}/{max_retries} for {url} failed: {e}")
+                if attempt < max_retries - 1:
+                    time.sleep(2 ** attempt)  # Exponential backoff
+
+        print(f"Max retries reached. Download failed: {url}")
+        return None
+
+    def _fetch(self, url: str, part: Path):
+        """
+        Fill the .part file, resuming from its current size
+
+        Raises:
+            DownloadError: If the response is not a PDF
+            requests.RequestException: On HTTP or connection errors
+            OSError: If the body is shorter than advertised
+        """
+        offset = part.stat().st_size if part.exists() else 0
+        # Ask for the raw body so Content-Length matches the bytes written
+        headers = {"Accept-Encoding": "identity"}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+
+        with self.session.get(url, headers=headers, timeout=self.timeout, stream=True) as response:
+            if response.status_code == 416:
+                # Range starts at or past the end: the part file may already be whole
+                total = response.headers.get("Content-Range", "").rpartition("/")[2]
+                if total.isdigit() and int(total) == offset:
+                    self._validate(part, offset)
+                    return
+                part.unlink()
+                raise requests.HTTPError(f"416 Range Not Satisfiable for offset {offset}")
+            response.raise_for_status()
+
+            expected = None
+            if response.status_code == 206:
+                match = CONTENT_RANGE_PATTERN.match(response.headers.get("Content-Range", ""))
+                if not match or int(match.group(1)) != offset:
+                    raise requests.HTTPError("Unexpected Content-Range in partial response")
+                if match.group(2) != "*":
+                    expected = int(match.group(2))
+                mode = 'ab'
+            else:
+                # Server ignored the Range header and sent the whole file
+                offset = 0
+                mode = 'wb'
+            if expected is None and "Content-Length" in response.headers:
+                expected = offset + int(response.headers["Content-Length"])
+
+            with open(part, mode, buffering=self.chunk_size) as f:
+                for chunk in response.iter_content(chunk_size=self.chunk_size):
+                    if offset == 0 and f.tell() == 0 and not chunk.startswith(PDF_MAGIC[:len(chunk)]):
+                        raise DownloadError("response is not a PDF")
+                    f.write(chunk)
+
+        self._validate(part, expected)
+
+    def _validate(self, part: Path, expected: Optional[int]):
+        """Check the %PDF header and the final length of a .part file"""
+        if not is_pdf(part):
+            raise DownloadError("response is not a PDF")
+        size = part.stat().st_size
+        if expected is not None and size != expected:
+            if size > expected:
+                raise DownloadError(f"received {size} bytes, expected {expected}")
+            raise OSError(f"incomplete download: {size} of {expected} bytes")
+
+    def download_many(self, jobs: List[Tuple[str, Path]]) -> Dict[Path, Optional[Path]]:
+        """
+        Download many PDFs with a worker pool
+
+        Args:
+            jobs: (url, dest) pairs
+
+        Returns:
+            Dictionary mapping each dest to its downloaded path, or None if failed
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {Path(dest): pool.submit(self.download, url, dest) for url, dest in jobs}
+        return {dest: future.result() for dest, future in futures.items()}
@@ -8,9 +8,13 @@ Generates analysis reports from templates
 import sys
 import io
 import os
+import re
 import json
+import hashlib
+import threading
+import uuid
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 # Fix Windows console encoding issue
@@ -18,6 +22,183 @@ if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
+# Bump when _prepare_variables or rendering changes, so existing reports are regenerated
+GENERATOR_VERSION = "2"
+
+# A placeholder is "{name}" on a single line with no nested braces
+_PLACEHOLDER = re.compile(r"\{([^{}\n]+)\}")
+
+
+class CompiledTemplate:
+    """Template split once into literal and placeholder segments"""
+
+    def __init__(self, source: str):
+        """
+        Compile template source
+
+        Args:
+            source: Template text with {name} placeholders
+        """
+        self.source = source
+        self.digest = hashlib.sha256(source.encode('utf-8')).hexdigest()
+        # re.split with one group alternates literal, name, literal, ...
+        self._parts: List[str] = _PLACEHOLDER.split(source)
+        self.placeholders: List[str] = self._parts[1::2]
+        self._slots = [(name, "{" + name + "}") for name in self.placeholders]
+
+    def render(self, variables: Dict) -> str:
+        """
+        Fill every placeholder in one pass; unknown placeholders are kept as-is
+
+        Args:
+            variables: Dictionary of variables
+
+        Returns:
+            Filled template
+        """
+        get = variables.get
+        parts = self._parts[:]
+        parts[1::2] = [str(get(name, placeholder)) for name, placeholder in self._slots]
+        return "".join(parts)
+
+
+def _atomic_write(path: Path, content: str):
+    """Write content to a temp file next to path and move it into place"""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def input_digest(*inputs) -> str:
+    """SHA-256 of JSON-serializable report inputs (key order does not matter)"""
+    payload = json.dumps(inputs, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class Report(str):
+    """Report text that remembers the manifest entry it was generated from"""
+
+    manifest_entry: Optional[Dict] = None
+
+
+class ReportManifest:
+    """
+    Record of what each report in a directory was generated from
+
+    Stored as .report_manifest.jsonl next to the reports: an append-only log
+    of {"name": report file name, "entry": digests of its inputs and template
+    and the generator version}, where the last line for a name wins. Saving
+    appends only the changed entries; the log is rewritten when mostly stale,
+    starting with a new {"generation": ...} line so that other processes
+    notice the rewrite and read it from the start.
+    """
+
+    FILENAME = ".report_manifest.jsonl"
+
+    def __init__(self, reports_dir: str):
+        """
+        Load the manifest of a reports directory
+
+        Args:
+            reports_dir: Directory holding the reports
+        """
+        self.path = Path(reports_dir) / self.FILENAME
+        self._lock = threading.Lock()
+        self._offset = 0  # Bytes of the log already read
+        self._head = b""  # First line of the log as read, changed by every rewrite
+        self._lines = 0
+        self._pending: List[str] = []
+        self.entries: Dict[str, Dict] = {}
+        self.refresh()
+
+    def refresh(self):
+        """Read entries other processes appended since the last refresh"""
+        with self._lock:
+            try:
+                f = open(self.path, 'rb')
+            except FileNotFoundError:
+                if self._offset:
+                    self._offset, self._lines, self._head, self.entries = 0, 0, b"", {}
+                return
+            with f:
+                head = f.readline()
+                if self._offset and head != self._head:
+                    # Rewritten by a compaction elsewhere: start over
+                    self._offset, self._lines, self.entries = 0, 0, {}
+                f.seek(self._offset)
+                tail = f.read()
+            if not self._offset and head.endswith(b'\n'):
+                self._head = head
+            for line in tail.split(b'\n')[:-1]:
+                self._offset += len(line) + 1
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if "generation" in record:
+                    continue
+                self._lines += 1
+                self._apply(record)
+            # Unsaved entries will be appended after everything read so far
+            for line in self._pending:
+                self._apply(json.loads(line))
+
+    def _apply(self, record: Dict):
+        if record["entry"] is None:
+            self.entries.pop(record["name"], None)
+        else:
+            self.entries[record["name"]] = record["entry"]
+
+    def is_fresh(self, report_path: Path, entry: Dict) -> bool:
+        """True if report_path exists and was generated from entry's inputs"""
+        with self._lock:
+            return self.entries.get(Path(report_path).name) == entry and Path(report_path).exists()
+
+    def record(self, report_path: Path, entry: Optional[Dict]):
+        """Set (or with None, drop) the entry of report_path"""
+        name = Path(report_path).name
+        with self._lock:
+            if entry is None and name not in self.entries:
+                return
+            if entry is None:
+                del self.entries[name]
+            else:
+                self.entries[name] = entry
+            self._pending.append(json.dumps({"name": name, "entry": entry}, sort_keys=True))
+
+    def save(self):
+        """Append unsaved entries to the log, compacting it when most lines are stale"""
+        self.refresh()
+        with self._lock:
+            if not self._pending:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if self._lines + len(self._pending) > 2 * len(self.entries) + 100:
+                lines = [json.dumps({"name": name, "entry": entry}, sort_keys=True)
+                         for name, entry in sorted(self.entries.items())]
+                head = json.dumps({"generation": uuid.uuid4().hex}) + "\n"
+                content = head + "".join(line + "\n" for line in lines)
+                _atomic_write(self.path, content)
+                self._head = head.encode('utf-8')
+                self._offset = len(content.encode('utf-8'))
+                self._lines = len(lines)
+            else:
+                # The next refresh reads these lines back (harmlessly), along
+                # with anything another process appended in between
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write("".join(line + "\n" for line in self._pending))
+            self._pending = []
+
+
+# Compiled templates by path, with the (mtime, size) they were read at
+_template_cache: Dict[Path, Tuple[Tuple[int, int], CompiledTemplate]] = {}
+_template_cache_lock = threading.Lock()
+
 
 class ReportGenerator:
     """Generator for analysis reports"""
@@ -35,6 +216,7 @@ class ReportGenerator:
             skill_path = script_dir.parent
         self.skill_path = Path(skill_path)
         self.assets_path = self.skill_path / "assets"
+        self._manifests: Dict[Path, ReportManifest] = {}
 
     def load_template(self, language: str = "english") -> str:
         """
@@ -46,16 +228,39 @@ class ReportGenerator:
         Returns:
             Template content as string
         """
+        return self.compile_template(language).source
+
+    def compile_template(self, language: str = "english") -> CompiledTemplate:
+        """
+        Load and compile report template, reusing the compiled form until the file changes
+
+        Args:
+            language: Report language (english or chinese)
+
+        Returns:
+            Compiled template
+        """
         if language == "chinese":
             template_file = self.assets_path / "report_template_zh.md"
         else:
             template_file = self.assets_path / "report_template_en.md"
 
-        if not template_file.exists():
+        try:
+            stat = template_file.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(f"Template not found: {template_file}")
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        with _template_cache_lock:
+            cached = _template_cache.get(template_file)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
 
         with open(template_file, 'r', encoding='utf-8') as f:
-            return f.read()
+            compiled = CompiledTemplate(f.read())
+        with _template_cache_lock:
+            _template_cache[template_file] = (stamp, compiled)
+        return compiled
 
     def generate_report(
         self,
@@ -65,7 +270,8 @@ class ReportGenerator:
         reproduction: Optional[Dict] = None,
         citations: Optional[Dict] = None,
         language: str = "english",
-        depth: str = "medium"
+        depth: str = "medium",
+        output_path: Optional[str] = None
     ) -> str:
         """
         Generate report from template and data
@@ -78,12 +284,25 @@ class ReportGenerator:
             citations: Citation data dictionary (optional)
             language: Report language
             depth: Analysis depth
+            output_path: Where the report will be saved (optional); if the
+                report there was generated from the same inputs, template and
+                generator version, it is returned without rendering
 
         Returns:
-            Generated report content
+            Generated report content, carrying its manifest entry for save_report()
         """
         # Load template
-        template = self.load_template(language)
+        template = self.compile_template(language)
+        entry = self.manifest_entry(template, arxiv_id, metadata, analysis, reproduction,
+                                    citations, language, depth)
+
+        if output_path is not None:
+            output_path = Path(output_path)
+            if self.manifest(output_path.parent).is_fresh(output_path, entry):
+                with open(output_path, 'r', encoding='utf-8') as f:
+                    report = Report(f.read())
+                report.manifest_entry = entry
+                return report
 
         # Prepare variables
         variables = self._prepare_variables(
@@ -97,10 +316,32 @@ class ReportGenerator:
         )
 
         # Fill template
-        report = self._fill_template(template, variables)
+        report = Report(self._fill_template(template, variables))
+        report.manifest_entry = entry
 
         return report
 
+    @staticmethod
+    def manifest_entry(template: CompiledTemplate, *inputs) -> Dict:
+        """
+        Manifest entry of a report: digests of its inputs and template, and the generator version
+
+        Args:
+            template: Compiled template the report is rendered from
+            *inputs: Everything else the report depends on (IDs, input dicts, language, depth)
+        """
+        return {"inputs": input_digest(*inputs), "template": template.digest, "generator": GENERATOR_VERSION}
+
+    def manifest(self, reports_dir: Path) -> ReportManifest:
+        """Return the (cached, refreshed) manifest of a reports directory"""
+        reports_dir = Path(reports_dir)
+        manifest = self._manifests.get(reports_dir)
+        if manifest is None:
+            manifest = self._manifests[reports_dir] = ReportManifest(reports_dir)
+        else:
+            manifest.refresh()
+        return manifest
+
     def _prepare_variables(
         self,
         arxiv_id: str,
@@ -163,39 +404,48 @@ class ReportGenerator:
 
         return variables
 
-    def _fill_template(self, template: str, variables: Dict) -> str:
+    def _fill_template(self, template, variables: Dict) -> str:
         """
         Fill template with variables
 
         Args:
-            template: Template content
+            template: Template content or CompiledTemplate
             variables: Dictionary of variables
 
         Returns:
             Filled template
         """
-        result = template
-        for key, value in variables.items():
-            placeholder = "{" + key + "}"
-            result = result.replace(placeholder, str(value))
+        if not isinstance(template, CompiledTemplate):
+            template = CompiledTemplate(template)
+        return template.render(variables)
 
-        return result
-
-    def save_report(self, report: str, output_path: str):
+    def save_report(self, report: str, output_path: str) -> bool:
         """
         Save report to file
 
         Args:
-            report: Report content
+            report: Report content (from generate_report, or any text)
             output_path: Output file path
+
+        Returns:
+            False if the file already held this report and was left untouched
         """
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(report)
+        manifest = self.manifest(output_path.parent)
+        entry = getattr(report, 'manifest_entry', None)
+        if entry is not None and manifest.is_fresh(output_path, entry):
+            print(f"✓ Report unchanged: {output_path}")
+            return False
+
+        _atomic_write(output_path, report)
+        # Text without an entry was not generated here; forget what the file was built from
+        manifest.record(output_path, entry)
+        manifest.save()
 
         print(f"✓ Report saved to: {output_path}")
+        return True
 
     def generate_from_files(
         self,
@@ -255,7 +505,8 @@ class ReportGenerator:
             reproduction=reproduction,
             citations=citations,
             language=language,
-            depth=depth
+            depth=depth,
+            output_path=output_file
         )
 
         # Save if output file specified
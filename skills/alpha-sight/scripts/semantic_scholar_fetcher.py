@@ -11,9 +11,14 @@ import os
 import requests
 import json
 from pathlib import Path
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple
+import threading
 import time
 
+from http_cache import CachedSession, get_shared_session
+from rate_limiter import TokenBucket, backoff_delay, parse_retry_after
+
 # Fix Windows console encoding issue
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
@@ -24,62 +29,157 @@ class SemanticScholarFetcher:
     """Fetcher for Semantic Scholar API"""
 
     BASE_URL = "https://api.semanticscholar.org/graph/v1"
-
-    def __init__(self, api_key: Optional[str] = None):
+    BATCH_SIZE = 500  # IDs per POST /paper/batch call
+
+    # Published quotas: requests per RATE_WINDOW seconds
+    RATE_WINDOW = 300
+    QUOTA_WITH_KEY = 5000
+    QUOTA_WITHOUT_KEY = 100
+    MAX_RETRIES = 5  # Attempts per request on 429, 5xx and connection errors
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    # One bucket per quota, shared by every fetcher instance and thread
+    _limiters: Dict[bool, TokenBucket] = {}
+    _limiters_lock = threading.Lock()
+
+    # Fields requested for paper data; citations and references are paged
+    # separately so popular papers do not inline thousands of entries
+    PAPER_FIELDS = [
+        "paperId",
+        "title",
+        "abstract",
+        "year",
+        "citationCount",
+        "referenceCount",
+        "influentialCitationCount",
+        "externalIds",
+        "url"
+    ]
+
+    # Fields requested for each citing / referenced paper
+    LINK_FIELDS = ["title", "year", "citationCount"]
+    PAGE_SIZE = 100  # Default page size for /citations and /references (API max: 1000)
+    TOP_N = 10  # Citations and references kept in paper data by default
+    INLINE_LINK_LIMIT = 50  # fetch_many inlines link lists up to this size
+
+    def __init__(self, api_key: Optional[str] = None, session: requests.Session = None):
         """
         Initialize fetcher with optional API key
 
         Args:
             api_key: Semantic Scholar API key (optional, for higher rate limits)
+            session: HTTP session (default: the shared CachedSession)
         """
         self.api_key = api_key or os.getenv("SEMANTIC_SCHOLAR_API_KEY")
         self.headers = {}
         if self.api_key:
             self.headers["x-api-key"] = self.api_key
 
-    def fetch_paper_data(self, arxiv_id: str) -> Optional[Dict]:
+        # Paper data fetched during this session, keyed by arXiv ID
+        self._papers: Dict[str, Dict] = {}
+
+        self.session = session or get_shared_session()
+        self.limiter = self.shared_limiter(bool(self.api_key))
+
+    @classmethod
+    def shared_limiter(cls, has_api_key: bool) -> TokenBucket:
+        """
+        Get the process-wide token bucket for a quota
+
+        The burst capacity is taken out of the steady rate, so even a full
+        burst followed by steady traffic stays within the quota for any
+        RATE_WINDOW-second window.
+
+        Args:
+            has_api_key: Whether requests are authenticated
+
+        Returns:
+            Shared TokenBucket
+        """
+        with cls._limiters_lock:
+            if has_api_key not in cls._limiters:
+                quota = cls.QUOTA_WITH_KEY if has_api_key else cls.QUOTA_WITHOUT_KEY
+                burst = max(1, quota // 20)
+                cls._limiters[has_api_key] = TokenBucket((quota - burst) / cls.RATE_WINDOW, capacity=burst)
+            return cls._limiters[has_api_key]
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send an API request through the shared rate limiter
+
+        Callers queue on the token bucket instead of failing; responses served
+        from the HTTP cache do not take a token. Throttled (429) and server
+        error responses are retried after Retry-After, or after a jittered
+        exponential backoff when the header is missing; a 429 also pauses the
+        shared bucket so other callers back off too.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Passed to requests.Session.request (cache_ttl is
+                honored by CachedSession and dropped otherwise)
+
+        Returns:
+            The final response, which may still be an error after MAX_RETRIES
+
+        Raises:
+            requests.RequestException: If the last attempt fails to connect
+        """
+        cached = isinstance(self.session, CachedSession)
+        if cached:
+            kwargs["throttle"] = self.limiter.acquire
+        else:
+            kwargs.pop("cache_ttl", None)
+        for attempt in range(self.MAX_RETRIES):
+            if not cached:
+                self.limiter.acquire()
+            try:
+                response = self.session.request(method, url, headers=self.headers, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.MAX_RETRIES - 1:
+                    raise
+                time.sleep(backoff_delay(attempt))
+                continue
+
+            if response.status_code not in self.RETRY_STATUSES or attempt == self.MAX_RETRIES - 1:
+                return response
+
+            delay = parse_retry_after(response.headers.get("Retry-After"))
+            if delay is None:
+                delay = backoff_delay(attempt)
+            if response.status_code == 429:
+                self.limiter.pause(delay)
+            else:
+                time.sleep(delay)
+            response.close()
+
+        return response
+
+    def fetch_paper_data(self, arxiv_id: str, top_n: int = TOP_N) -> Optional[Dict]:
         """
         Fetch paper data from Semantic Scholar
 
         Args:
             arxiv_id: arXiv ID (e.g., "2401.12345")
+            top_n: Citations and references to include (0 to skip them)
 
         Returns:
             Dictionary with paper data or None if failed
         """
         # Clean arxiv_id
-        arxiv_id = arxiv_id.replace("arxiv:", "").replace("arXiv:", "").strip()
+        arxiv_id = self._clean_id(arxiv_id)
+        if arxiv_id in self._papers:
+            return self._with_links(self._papers[arxiv_id], top_n)
 
         # Build API URL
         url = f"{self.BASE_URL}/paper/arXiv:{arxiv_id}"
 
-        # Request fields
-        fields = [
-            "paperId",
-            "title",
-            "abstract",
-            "year",
-            "citationCount",
-            "referenceCount",
-            "influentialCitationCount",
-            "citations",
-            "citations.title",
-            "citations.year",
-            "citations.citationCount",
-            "references",
-            "references.title",
-            "references.year",
-            "references.citationCount",
-            "externalIds",
-            "url"
-        ]
-
-        params = {"fields": ",".join(fields)}
+        params = {"fields": ",".join(self.PAPER_FIELDS)}
 
         try:
-            response = requests.get(
+            response = self._request(
+                "GET",
                 url,
-                headers=self.headers,
                 params=params,
                 timeout=30
             )
@@ -90,31 +190,14 @@ class SemanticScholarFetcher:
                 return None
 
             if response.status_code == 429:
-                print("Rate limit exceeded")
-                if not self.api_key:
-                    print("Consider getting an API key from https://www.semanticscholar.org/product/api")
+                self._report_rate_limit()
                 return None
 
             response.raise_for_status()
 
-            data = response.json()
-
-            # Extract relevant information
-            paper_data = {
-                "paper_id": data.get("paperId"),
-                "title": data.get("title"),
-                "abstract": data.get("abstract"),
-                "year": data.get("year"),
-                "citation_count": data.get("citationCount", 0),
-                "reference_count": data.get("referenceCount", 0),
-                "influential_citation_count": data.get("influentialCitationCount", 0),
-                "url": data.get("url"),
-                "external_ids": data.get("externalIds", {}),
-                "citations": self._extract_paper_list(data.get("citations", []), limit=10),
-                "references": self._extract_paper_list(data.get("references", []), limit=10)
-            }
-
-            return paper_data
+            paper_data = self._to_paper_data(response.json())
+            self._papers[arxiv_id] = paper_data
+            return self._with_links(paper_data, top_n)
 
         except requests.RequestException as e:
             print(f"Error fetching from Semantic Scholar: {e}")
@@ -123,6 +206,228 @@ class SemanticScholarFetcher:
             print(f"Error parsing JSON response: {e}")
             return None
 
+    def fetch_many(self, arxiv_ids: List[str], top_n: int = TOP_N) -> Tuple[Dict[str, Dict], List[str]]:
+        """
+        Fetch paper data for many papers with the batch endpoint
+
+        Sends up to BATCH_SIZE IDs per POST /paper/batch call, requesting the
+        same fields as fetch_paper_data(). Citations and references are then
+        paged per paper; pass top_n=0 to skip them and keep it to one request
+        per batch.
+
+        Args:
+            arxiv_ids: arXiv IDs
+            top_n: Citations and references to include per paper
+
+        Returns:
+            (results, not_found): results maps arXiv IDs to paper data;
+            not_found lists IDs Semantic Scholar does not know. IDs in a batch
+            that failed (network error, rate limit) appear in neither.
+        """
+        results = {}
+        not_found = []
+        missing = []
+        for arxiv_id in dict.fromkeys(self._clean_id(i) for i in arxiv_ids):
+            if arxiv_id in self._papers:
+                results[arxiv_id] = self._papers[arxiv_id]
+            else:
+                missing.append(arxiv_id)
+
+        for start in range(0, len(missing), self.BATCH_SIZE):
+            batch = missing[start:start + self.BATCH_SIZE]
+            papers = self._post_batch([f"arXiv:{i}" for i in batch], self.PAPER_FIELDS)
+            if papers is None:
+                break
+            # One entry per requested ID, in order; null when not found
+            for arxiv_id, data in zip(batch, papers):
+                if data is None:
+                    not_found.append(arxiv_id)
+                    continue
+                paper_data = self._to_paper_data(data)
+                self._papers[arxiv_id] = paper_data
+                results[arxiv_id] = paper_data
+
+        if top_n > 0:
+            self._inline_small_link_lists(list(results.values()))
+
+        for arxiv_id, paper_data in results.items():
+            results[arxiv_id] = self._with_links(paper_data, top_n)
+
+        return results, not_found
+
+    def _post_batch(self, ids: List[str], fields: List[str]) -> Optional[List[Optional[Dict]]]:
+        """
+        Send one POST /paper/batch request
+
+        Args:
+            ids: Up to BATCH_SIZE paper IDs
+            fields: Fields to request
+
+        Returns:
+            One paper object (or None) per ID, or None if the request failed
+        """
+        try:
+            response = self._request(
+                "POST",
+                f"{self.BASE_URL}/paper/batch",
+                params={"fields": ",".join(fields)},
+                json={"ids": ids},
+                timeout=60
+            )
+
+            if response.status_code == 429:
+                self._report_rate_limit()
+                return None
+
+            response.raise_for_status()
+            return response.json()
+
+        except requests.RequestException as e:
+            print(f"Error fetching batch from Semantic Scholar: {e}")
+        except json.JSONDecodeError as e:
+            print(f"Error parsing JSON response: {e}")
+        return None
+
+    def _inline_small_link_lists(self, papers: List[Dict]):
+        """
+        Fetch complete citation and reference lists of rarely cited papers in batch
+
+        Papers with at most INLINE_LINK_LIMIT citations plus references get
+        their whole lists from a single batch request instead of two paged
+        requests each; popular papers are left for _with_links() to page.
+        """
+        small = [p for p in papers
+                 if "citations" not in p and p["citation_count"] + p["reference_count"] <= self.INLINE_LINK_LIMIT]
+        fields = ["paperId"] + [f"{endpoint}.{field}" for endpoint in ("citations", "references")
+                                for field in self.LINK_FIELDS]
+        for start in range(0, len(small), self.BATCH_SIZE):
+            batch = small[start:start + self.BATCH_SIZE]
+            linked = self._post_batch([p["paper_id"] for p in batch], fields)
+            if linked is None:
+                return
+            for paper_data, data in zip(batch, linked):
+                if data is None:
+                    continue
+                paper_data["citations"] = self._extract_paper_list(data.get("citations") or [], limit=None)
+                paper_data["references"] = self._extract_paper_list(data.get("references") or [], limit=None)
+
+    def iter_citations(self, paper_id: str, fields: List[str] = None,
+                       page_size: int = PAGE_SIZE) -> Iterator[Dict]:
+        """
+        Stream the papers citing a paper, one page request at a time
+
+        Args:
+            paper_id: Semantic Scholar paper ID, or "arXiv:<id>"
+            fields: Fields of each citing paper (default: LINK_FIELDS)
+            page_size: Entries per request
+
+        Yields:
+            Citing paper objects as returned by the API
+
+        Raises:
+            requests.RequestException: If a page request fails
+        """
+        yield from self._iter_links(paper_id, "citations", "citingPaper", fields, page_size)
+
+    def iter_references(self, paper_id: str, fields: List[str] = None,
+                        page_size: int = PAGE_SIZE) -> Iterator[Dict]:
+        """
+        Stream the papers a paper cites, one page request at a time
+
+        Args:
+            paper_id: Semantic Scholar paper ID, or "arXiv:<id>"
+            fields: Fields of each referenced paper (default: LINK_FIELDS)
+            page_size: Entries per request
+
+        Yields:
+            Referenced paper objects as returned by the API
+
+        Raises:
+            requests.RequestException: If a page request fails
+        """
+        yield from self._iter_links(paper_id, "references", "citedPaper", fields, page_size)
+
+    def _iter_links(self, paper_id: str, endpoint: str, key: str,
+                    fields: Optional[List[str]], page_size: int) -> Iterator[Dict]:
+        """Page through /paper/{id}/citations or /references with limit/offset"""
+        params = {"fields": ",".join(fields or self.LINK_FIELDS), "limit": page_size, "offset": 0}
+        while True:
+            response = self._request(
+                "GET",
+                f"{self.BASE_URL}/paper/{paper_id}/{endpoint}",
+                params=params,
+                timeout=30
+            )
+            response.raise_for_status()
+            page = response.json()
+            for item in page.get("data") or []:
+                if item.get(key):
+                    yield item[key]
+            if "next" not in page:
+                return
+            params["offset"] = page["next"]
+
+    def _top_links(self, paper_data: Dict, endpoint: str, count_field: str, n: int) -> List[Dict]:
+        """Fetch the first n citations or references, stopping paging once n are collected"""
+        if n <= 0 or not paper_data[count_field]:
+            return []
+        iterate = self.iter_citations if endpoint == "citations" else self.iter_references
+        links = iterate(paper_data["paper_id"], page_size=min(n, self.PAGE_SIZE))
+        return self._extract_paper_list(list(islice(links, n)), limit=n)
+
+    def _with_links(self, paper_data: Dict, top_n: int) -> Dict:
+        """
+        Return paper data with the first top_n citations and references
+
+        Lists fetched earlier are reused when they are long enough.
+        """
+        for endpoint, count_field in (("citations", "citation_count"), ("references", "reference_count")):
+            cached = paper_data.get(endpoint)
+            if cached is not None and (len(cached) >= top_n or len(cached) >= paper_data[count_field]):
+                continue
+            try:
+                paper_data[endpoint] = self._top_links(paper_data, endpoint, count_field, top_n)
+            except (requests.RequestException, json.JSONDecodeError) as e:
+                print(f"Error fetching {endpoint} from Semantic Scholar: {e}")
+                paper_data.setdefault(endpoint, [])
+
+        result = dict(paper_data)
+        result["citations"] = paper_data["citations"][:top_n]
+        result["references"] = paper_data["references"][:top_n]
+        return result
+
+    def _to_paper_data(self, data: Dict) -> Dict:
+        """
+        Extract relevant information from a Graph API paper object
+
+        Args:
+            data: Paper object returned by the API
+
+        Returns:
+            Paper data dictionary
+        """
+        return {
+            "paper_id": data.get("paperId"),
+            "title": data.get("title"),
+            "abstract": data.get("abstract"),
+            "year": data.get("year"),
+            "citation_count": data.get("citationCount") or 0,
+            "reference_count": data.get("referenceCount") or 0,
+            "influential_citation_count": data.get("influentialCitationCount") or 0,
+            "url": data.get("url"),
+            "external_ids": data.get("externalIds") or {}
+        }
+
+    def _report_rate_limit(self):
+        print(f"Rate limit exceeded after {self.MAX_RETRIES} attempts")
+        if not self.api_key:
+            print("Consider getting an API key from https://www.semanticscholar.org/product/api")
+
+    @staticmethod
+    def _clean_id(arxiv_id: str) -> str:
+        """Strip arxiv: prefixes and whitespace"""
+        return arxiv_id.replace("arxiv:", "").replace("arXiv:", "").strip()
+
     def _extract_paper_list(self, papers: List[Dict], limit: int = 10) -> List[Dict]:
         """
         Extract simplified paper information from list
@@ -139,7 +444,7 @@ class SemanticScholarFetcher:
             result.append({
                 "title": paper.get("title", "Unknown"),
                 "year": paper.get("year"),
-                "citation_count": paper.get("citationCount", 0)
+                "citation_count": paper.get("citationCount") or 0
             })
         return result
 
@@ -162,9 +467,9 @@ class SemanticScholarFetcher:
         }
 
         try:
-            response = requests.get(
+            response = self._request(
+                "GET",
                 url,
-                headers=self.headers,
                 params=params,
                 timeout=30
             )
@@ -188,9 +493,9 @@ class SemanticScholarFetcher:
         Returns:
             List of related paper dictionaries
         """
-        arxiv_id = arxiv_id.replace("arxiv:", "").replace("arXiv:", "").strip()
+        arxiv_id = self._clean_id(arxiv_id)
 
-        # First get the paper data
+        # First get the paper data (reused if already fetched)
         paper_data = self.fetch_paper_data(arxiv_id)
         if not paper_data:
             return []
@@ -213,11 +518,12 @@ class SemanticScholarFetcher:
         params = {"fields": "paperId"}
 
         try:
-            response = requests.get(
+            response = self._request(
+                "GET",
                 url,
-                headers=self.headers,
                 params=params,
-                timeout=10
+                timeout=10,
+                cache_ttl=0  # Always ask the live API
             )
 
             status = {
@@ -243,9 +549,13 @@ def main():
 
     parser = argparse.ArgumentParser(description="Fetch citation data from Semantic Scholar")
     parser.add_argument("arxiv_id", help="arXiv ID (e.g., 2401.12345)")
+    parser.add_argument("more_ids", nargs="*", metavar="arxiv_id",
+                        help="Additional arXiv IDs, fetched with the batch endpoint")
     parser.add_argument("--api-key", help="Semantic Scholar API key (optional)")
     parser.add_argument("--output", help="Output JSON file path (optional)")
     parser.add_argument("--check-status", action="store_true", help="Check API status")
+    parser.add_argument("--top-n", type=int, default=SemanticScholarFetcher.TOP_N,
+                        help="Citations and references to fetch per paper (default: 10)")
 
     args = parser.parse_args()
 
@@ -257,9 +567,31 @@ def main():
         print(json.dumps(status, indent=2))
         return
 
+    if args.more_ids:
+        arxiv_ids = [args.arxiv_id] + args.more_ids
+        print(f"Fetching data for {len(arxiv_ids)} papers...")
+        results, not_found = fetcher.fetch_many(arxiv_ids, top_n=args.top_n)
+
+        print("\n=== Papers ===")
+        for arxiv_id, paper_data in results.items():
+            print(f"{arxiv_id}: {paper_data['title']} ({paper_data['year']}) - "
+                  f"{paper_data['citation_count']} citations")
+        if not_found:
+            print(f"\nNot found in Semantic Scholar: {', '.join(not_found)}")
+
+        if args.output:
+            output_path = Path(args.output)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump({"papers": results, "not_found": not_found}, f, indent=2, ensure_ascii=False)
+            print(f"\n✓ Data saved to: {output_path}")
+        if not results:
+            sys.exit(1)
+        return
+
     # Fetch paper data
     print(f"Fetching data for arXiv:{args.arxiv_id}...")
-    paper_data = fetcher.fetch_paper_data(args.arxiv_id)
+    paper_data = fetcher.fetch_paper_data(args.arxiv_id, top_n=args.top_n)
 
     if paper_data:
         print("\n=== Paper Data ===")
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for ArxivFetcher metadata lookups through the shared CachedSession
+Counts the requests that actually reach the local arXiv stub
+"""
+
+import contextlib
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+
+from arxiv_stub import StubArxivServer, synthetic_papers  # noqa: E402
+from arxiv_fetcher import ArxivFetcher  # noqa: E402
+from http_cache import CachedSession  # noqa: E402
+
+
+@pytest.fixture
+def stub():
+    with StubArxivServer(synthetic_papers(["cs.AI"], per_category=5), latency=0) as server:
+        yield server
+
+
+def make_fetcher(stub, tmp_path, **kwargs):
+    # A long TTL for every stub URL: only the fetcher can keep lookups off the cache
+    session = CachedSession(cache_dir=tmp_path / "http", ttls={stub.base_url: 3600})
+    fetcher = ArxivFetcher(output_dir=tmp_path / "papers", session=session, **kwargs)
+    fetcher.BASE_API_URL = stub.base_url + "/api/query"
+    return fetcher
+
+
+def sent(stub, fetch):
+    """Run fetch and return (result, requests that reached the stub)"""
+    before = stub.requests
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = fetch()
+    return result, stub.requests - before
+
+
+def test_repeat_lookup_served_from_store(stub, tmp_path):
+    fetcher = make_fetcher(stub, tmp_path)
+    first, first_requests = sent(stub, lambda: fetcher.fetch_metadata("2510.00001"))
+    again, again_requests = sent(stub, lambda: fetcher.fetch_metadata("2510.00001"))
+    assert first_requests == 1
+    assert again_requests == 0
+    assert again == first
+
+
+def test_refresh_sends_request(stub, tmp_path):
+    fetcher = make_fetcher(stub, tmp_path)
+    sent(stub, lambda: fetcher.fetch_metadata("2510.00001"))
+    metadata, requests = sent(stub, lambda: fetcher.fetch_metadata("2510.00001", refresh=True))
+    assert requests == 1
+    assert metadata["title"] == "Synthetic study 1 on cs.AI"
+
+
+def test_expired_store_entry_sends_request(stub, tmp_path):
+    fetcher = make_fetcher(stub, tmp_path, metadata_ttl=0)
+    sent(stub, lambda: fetcher.fetch_metadata("2510.00001"))
+    _, requests = sent(stub, lambda: fetcher.fetch_metadata("2510.00001"))
+    assert requests == 1
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for signal author normalization and the crawler's CSV author columns
+"""
+
+import sys
+import unicodedata
+from datetime import datetime, timezone
+from pathlib import Path
+
+import arxiv
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import get_arxiv_latest_v1114 as crawler  # noqa: E402
+from author_index import AuthorIndex, normalize_name  # noqa: E402
+
+
+def test_accents_and_punctuation_are_stripped():
+    assert normalize_name("José  Álvarez-Núñez") == "jose alvarez nunez"
+    assert normalize_name("ＹＡＮＮ LeCun") == "yann lecun"
+
+
+def test_hangul_and_kana_stay_whole():
+    assert normalize_name("김 민수") == "김민수"
+    assert normalize_name(unicodedata.normalize("NFD", "김민수")) == "김민수"
+    assert normalize_name("が くせい") == "がくせい"
+
+
+def test_korean_signal_author_matches():
+    index = AuthorIndex.from_names(["김민수", "Yann LeCun"])
+    assert index.match(["김 민수", "Y. LeCun"]) == ["김민수", "Yann LeCun"]
+
+
+def test_csv_author_columns_are_title_cased():
+    result = arxiv.Result(
+        entry_id="http://arxiv.org/abs/2510.00001v1", title="A study",
+        authors=[arxiv.Result.Author("yann lecun"), arxiv.Result.Author("JANE DOE")],
+        summary="Abstract", published=datetime(2025, 10, 1, tzinfo=timezone.utc),
+        primary_category="cs.LG", categories=["cs.LG"])
+    authors = [a.name for a in result.authors]
+    matched = AuthorIndex.from_names(["Yann LeCun"]).match(authors)
+    paper = crawler.build_paper_data(result, "2510.00001v1", authors, matched)
+    assert paper["authors"] == "Yann Lecun, Jane Doe"
+    assert paper["matched_authors"] == "Yann Lecun"
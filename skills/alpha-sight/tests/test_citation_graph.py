@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for CitationGraphCrawler's node budget
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from citation_graph import CitationGraphCrawler, GraphStore  # noqa: E402
+
+
+def node(paper_id, influential):
+    return {"paperId": paper_id, "title": paper_id, "influentialCitationCount": influential}
+
+
+def test_neighbor_on_both_sides_uses_one_slot(tmp_path):
+    store = GraphStore(tmp_path / "graph.db")
+    store.add_nodes([node("seed", 0)], depth=0)
+    crawler = CitationGraphCrawler(fetcher=None, store=store, max_nodes=4)
+
+    # "both" cites the seed and is cited by it; it must not take two of the three free slots
+    citing = [node("both", 9), node("a", 5)]
+    cited = [node("both", 9), node("b", 3), node("c", 1)]
+    crawler._apply("seed", 0, citing, cited)
+
+    assert store.node_count() == 4
+    assert {n["paper_id"] for n in store.export()["nodes"]} == {"seed", "both", "a", "b"}
+    assert sorted(store.export()["edges"]) == [["a", "seed"], ["both", "seed"], ["seed", "b"], ["seed", "both"]]
+    store.close()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for CrawlState resume after an interrupted crawl
+Every paper the checkpoint marks as processed must be recoverable from the spool
+"""
+
+import json
+import sys
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import get_arxiv_latest_v1114 as crawler  # noqa: E402
+
+
+def paper(paper_id):
+    return {"id": paper_id, "title": f"Paper {paper_id}", "published_date": "2025-10-01"}
+
+
+def test_checkpoint_never_lists_unspooled_matches(tmp_path, monkeypatch):
+    spool, checkpoint = tmp_path / "spool.jsonl", tmp_path / "checkpoint.json"
+    state = crawler.CrawlState(str(spool), str(checkpoint))
+    synced = []
+    monkeypatch.setattr(crawler.os, "fsync", lambda fd: synced.append(spool.read_text(encoding="utf-8")))
+
+    assert state.claim("2510.00001", date(2025, 10, 1), "cs.AI", paper("2510.00001"))
+    assert state.claim("2510.00002", date(2025, 10, 1), "cs.AI")
+    assert not state.claim("2510.00001", date(2025, 10, 1), "cs.LG", paper("2510.00001"))
+    state.record_progress("cs.AI", 2, "2510.00001v1", "2025-10-01T00:00:00+00:00")
+
+    # The spool was synced with the match before the checkpoint listing it was written
+    assert len(synced) == 1 and '"2510.00001"' in synced[0]
+    assert set(json.loads(checkpoint.read_text(encoding="utf-8"))["processed_papers"]) == {
+        "2510.00001", "2510.00002"}
+
+    # Resume without close(), as after a crash
+    resumed = crawler.CrawlState(str(spool), str(checkpoint))
+    assert resumed.resumed_papers == 1
+    assert resumed.progress_for("cs.AI")["offset"] == 2
+    assert not resumed.claim("2510.00001", date(2025, 10, 1), "cs.AI", paper("2510.00001"))
+    resumed.close()
+    state.close()
+    assert [json.loads(line)["id"] for line in spool.read_text(encoding="utf-8").splitlines()] == ["2510.00001"]
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the batch probe's call signature
+"""
+
+import contextlib
+import io
+import sys
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import get_arxiv_latest_v1114 as crawler  # noqa: E402
+
+
+class FakeProbe:
+    category = "cs.AI"
+    requests = 0
+
+    def latest_date(self, start_date):
+        self.requests += 1
+        return "2025-10-01"
+
+
+def test_old_start_end_call_still_works(monkeypatch):
+    probe = FakeProbe()
+    monkeypatch.setattr(crawler, "create_probe", lambda: probe)
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert crawler.probe_api_batch_top_dates(date(2025, 9, 30), date(2025, 10, 1)) == ["2025-10-01"]
+    assert probe.requests == 1
+
+
+def test_probe_is_passed_by_keyword():
+    probe = FakeProbe()
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert crawler.probe_api_batch_top_dates(date(2025, 9, 30), probe=probe) == ["2025-10-01"]
+    assert probe.requests == 1
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for streamed responses through CachedSession
+A streamed miss is read as it arrives and stored once read to the end
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+
+from arxiv_stub import StubArxivServer, synthetic_papers  # noqa: E402
+from atom_parser import iter_entries  # noqa: E402
+from http_cache import DEFAULT_CACHE_DIR, CachedSession  # noqa: E402
+
+PARAMS = {"search_query": "cat:cs.AI", "max_results": 400}
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+
+@pytest.fixture
+def stub():
+    with StubArxivServer(synthetic_papers(["cs.AI"], per_category=400), latency=0) as server:
+        yield server
+
+
+@pytest.fixture
+def session(stub, tmp_path):
+    return CachedSession(cache_dir=tmp_path / "http", ttls={stub.base_url: 3600})
+
+
+def stored(tmp_path, suffix):
+    return list((tmp_path / "http").rglob(f"*{suffix}"))
+
+
+def test_streamed_miss_is_read_before_it_is_stored(stub, session, tmp_path):
+    with session.get(stub.base_url + "/api/query", params=PARAMS, stream=True) as response:
+        first = response.raw.read(1024)
+        spooled = stored(tmp_path, ".tmp")
+        assert stored(tmp_path, ".body") == []
+        assert len(spooled) == 1 and spooled[0].stat().st_size < stub.bytes_sent
+        body = first + response.raw.read()
+    assert len(body) == stub.bytes_sent
+    assert stored(tmp_path, ".tmp") == []
+
+    with session.get(stub.base_url + "/api/query", params=PARAMS, stream=True) as again:
+        assert sum(1 for _ in iter_entries(again.raw)) == 400
+    assert stub.requests == 1
+    assert session.stats()["hits"] == 1
+
+
+def test_stream_closed_early_is_not_stored(stub, session, tmp_path):
+    with session.get(stub.base_url + "/api/query", params=PARAMS, stream=True) as response:
+        response.raw.read(1024)
+    assert stored(tmp_path, ".body") == [] and stored(tmp_path, ".tmp") == []
+
+    session.get(stub.base_url + "/api/query", params=PARAMS, stream=True).close()
+    assert stub.requests == 2
+
+
+def test_unstreamed_miss_is_stored(stub, session, tmp_path):
+    content = session.get(stub.base_url + "/api/query", params=PARAMS).content
+    assert len(content) == stub.bytes_sent
+    assert session.get(stub.base_url + "/api/query", params=PARAMS).content == content
+    assert stub.requests == 1
+
+
+def test_default_cache_dir_is_under_project_root():
+    # Next to index.json and metadata.db, as documented in SKILL.md
+    assert DEFAULT_CACHE_DIR == PROJECT_ROOT / "alpha-sight" / "http_cache"
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for IndexManager queries over existing index data
+Entries with a null relevance_score or analyzed_date must keep working
+"""
+
+import contextlib
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from index_manager import IndexManager  # noqa: E402
+
+
+def paper(arxiv_id, analyzed_date, relevance_score, tags):
+    return {
+        "arxiv_id": arxiv_id,
+        "title": f"Paper {arxiv_id}",
+        "analyzed_date": analyzed_date,
+        "categories": ["cs.LG"],
+        "analysis": {"relevance_score": relevance_score},
+        "reproduction": {"status": "not_started"},
+        "tags": tags,
+    }
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = IndexManager(tmp_path / "index.json")
+    with contextlib.redirect_stdout(io.StringIO()):
+        manager.add_paper(paper("1", "2024-03-01T10:00:00", None, ["MoE"]))
+        manager.add_paper(paper("2", None, 0.8, ["MoE"]))
+        manager.add_paper(paper("3", "2024-04-01T10:00:00", 0.5, []))
+    return manager
+
+
+def ids(papers):
+    return [p["arxiv_id"] for p in papers]
+
+
+def test_search_by_tag_keeps_index_order(manager):
+    assert ids(manager.search_by_tag("MoE")) == ["1", "2"]
+
+
+def test_sorted_listings_with_null_keys(manager):
+    assert ids(manager.list_papers(sort_by="date")) == ["3", "1", "2"]
+    assert ids(manager.list_papers(sort_by="relevance")) == ["2", "3", "1"]
+    assert ids(manager.query(date_from="2024-03", date_to="2024-03")) == ["1"]
+
+
+def test_add_after_views_built(manager):
+    manager.list_papers(sort_by="date")
+    manager.list_papers(sort_by="relevance")
+    with contextlib.redirect_stdout(io.StringIO()):
+        manager.add_paper(paper("4", None, None, ["MoE"]))
+    assert ids(manager.list_papers(sort_by="relevance")) == ["2", "3", "1", "4"]
+    assert ids(manager.search_by_tag("MoE")) == ["1", "2", "4"]
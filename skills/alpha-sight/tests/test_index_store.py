@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for migrating existing index.json data into the SQLite index store
+"""
+
+import contextlib
+import io
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from index_manager import IndexManager  # noqa: E402
+from index_store import SQLiteIndexManager  # noqa: E402
+
+
+def test_migrate_entries_with_null_fields(tmp_path):
+    manager = IndexManager(tmp_path / "index.json")
+    with contextlib.redirect_stdout(io.StringIO()):
+        manager.add_paper({"arxiv_id": "1", "analyzed_date": None, "categories": ["cs.LG"],
+                           "analysis": {"relevance_score": None}, "reproduction": {"status": None},
+                           "tags": None})
+        manager.add_paper({"arxiv_id": "2", "analyzed_date": "2024-03-01T10:00:00", "categories": ["cs.LG"],
+                           "analysis": None, "reproduction": {"status": "completed"}, "tags": ["MoE"]})
+
+    store = SQLiteIndexManager(tmp_path / "index.db")
+    assert store.migrate_from_json(tmp_path / "index.json") == 2
+    assert store.get_paper("1") == manager.get_paper("1")
+    assert [p["arxiv_id"] for p in store.list_papers(sort_by="date")] == ["2", "1"]
+    assert store.get_statistics()["by_status"] == manager.get_statistics()["by_status"]
+    store.close()
+
+
+def test_verify_statistics_detects_and_repairs_drift(tmp_path):
+    store = SQLiteIndexManager(tmp_path / "index.db")
+    with contextlib.redirect_stdout(io.StringIO()):
+        store.add_paper({"arxiv_id": "1", "categories": ["cs.LG", "cs.AI"], "reproduction": {"status": "completed"}})
+        store.add_paper({"arxiv_id": "2", "categories": None, "reproduction": {"status": None}})
+    assert store.verify_statistics()
+
+    # Indexed columns out of step with the stored entry, e.g. after an interrupted manual edit
+    store._conn.execute("UPDATE papers SET status = 'failed' WHERE arxiv_id = '1'")
+    store._conn.execute("DELETE FROM paper_categories WHERE category = 'cs.AI'")
+    store._conn.commit()
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert not store.verify_statistics(repair=False)
+        assert not store.verify_statistics()
+    assert store.verify_statistics()
+    assert store.get_statistics() == {"total_papers": 2,
+                                      "by_status": {"analyzed_only": 1, "reproduced": 1, "failed": 0},
+                                      "by_category": {"cs.LG": 1, "cs.AI": 1}}
+    store.close()
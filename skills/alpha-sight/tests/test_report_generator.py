@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for ReportManifest shared between processes
+A compaction by one writer must be noticed by the others, whatever its size
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from report_generator import ReportManifest  # noqa: E402
+
+
+def entry(n):
+    return {"inputs": f"digest-{n}", "version": "1"}
+
+
+def test_compaction_larger_than_read_offset_is_reloaded(tmp_path):
+    writer = ReportManifest(tmp_path)
+    writer.record(tmp_path / "a.md", entry(0))
+    writer.save()
+    reader = ReportManifest(tmp_path)
+    assert reader.entries == {"a.md": entry(0)}
+
+    # Repeated saves of one report go stale until the writer compacts the log,
+    # which then holds more entries (and bytes) than the reader has read
+    for n in range(1, 120):
+        writer.record(tmp_path / "a.md", entry(n))
+        for name in ("b.md", "c.md", "d.md"):
+            writer.record(tmp_path / name, entry(n))
+        writer.save()
+        if n == 40:
+            log = reader.path.read_bytes()
+            assert len(log) > reader._offset
+            break
+
+    reader.refresh()
+    assert reader.entries == writer.entries
+    assert reader.entries["a.md"] == entry(40)
+
+
+def test_unsaved_entries_survive_reload(tmp_path):
+    writer = ReportManifest(tmp_path)
+    writer.record(tmp_path / "a.md", entry(0))
+    writer.save()
+    reader = ReportManifest(tmp_path)
+    reader.record(tmp_path / "b.md", entry(1))
+    for n in range(1, 200):
+        writer.record(tmp_path / "a.md", entry(n))
+        writer.save()
+    reader.save()
+    assert ReportManifest(tmp_path).entries == {"a.md": entry(199), "b.md": entry(1)}
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for SemanticScholarFetcher against the local S2 stub
+Records with null counts must parse like records without citations
+"""
+
+import contextlib
+import io
+import sys
+from pathlib import Path
+
+import pytest
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+
+from s2_stub import StubS2Server, synthetic_graph  # noqa: E402
+from semantic_scholar_fetcher import SemanticScholarFetcher  # noqa: E402
+
+ARXIV_ID = "2510.00150"
+
+
+@pytest.fixture
+def stub():
+    graph = synthetic_graph(size=200)
+    paper = next(p for p in graph.values() if p["externalIds"]["ArXiv"] == ARXIV_ID)
+    paper["citationCount"] = None
+    paper["referenceCount"] = None
+    paper["influentialCitationCount"] = None
+    with StubS2Server(graph, latency=0) as server:
+        yield server
+
+
+def make_fetcher(stub):
+    fetcher = SemanticScholarFetcher(session=requests.Session())
+    fetcher.BASE_URL = stub.base_url
+    return fetcher
+
+
+@pytest.mark.parametrize("fetch", [
+    lambda fetcher: fetcher.fetch_paper_data(ARXIV_ID, top_n=5),
+    lambda fetcher: fetcher.fetch_many([ARXIV_ID, "2510.00010"], top_n=5)[0][ARXIV_ID],
+])
+def test_null_counts_read_as_zero(stub, fetch):
+    with contextlib.redirect_stdout(io.StringIO()):
+        paper = fetch(make_fetcher(stub))
+    assert paper["citation_count"] == 0
+    assert paper["reference_count"] == 0
+    assert paper["influential_citation_count"] == 0
+    assert isinstance(paper["citations"], list) and isinstance(paper["references"], list)